@@ -10,7 +10,7 @@ def render_weapon_comparison(session, provider):
     st.markdown("### ⚖️ Weapon Comparison")
 
     # Extract weapon performance from recent fights
-    fights = session.combat_log[-3:]  # Last 3 fights for comparison
+    fights = list(session.combat_log)[-3:]  # Last 3 fights for comparison
     weapon_stats = []
 
     for fight in fights:
@@ -1,5 +1,6 @@
 import streamlit as st
 import time
+from dataclasses import fields
 from dashboard.utils import (
     get_game_session,
     get_game_data_provider,
@@ -78,6 +79,11 @@ def main():
 
 # --- VIEWS ---
 
+def item_card_data(item):
+    """Shallow field dict for render_item_card (Item is slotted, no __dict__)."""
+    return {f.name: getattr(item, f.name) for f in fields(item)}
+
+
 def render_combat_log(session, provider):
     """Render detailed combat log for weapon mechanics visibility.
 
@@ -526,7 +532,7 @@ def render_preparation(session, provider):
                             item = items[i+j]
                             with cols[j]:
                                 # Render visual card
-                                render_item_card(item.__dict__, provider)
+                                render_item_card(item_card_data(item), provider)
 
                                 # Action Button
                                 if st.button("Equip", key=f"equip_{item.instance_id}", use_container_width=True):
@@ -634,9 +640,10 @@ def render_victory(session):
         st.markdown("---")
         st.subheader("🎯 Weapon Performance Analysis")
 
+        *previous_fights, current_fight = session.combat_log
         insights = analyze_weapon_performance(
-            session.combat_log[-1],  # Current fight
-            session.combat_log[:-1]  # Previous fights
+            current_fight,  # Current fight
+            previous_fights  # Previous fights
         )
 
         if insights:
@@ -665,7 +672,7 @@ def render_victory(session):
         for idx, item in enumerate(session.loot_stash):
             col = cols[idx % 3]
             with col:
-                render_item_card(item.__dict__, provider)
+                render_item_card(item_card_data(item), provider)
                 if st.button("Take", key=f"take_{idx}_{item.instance_id}"):
                     if session.claim_loot(idx):
                         st.toast(f"Picked up {item.name}")
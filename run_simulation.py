@@ -7,6 +7,7 @@ and generates detailed reports for balance analysis.
 
 import json
 import logging
+from dataclasses import replace
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -17,7 +18,7 @@ from src.core.state import StateManager
 from src.core.events import EventBus
 from src.core.rng import RNG
 from src.combat import CombatEngine
-from src.handlers.effect_handlers import BleedHandler, PoisonHandler
+from src.handlers.effect_handlers import BLEED_CONFIG, POISON_CONFIG, create_dot_handler
 from src.simulation.combat_simulation import SimulationRunner, ReportGenerator
 from src.utils.item_generator import ItemGenerator
 from src.data.game_data_provider import GameDataProvider
@@ -62,9 +63,11 @@ def setup_simulation(rng: RNG):
     event_bus = EventBus()
     combat_engine = CombatEngine(rng=rng)
 
-    # Set up effect handlers
-    bleed_handler = BleedHandler(event_bus, state_manager, proc_rate=0.4, rng=rng)
-    poison_handler = PoisonHandler(event_bus, state_manager, proc_rate=0.25, rng=rng)
+    # Set up effect handlers: Bleed and Poison share one OnHitEvent subscription
+    dot_handler = create_dot_handler(
+        event_bus, state_manager, rng,
+        configs=(replace(BLEED_CONFIG, proc_rate=0.4), replace(POISON_CONFIG, proc_rate=0.25)),
+    )
 
     # Initialize data provider (for Phase B2 EntityFactory)
     provider = GameDataProvider()
@@ -1,12 +1,13 @@
 """Combat-related modules including combat math, engine, and orchestrator."""
 
 from src.combat.engine import CombatEngine
-from src.combat.hit_context import HitContext
+from src.combat.hit_context import HitContext, BatchedHitContext
 from src.combat.combat_math import *
 from src.combat.orchestrator import CombatOrchestrator
 
 __all__ = [
     "CombatEngine",
     "HitContext",
+    "BatchedHitContext",
     "CombatOrchestrator",
 ]
@@ -12,6 +12,8 @@ All randomness must be provided by the caller.
 
 from typing import Tuple
 
+import numpy as np
+
 
 def roll_chance(rng, chance: float) -> bool:
     """Return True if proc occurs. Assumes rng is Random or similar."""
@@ -83,7 +85,167 @@ def calculate_pierce_damage_formula(
     Current GDD: max(0, max(pre_pierce_damage, pierced_damage))
     This means damage ignores pierce if normal armor reduction gives higher damage.
     """
-    return max(0.0, max(pre_pierce_damage, pierced_damage))
+    damage = pre_pierce_damage if pre_pierce_damage > pierced_damage else pierced_damage
+    return damage if damage > 0.0 else 0.0
+
+
+def mitigate_hit_damage(
+    base_damage: float,
+    base_resolved: float,
+    armor: float,
+    pierce_ratio: float,
+    crit_damage: float,
+    crit_tier: int,
+    is_crit: bool
+) -> Tuple[float, float, float]:
+    """Run the crit-tier and armor/pierce steps of hit resolution on plain numbers.
+
+    Tier 2 crits multiply pre-mitigation damage; Tier 3 crits mitigate the
+    crit-boosted resolved base. When the resolved base equals the raw base
+    (any whole-number damage) both are the same value, so the mitigation
+    is computed once and reused.
+
+    Returns:
+        (damage_pre_mitigation, damage_post_armor, final_damage), before
+        glancing and block adjustments.
+    """
+    if not is_crit:
+        # Common case laid out first: no tier adjustments, one mitigation pass
+        pre_pierce = base_damage - armor
+        pierced = base_damage * pierce_ratio
+        post_armor = pre_pierce if pre_pierce > pierced else pierced
+        if post_armor < 0.0:
+            post_armor = 0.0
+        return base_damage, post_armor, post_armor
+
+    pre_mitigation = base_damage
+    if crit_tier >= 2:
+        pre_mitigation *= crit_damage
+
+    pre_pierce = pre_mitigation - armor
+    pierced = pre_mitigation * pierce_ratio
+    post_armor = pre_pierce if pre_pierce > pierced else pierced
+    if post_armor < 0.0:
+        post_armor = 0.0
+
+    final_damage = post_armor
+    if crit_tier == 3 and base_resolved != base_damage:
+        crit_pre_mitigation = base_resolved * crit_damage
+        pre_pierce = crit_pre_mitigation - armor
+        pierced = crit_pre_mitigation * pierce_ratio
+        final_damage = pre_pierce if pre_pierce > pierced else pierced
+        if final_damage < 0.0:
+            final_damage = 0.0
+
+    return pre_mitigation, post_armor, final_damage
+
+
+def resolve_hit_damage(
+    base_damage: float,
+    base_resolved: float,
+    armor: float,
+    pierce_ratio: float,
+    crit_damage: float,
+    crit_tier: int,
+    is_crit: bool,
+    is_glancing: bool,
+    is_blocked: bool,
+    block_amount: float
+) -> Tuple[float, float, float, float]:
+    """Run every arithmetic step of hit resolution once the rolls are known.
+
+    Chains mitigate_hit_damage with the glancing penalty, block reduction and
+    final clamp, so a hit's damage is one call on plain numbers with no
+    attribute lookups.
+
+    Returns:
+        (damage_pre_mitigation, damage_post_armor, final_damage, damage_blocked)
+    """
+    if not (is_crit or is_glancing or is_blocked):
+        # Plain hit, the common case: armor/pierce max inlined, no nested calls
+        pre_pierce = base_damage - armor
+        pierced = base_damage * pierce_ratio
+        post_armor = pre_pierce if pre_pierce > pierced else pierced
+        if post_armor < 0.0:
+            post_armor = 0.0
+        return base_damage, post_armor, post_armor, 0.0
+
+    pre_mitigation, post_armor, final_damage = mitigate_hit_damage(
+        base_damage, base_resolved, armor, pierce_ratio, crit_damage, crit_tier, is_crit
+    )
+
+    if is_glancing:
+        final_damage = apply_glancing_damage(final_damage, 0.5)  # 50% reduction
+
+    damage_blocked = 0.0
+    if is_blocked:
+        damage_blocked = min(final_damage, block_amount)
+        final_damage = apply_block_damage(final_damage, block_amount)
+
+    # Rarely needed, so skipped for positive damage
+    if final_damage <= 0.0:
+        final_damage = clamp_min_damage(final_damage, 0.0)
+
+    return pre_mitigation, post_armor, final_damage, damage_blocked
+
+
+def mitigate_hit_damage_batch(
+    base_damage: float,
+    base_resolved: float,
+    armor: float,
+    pierce_ratio: float,
+    crit_damage: float,
+    crit_tier: int,
+    is_crit
+):
+    """Array form of mitigate_hit_damage for many hits sharing one attacker/defender.
+
+    The scalar arguments are as for mitigate_hit_damage and apply to every
+    hit; is_crit is a NumPy bool array with one entry per hit.
+
+    Returns:
+        (damage_pre_mitigation, damage_post_armor, final_damage) float arrays,
+        before glancing and block adjustments.
+    """
+    if crit_tier >= 2:
+        pre_mitigation = np.where(is_crit, base_damage * crit_damage, base_damage)
+    else:
+        pre_mitigation = np.full(is_crit.shape, base_damage, dtype=np.float64)
+
+    # Two in-place maximum ufuncs (vectorised MAXPD) instead of per-hit branches
+    post_armor = pre_mitigation - armor
+    np.maximum(post_armor, pre_mitigation * pierce_ratio, out=post_armor)
+    np.maximum(post_armor, 0.0, out=post_armor)
+
+    final_damage = post_armor
+    if crit_tier == 3 and base_resolved != base_damage:
+        crit_pre_mitigation = base_resolved * crit_damage
+        crit_final = max(0.0, crit_pre_mitigation - armor, crit_pre_mitigation * pierce_ratio)
+        final_damage = np.where(is_crit, crit_final, post_armor)
+
+    return pre_mitigation, post_armor, final_damage
+
+
+# Fixed-point scale for compact damage storage: 1/256 of a damage point,
+# which keeps int32 exact up to ~8.3 million damage per hit
+DAMAGE_FIXED_POINT_SCALE = 256
+
+
+def quantize_damage(damage):
+    """Convert a float damage array to int32 fixed-point.
+
+    Args:
+        damage: NumPy array of damage values
+
+    Returns:
+        int32 array of damage * DAMAGE_FIXED_POINT_SCALE, rounded to nearest
+    """
+    return np.rint(np.asarray(damage) * DAMAGE_FIXED_POINT_SCALE).astype(np.int32)
+
+
+def dequantize_damage(fixed):
+    """Convert an int32 fixed-point damage array back to float32."""
+    return np.asarray(fixed, dtype=np.float32) / np.float32(DAMAGE_FIXED_POINT_SCALE)
 
 
 def clamp_min_damage(damage: float, min_value: float = 0.0) -> float:
@@ -1,12 +1,14 @@
 """Core combat engine - damage calculation and hit resolution."""
 
-from typing import Optional, List, Dict, Any
-from src.core.models import Entity, SkillUseResult, ApplyDamageAction, DispatchEventAction, ApplyEffectAction, Action
+from operator import attrgetter
+from typing import Optional, List, Dict, Any, Sequence
+import numpy as np
+from src.core.models import Entity, DamageBreakdown, SkillUseResult, ApplyDamageAction, DispatchEventAction, ApplyEffectAction, Action
 from src.core.skills import Skill
 from src.core.events import EventBus, OnHitEvent, OnCritEvent, OnDodgeEvent, OnGlancingBlowEvent, OnBlockEvent, OnSkillUsedEvent
 from src.core.state import StateManager, Modifier
 from src.core.rng import RNG
-from .hit_context import HitContext
+from .hit_context import HitContext, BatchedHitContext
 from src.combat.combat_math import (
     evade_dodge_or_normal,
     resolve_crit,
@@ -15,9 +17,55 @@ from src.combat.combat_math import (
     calculate_skill_effect_proc,
     apply_glancing_damage,
     apply_block_damage,
-    clamp_min_damage
+    clamp_min_damage,
+    mitigate_hit_damage,
+    mitigate_hit_damage_batch,
+    resolve_hit_damage
 )
 
+# Stat fields read by every hit, fetched in one C-level call per entity
+_ATTACKER_HIT_FIELDS = attrgetter('base_damage', 'pierce_ratio', 'crit_damage')
+_DEFENDER_HIT_FIELDS = attrgetter('armor', 'block_amount')
+_ATTACKER_PIERCE_FIELDS = attrgetter('base_damage', 'pierce_ratio')
+_ATTACKER_RESOURCE_FIELDS = attrgetter('resource_on_hit', 'resource_on_kill')
+# Trigger fields read while building plans, and the per-hit outcome flags
+_TRIGGER_FIELDS = attrgetter('event', 'check', 'result')
+_HIT_OUTCOME_FIELDS = attrgetter('was_dodged', 'was_glancing', 'was_blocked', 'was_crit')
+
+# Skills with at least this many hits resolve them with one vectorized pass.
+# That pass draws from RNG.random_array (the RNG's separate NumPy PCG64
+# stream) instead of RNG.random(), so for the same seed a skill with
+# BATCH_HIT_THRESHOLD hits rolls differently from one with a hit fewer, and
+# replays of such skills recorded before the batched path no longer match.
+BATCH_HIT_THRESHOLD = 8
+
+
+def _skill_trigger_plan(skill: Skill):
+    """Return the OnHit trigger data for a skill.
+
+    Callers build the plan once per skill use and reuse it for every hit,
+    the same way _active_trigger_plans handles affix triggers. Nothing is
+    cached on the skill, so trigger edits between uses are always seen.
+
+    Args:
+        skill: The skill whose triggers are being planned
+
+    Returns:
+        Tuple of (on_hit, debuffs) where on_hit holds (result, proc_rate,
+        handlers) for every OnHit trigger and debuffs holds (effect_name,
+        stacks) pairs for the OnHit triggers that apply a debuff.
+    """
+    result_handlers = CombatEngine._result_handlers
+    on_hit = tuple(
+        (result, check.get("proc_rate", 1.0), result_handlers(result))
+        for event, check, result in map(_TRIGGER_FIELDS, skill.triggers) if event == "OnHit"
+    )
+    debuffs = tuple(
+        (result["apply_debuff"], result.get("stacks", 1))
+        for result, _, _ in on_hit if "apply_debuff" in result
+    )
+    return on_hit, debuffs
+
 
 class CombatEngine:
     """Static class containing core combat calculation methods.
@@ -38,6 +86,8 @@ class CombatEngine:
         """
         assert rng is not None, "RNG must be injected into CombatEngine - no global randomness allowed"
         self.rng = rng
+        # Bound once; RNG.random is already the generator's C method
+        self._random = rng.random
 
     def _get_modified_chance(self, entity: Entity, state_manager: StateManager, base_chance: float, roll_type: str) -> float:
         """Calculate the final chance after applying bonus/penalty modifiers.
@@ -52,12 +102,11 @@ class CombatEngine:
             Final modified chance, clamped to 0-1
         """
         state = state_manager.get_state(entity.id)
-        if not state or not state.roll_modifiers.get(roll_type):
+        if not state:
+            return base_chance
+        total_modifier = state.roll_modifier_sums.get(roll_type)
+        if total_modifier is None:
             return base_chance
-
-        total_modifier = 0.0
-        for mod in state.roll_modifiers[roll_type]:
-            total_modifier += mod.value
 
         final_chance = base_chance + total_modifier
         return max(0.0, min(1.0, final_chance))  # Clamp to 0-1
@@ -74,14 +123,16 @@ class CombatEngine:
         """
         # Roll against modified evasion chance
         evasion_chance = self._get_modified_chance(defender, state_manager, defender.final_stats.evasion_chance, 'evasion_chance')
-        rng_value = self.rng.random()
+        if evasion_chance <= 0.0:
+            return False, False  # Cannot evade, so no roll is spent
+        rng_value = self._random()
 
         if rng_value >= evasion_chance:
             return False, False  # Normal hit
 
         # If evaded, roll for dodge vs glance
         dodge_chance = self._get_modified_chance(defender, state_manager, defender.final_stats.dodge_chance, 'dodge_chance')
-        rng_value = self.rng.random()
+        rng_value = self._random()
 
         # Actual dodge chance is the modified dodge chance
         # If dodge roll < modified dodge chance, it's a full dodge
@@ -101,20 +152,40 @@ class CombatEngine:
             True if the attack was blocked
         """
         block_chance = self._get_modified_chance(defender, state_manager, defender.final_stats.block_chance, 'block_chance')
-        rng_value = self.rng.random()
+        if block_chance <= 0.0:
+            return False  # Cannot block, so no roll is spent
+        rng_value = self._random()
         return rng_value < block_chance
 
-    def resolve_hit(self, attacker: Entity, defender: Entity, state_manager: "StateManager") -> "HitContext":
+    def resolve_hit(self, attacker: Entity, defender: Entity, state_manager: "StateManager",
+                    crit_tier: Optional[int] = None) -> "HitContext":
         """Calculate the damage of a single hit following the 9-step GDD pipeline.
 
         Args:
             attacker: The entity performing the attack
             defender: The entity receiving the attack
             state_manager: StateManager for accessing entity modifiers
+            crit_tier: Attacker's crit tier if already known; looked up when None
 
         Returns:
             HitContext with complete damage calculation results and outcome flags
         """
+        # Step 1: Gather modified stats from StateManager
+        chances = self._gather_hit_chances(attacker, defender, state_manager)
+        return self._resolve_hit_with_chances(attacker, defender, chances, crit_tier)
+
+    def _gather_hit_chances(self, attacker: Entity, defender: Entity,
+                            state_manager: StateManager) -> tuple[float, float, float, float]:
+        """Look up the modifier-adjusted roll chances used by hit resolution.
+
+        Args:
+            attacker: The entity performing the attack
+            defender: The entity receiving the attack
+            state_manager: StateManager for accessing entity modifiers
+
+        Returns:
+            Tuple of (evasion, dodge, crit, block) chances
+        """
         if state_manager is None:
             raise ValueError(
                 "CombatEngine.resolve_hit() requires state_manager parameter. "
@@ -122,21 +193,47 @@ class CombatEngine:
                 "Example: engine.resolve_hit(attacker, defender, state_manager)"
             )
 
-        # Step 1: Gather modified stats from StateManager
-        defender_evasion_chance = self._get_modified_chance(defender, state_manager, defender.final_stats.evasion_chance, 'evasion_chance')
-        defender_dodge_chance = self._get_modified_chance(defender, state_manager, defender.final_stats.dodge_chance, 'dodge_chance')
-        attacker_crit_chance = self._get_modified_chance(attacker, state_manager, attacker.final_stats.crit_chance, 'crit_chance')
-        defender_block_chance = self._get_modified_chance(defender, state_manager, defender.final_stats.block_chance, 'block_chance')
+        defender_stats = defender.final_stats
+        return (
+            self._get_modified_chance(defender, state_manager, defender_stats.evasion_chance, 'evasion_chance'),
+            self._get_modified_chance(defender, state_manager, defender_stats.dodge_chance, 'dodge_chance'),
+            self._get_modified_chance(attacker, state_manager, attacker.final_stats.crit_chance, 'crit_chance'),
+            self._get_modified_chance(defender, state_manager, defender_stats.block_chance, 'block_chance'),
+        )
+
+    def _resolve_hit_with_chances(self, attacker: Entity, defender: Entity,
+                                  chances: tuple[float, float, float, float],
+                                  crit_tier: Optional[int] = None,
+                                  reuse: Optional[HitContext] = None) -> HitContext:
+        """Run the hit pipeline (steps 2-10) with pre-gathered roll chances.
+
+        Args:
+            attacker: The entity performing the attack
+            defender: The entity receiving the attack
+            chances: (evasion, dodge, crit, block) from _gather_hit_chances
+            crit_tier: Attacker's crit tier if already known; looked up when None
+            reuse: A context no longer referenced elsewhere, reset and returned
+                instead of allocating a new one
+
+        Returns:
+            HitContext with complete damage calculation results and outcome flags
+        """
+        defender_evasion_chance, defender_dodge_chance, attacker_crit_chance, defender_block_chance = chances
+
+        base_damage_input, pierce_ratio, crit_damage = _ATTACKER_HIT_FIELDS(attacker.final_stats)
+        defender_armor, block_amount = _DEFENDER_HIT_FIELDS(defender.final_stats)
 
         # Step 2: Initial Setup
-        base_damage_input = attacker.final_stats.base_damage
-        ctx = HitContext(
-            attacker=attacker,
-            defender=defender,
-            base_raw=base_damage_input,
-            base_resolved=int(base_damage_input),
-            final_damage=base_damage_input
-        )
+        if reuse is not None:
+            ctx = reuse.reset(attacker, defender, base_damage_input, int(base_damage_input), base_damage_input)
+        else:
+            ctx = HitContext(
+                attacker=attacker,
+                defender=defender,
+                base_raw=base_damage_input,
+                base_resolved=int(base_damage_input),
+                final_damage=base_damage_input
+            )
 
         # Step 3: Evasion Check - Call pure math function with pre-computed modifiers
         evasion_result = evade_dodge_or_normal(self.rng, defender_dodge_chance, defender_evasion_chance)
@@ -149,7 +246,8 @@ class CombatEngine:
 
         # Step 4: Critical Hit Check - Use tiered crit system with base chance gate
         # First check if we can attempt a crit based on base crit_chance
-        base_crit_roll = self.rng.roll(attacker_crit_chance)
+        # A zero crit chance can never succeed, so it spends no roll
+        base_crit_roll = attacker_crit_chance > 0.0 and self.rng.roll(attacker_crit_chance)
         if base_crit_roll:
             # Crit attempt successful - now determine tier
             crit_tier_probs = attacker.get_crit_tier_probabilities()
@@ -172,49 +270,32 @@ class CombatEngine:
         # Glancing hits cannot crit
         ctx.was_crit = ctx.was_crit and not ctx.was_glancing
 
-        # Step 5: Pre-Mitigation Damage Calculation
-        ctx.damage_pre_mitigation = base_damage_input
-
-        # Apply Tier 2 crits (Enhanced) - affects pre-mitigation
-        if ctx.was_crit and attacker.get_crit_tier() >= 2:
-            ctx.damage_pre_mitigation *= attacker.final_stats.crit_damage
-
-        # Step 6: Defense Mitigation (GDD formula)
-        pre_pierce_damage = ctx.damage_pre_mitigation - defender.final_stats.armor
-        pierced_damage = ctx.damage_pre_mitigation * attacker.final_stats.pierce_ratio
-
-        # Use pierce damage formula: max(0, max(pre_pierce_damage, pierced_damage))
-        ctx.damage_post_armor = calculate_pierce_damage_formula(
-            pre_pierce_damage,
-            pierced_damage
+        # Step 9 roll: Block Check. The damage steps consume no randomness, so
+        # the block roll is taken first and keeps its place in the RNG stream
+        if defender_block_chance > 0 and pierce_ratio < 1:
+            ctx.was_blocked = calculate_skill_effect_proc(self.rng, defender_block_chance)
+
+        # Steps 5-10: Pre-mitigation crit, armor/pierce mitigation, Tier 3 crit
+        # recompute, glancing penalty, block reduction and final clamp, all
+        # done on plain numbers by the pure kernel
+        (ctx.damage_pre_mitigation, ctx.damage_post_armor,
+         ctx.final_damage, ctx.damage_blocked) = resolve_hit_damage(
+            base_damage_input,
+            ctx.base_resolved,
+            defender_armor,
+            pierce_ratio,
+            crit_damage,
+            attacker.get_crit_tier() if crit_tier is None else crit_tier,
+            ctx.was_crit,
+            ctx.was_glancing,
+            ctx.was_blocked,
+            block_amount
         )
 
-        # Step 7: Post-Mitigation Modifiers
-        ctx.final_damage = ctx.damage_post_armor
-
-        # Apply Tier 3 crits (True) - full recalculation
-        if ctx.was_crit and attacker.get_crit_tier() == 3:
-            CombatEngine._apply_post_pierce_crit(ctx)
-
-        # Step 8: Glancing Penalty - Call pure math function
-        if ctx.was_glancing:
-            ctx.final_damage = apply_glancing_damage(ctx.final_damage, 0.5)  # 50% reduction
-
-        # Step 9: Block Check - Call pure math function
-        if defender_block_chance > 0 and attacker.final_stats.pierce_ratio < 1:
-            was_blocked = calculate_skill_effect_proc(self.rng, defender_block_chance)
-            if was_blocked:
-                ctx.was_blocked = True
-                ctx.damage_blocked = min(ctx.final_damage, defender.final_stats.block_amount)
-                ctx.final_damage = apply_block_damage(ctx.final_damage, defender.final_stats.block_amount)
-
-        # Step 10: Final clamping
-        ctx.final_damage = clamp_min_damage(ctx.final_damage, 0.0)
-
         return ctx
 
     @staticmethod
-    def calculate_effective_damage(attacker: Entity, defender: Entity) -> dict:
+    def calculate_effective_damage(attacker: Entity, defender: Entity) -> DamageBreakdown:
         """Calculate detailed damage breakdown for analysis.
 
         Args:
@@ -222,87 +303,141 @@ class CombatEngine:
             defender: The entity receiving the attack
 
         Returns:
-            Dictionary with damage calculation details:
-            {
-                'final_damage': float,
-                'attack_damage': float,
-                'pre_pierce_damage': float,
-                'pierced_damage': float,
-                'armor_reduction': float,
-                'pierce_ratio': float
-            }
+            DamageBreakdown with final_damage, attack_damage, pre_pierce_damage,
+            pierced_damage, armor_reduction and pierce_ratio fields
         """
-        attack_damage = attacker.final_stats.base_damage
+        attack_damage, pierce_ratio = _ATTACKER_PIERCE_FIELDS(attacker.final_stats)
         defenses = defender.final_stats.armor
-        pierce_ratio = attacker.final_stats.pierce_ratio
 
         pre_pierce_damage = attack_damage - defenses
         pierced_damage = attack_damage * pierce_ratio
-        final_damage = max(pre_pierce_damage, pierced_damage)
-        final_damage = max(0, final_damage)
-
-        return {
-            'final_damage': final_damage,
-            'attack_damage': attack_damage,
-            'pre_pierce_damage': pre_pierce_damage,
-            'pierced_damage': pierced_damage,
-            'armor_reduction': defenses,
-            'pierce_ratio': pierce_ratio
-        }
+        final_damage = max(0.0, pre_pierce_damage, pierced_damage)
+
+        return DamageBreakdown(
+            final_damage=final_damage,
+            attack_damage=attack_damage,
+            pre_pierce_damage=pre_pierce_damage,
+            pierced_damage=pierced_damage,
+            armor_reduction=defenses,
+            pierce_ratio=pierce_ratio
+        )
 
-    @staticmethod
-    def validate_damage_calculation(attacker: Entity, defender: Entity) -> Optional[str]:
-        """Validate that a damage calculation would be valid.
+    def _resolve_hits_batch(self, attacker: Entity, defender: Entity,
+                            chances: tuple[float, float, float, float],
+                            crit_tier: int, hits: int) -> List[HitContext]:
+        """Resolve many hits of one skill use at once with NumPy.
+
+        Fills a (hits, rolls) array of uniforms with one RNG.random_array
+        call (a PCG64 block), then computes dodge, glance, crit tier and
+        block outcomes and the damage pipeline as array operations. Results
+        are deterministic for a given RNG seed but consume the RNG differently
+        from the per-hit path.
 
         Args:
             attacker: The entity performing the attack
             defender: The entity receiving the attack
+            chances: (evasion, dodge, crit, block) from _gather_hit_chances
+            crit_tier: Attacker's crit tier
+            hits: Number of hits to resolve
 
         Returns:
-            None if valid, error message string if invalid
+            List of HitContext, one per hit
         """
-        if attacker.final_stats.base_damage < 0:
-            return f"Attacker base_damage cannot be negative: {attacker.final_stats.base_damage}"
-
-        if attacker.final_stats.pierce_ratio < 0.01:
-            return f"Attacker pierce_ratio below minimum: {attacker.final_stats.pierce_ratio}"
-
-        if attacker.final_stats.pierce_ratio > 1.0:
-            return f"Attacker pierce_ratio above maximum: {attacker.final_stats.pierce_ratio}"
-
-        if defender.final_stats.armor < 0:
-            return f"Defender armor cannot be negative: {defender.final_stats.armor}"
+        evasion_chance, dodge_chance, crit_chance, block_chance = chances
+        base_damage, pierce_ratio, crit_damage = _ATTACKER_HIT_FIELDS(attacker.final_stats)
+        armor, block_amount = _DEFENDER_HIT_FIELDS(defender.final_stats)
+        tier_probs = attacker.get_crit_tier_probabilities()
+        tier_multipliers = np.asarray(attacker.get_crit_multipliers(), dtype=np.float64)
+        base_resolved = int(base_damage)
+
+        # Columns: dodge, evade, crit, one per crit tier, block
+        rolls = self.rng.random_array((hits, 4 + len(tier_probs)))
+
+        dodged = rolls[:, 0] < dodge_chance
+        glancing = ~dodged & (rolls[:, 1] < evasion_chance)
+        crit_rolled = rolls[:, 2] < crit_chance
+        tier_hits = rolls[:, 3:-1] < np.asarray(tier_probs, dtype=np.float64)
+        tier_index = tier_hits.argmax(axis=1)
+        tier_hit = crit_rolled & tier_hits.any(axis=1)
+        crit_multiplier = np.where(tier_hit, tier_multipliers[tier_index], 1.0)
+        was_crit = crit_rolled & ~glancing & ~dodged
+
+        pre_mitigation, post_armor, final = mitigate_hit_damage_batch(
+            base_damage, base_resolved, armor, pierce_ratio, crit_damage, crit_tier, was_crit
+        )
+        # Multiply rather than branch: glancing hits take half damage
+        final = final * np.where(glancing, 0.5, 1.0)
 
-        return None
+        if block_chance > 0 and pierce_ratio < 1:
+            blocked = ~dodged & (rolls[:, -1] < block_chance)
+            damage_blocked = np.where(blocked, np.minimum(final, block_amount), 0.0)
+            final = np.where(blocked, np.maximum(1.0, final - block_amount), final)
+        else:
+            blocked = np.zeros(hits, dtype=bool)
+            damage_blocked = np.zeros(hits)
+        np.maximum(final, 0.0, out=final)
+
+        hit_results = []
+        add_hit = hit_results.append
+        for dodge, glance, crit, block, multiplier, pre, post, blocked_amount, damage in zip(
+            dodged.tolist(), glancing.tolist(), was_crit.tolist(), blocked.tolist(),
+            crit_multiplier.tolist(), pre_mitigation.tolist(), post_armor.tolist(),
+            damage_blocked.tolist(), final.tolist()
+        ):
+            if dodge:
+                add_hit(HitContext(
+                    attacker=attacker, defender=defender, base_raw=base_damage,
+                    base_resolved=base_resolved, final_damage=0, was_dodged=True
+                ))
+                continue
+            add_hit(HitContext(
+                attacker=attacker,
+                defender=defender,
+                base_raw=base_damage,
+                base_resolved=base_resolved,
+                final_damage=damage,
+                was_crit=crit,
+                was_blocked=block,
+                was_glancing=glance,
+                crit_multiplier=multiplier,
+                damage_pre_mitigation=pre,
+                damage_post_armor=post,
+                damage_blocked=blocked_amount
+            ))
+        return hit_results
 
     @staticmethod
-    def _apply_pre_pierce_crit(ctx: HitContext):
-        """Apply pre-pierce critical hit multipliers based on crit tier.
+    def validate_damage_calculation(attacker: Entity, defender: Entity) -> Optional[str]:
+        """Validate that a damage calculation would be valid.
 
-        Tier 1 (Base Crit): Only affects base_damage (not yet implemented)
-        Tier 2 (Enhanced Crit): Affects all pre-mitigation damage
+        Args:
+            attacker: The entity performing the attack
+            defender: The entity receiving the attack
+
+        Returns:
+            None if valid, error message string if invalid
         """
-        crit_tier = ctx.attacker.get_crit_tier()
+        base_damage, pierce_ratio = _ATTACKER_PIERCE_FIELDS(attacker.final_stats)
+        defender_armor = defender.final_stats.armor
 
-        if crit_tier == 2:  # Enhanced Crit
-            ctx.damage_pre_mitigation *= ctx.attacker.final_stats.crit_damage
+        # Valid inputs are the common case; a single combined check lets them
+        # return before any of the per-field branches below.
+        if base_damage >= 0 and 0.01 <= pierce_ratio <= 1.0 and defender_armor >= 0:
+            return None
 
-    @staticmethod
-    def _apply_post_pierce_crit(ctx: HitContext):
-        """Apply post-pierce critical hit multipliers based on crit tier.
+        if base_damage < 0:
+            return f"Attacker base_damage cannot be negative: {base_damage}"
 
-        Tier 3 (True Crit): Affects post-mitigation damage
-        """
-        crit_tier = ctx.attacker.get_crit_tier()
+        if pierce_ratio < 0.01:
+            return f"Attacker pierce_ratio below minimum: {pierce_ratio}"
 
-        if crit_tier == 3:  # True Crit
-            # Re-calculate mitigated damage using crit-boosted pre_mitigation_damage
-            crit_pre_mit_damage = ctx.base_resolved * ctx.attacker.final_stats.crit_damage
-            pre_pierce_damage = crit_pre_mit_damage - ctx.defender.final_stats.armor
-            pierced_damage = crit_pre_mit_damage * ctx.attacker.final_stats.pierce_ratio
+        if pierce_ratio > 1.0:
+            return f"Attacker pierce_ratio above maximum: {pierce_ratio}"
 
-            # Update final damage directly based on new calculation
-            ctx.final_damage = max(0, max(pre_pierce_damage, pierced_damage))
+        if defender_armor < 0:
+            return f"Defender armor cannot be negative: {defender_armor}"
+
+        return None
 
     def calculate_skill_use(self, attacker: Entity, defender: Entity, skill: Skill, state_manager: StateManager) -> SkillUseResult:
         """Calculate the results of a skill use without executing actions.
@@ -310,6 +445,12 @@ class CombatEngine:
         Pure function that computes all hit contexts and intended actions.
         Separates calculation from execution for architectural purity.
 
+        Skills with fewer than BATCH_HIT_THRESHOLD hits roll each hit with
+        RNG.random(); skills with at least that many resolve every hit in one
+        pass drawn from RNG.random_array, a separate PCG64 stream. Both paths
+        are deterministic per seed, but the same seed gives different rolls
+        on either side of the threshold.
+
         Args:
             attacker: The entity using the skill
             defender: The target of the skill
@@ -318,52 +459,122 @@ class CombatEngine:
         Returns:
             SkillUseResult containing calculated hit contexts and actions to execute
         """
-        hit_results: List[HitContext] = []
+        hits = skill.hits
+        # Actions vary with crits, so each hit's group of actions is appended
+        # in one extend call.
         actions: List[Action] = []
+        add_actions = actions.extend
+
+        # Nothing below mutates state, so roll chances and per-skill values
+        # are the same for every hit and are resolved once up front.
+        chances = self._gather_hit_chances(attacker, defender, state_manager)
+        crit_tier = attacker.get_crit_tier()
+        damage_multiplier = skill.damage_multiplier
+        defender_id = defender.id
+        source = skill.name
+        trigger_source = source + "_trigger"
+        _, debuffs = _skill_trigger_plan(skill)
+
+        # 1. Resolve the damage for every hit; building actions consumes no
+        # randomness, so all hits can be resolved before the action loop
+        if hits >= BATCH_HIT_THRESHOLD:
+            hit_results = self._resolve_hits_batch(attacker, defender, chances, crit_tier, hits)
+        else:
+            resolve = self._resolve_hit_with_chances
+            hit_results = [resolve(attacker, defender, chances, crit_tier) for _ in range(hits)]
 
-        for _ in range(skill.hits):
-            # 1. Resolve the damage for a single hit
-            hit_context = self.resolve_hit(attacker, defender, state_manager)
-            hit_results.append(hit_context)
-
+        for hit_context in hit_results:
             # Apply Skill Multiplier
-            damage = hit_context.final_damage * skill.damage_multiplier # <--- NEW
+            damage = hit_context.final_damage * damage_multiplier
+            was_crit = hit_context.was_crit
 
             # 2. Create actions for damage application and event dispatching
-            actions.append(ApplyDamageAction(
-                target_id=defender.id,
+            damage_action = ApplyDamageAction(
+                target_id=defender_id,
                 damage=damage,
-                source=f"{skill.name}"
-            ))
-
+                source=source
+            )
             hit_event = OnHitEvent(
                 attacker=attacker,
                 defender=defender,
                 damage_dealt=damage,
-                is_crit=hit_context.was_crit
+                is_crit=was_crit
             )
-            actions.append(DispatchEventAction(event=hit_event))
-
-            if hit_context.was_crit:
+            if was_crit:
                 crit_event = OnCritEvent(hit_event=hit_event)
-                actions.append(DispatchEventAction(event=crit_event))
+                add_actions((damage_action, DispatchEventAction(event=hit_event),
+                             DispatchEventAction(event=crit_event)))
+            else:
+                add_actions((damage_action, DispatchEventAction(event=hit_event)))
 
             # 3. Process Skill-Specific Triggers (create effect actions)
-            for trigger in skill.triggers:
-                if trigger.event == "OnHit":
-                    # Calculate if trigger would proc (but don't execute randomness yet)
-                    # For now, we create the action assuming it will proc - execution will check RNG
-                    # TODO: Pre-calculate proc results for true determinism if needed
-                    if "apply_debuff" in trigger.result:
-                        actions.append(ApplyEffectAction(
-                            target_id=defender.id,
-                            effect_name=trigger.result["apply_debuff"],
-                            stacks_to_add=trigger.result.get("stacks", 1),
-                            source=f"{skill.name}_trigger"
-                        ))
+            # Calculate if trigger would proc (but don't execute randomness yet)
+            # For now, we create the action assuming it will proc - execution will check RNG
+            # TODO: Pre-calculate proc results for true determinism if needed
+            if debuffs:
+                add_actions([
+                    ApplyEffectAction(
+                        target_id=defender_id,
+                        effect_name=effect_name,
+                        stacks_to_add=stacks,
+                        source=trigger_source
+                    )
+                    for effect_name, stacks in debuffs
+                ])
 
         return SkillUseResult(hit_results=hit_results, actions=actions)
 
+    def process_skill_uses_batch(self, attackers: Sequence[Entity], defenders: Sequence[Entity],
+                                 skill: Skill, state_manager: StateManager) -> BatchedHitContext:
+        """Calculate the hit damage of one skill across many attacker/defender pairs.
+
+        Intended for Monte-Carlo style what-if simulation: like
+        calculate_skill_use it mutates no state and dispatches no events, but
+        instead of building actions and a HitContext per hit it writes each
+        hit's damage and crit flag into NumPy arrays. Pairs are resolved in order, so the results match
+        calling calculate_skill_use once per pair with the same RNG.
+
+        Args:
+            attackers: Entities using the skill, one per simulated use
+            defenders: Targets of the skill, paired by position with attackers
+            skill: The skill being used
+            state_manager: The state manager for roll-chance modifiers
+
+        Returns:
+            BatchedHitContext whose damages and crits arrays have shape
+            (len(attackers), skill.hits); damages are float32 (ample precision
+            for game damage, half the memory of float64) and include the
+            skill damage multiplier.
+
+        Raises:
+            ValueError: If attackers and defenders differ in length
+        """
+        if len(attackers) != len(defenders):
+            raise ValueError(
+                f"attackers and defenders must pair up: got {len(attackers)} and {len(defenders)}"
+            )
+
+        hits = skill.hits
+        damage_multiplier = skill.damage_multiplier
+        damages = np.zeros((len(attackers), hits), dtype=np.float32)
+        crits = np.zeros((len(attackers), hits), dtype=bool)
+        resolve = self._resolve_hit_with_chances
+
+        for row, (attacker, defender) in enumerate(zip(attackers, defenders)):
+            chances = self._gather_hit_chances(attacker, defender, state_manager)
+            crit_tier = attacker.get_crit_tier()
+            if hits >= BATCH_HIT_THRESHOLD:
+                hit_results = self._resolve_hits_batch(attacker, defender, chances, crit_tier, hits)
+            else:
+                hit_results = [resolve(attacker, defender, chances, crit_tier) for _ in range(hits)]
+            damage_row = damages[row]
+            crit_row = crits[row]
+            for index, hit_context in enumerate(hit_results):
+                damage_row[index] = hit_context.final_damage * damage_multiplier
+                crit_row[index] = hit_context.was_crit
+
+        return BatchedHitContext(attackers=attackers, defenders=defenders, damages=damages, crits=crits)
+
     def process_skill_use(self, attacker: Entity, defender: Entity, skill: Skill, event_bus: EventBus, state_manager: StateManager) -> bool:
         """Process a full skill use with resource checks, executing hits and dispatching all events.
 
@@ -386,82 +597,106 @@ class CombatEngine:
         if not attacker_state:
             return False  # Invalid attacker state
 
-        # Assume skill has resource_cost (will be added to skill model)
-        skill_cost = getattr(skill, 'resource_cost', 0.0)
+        # Skill declares resource_cost, cooldown and name with defaults, so
+        # they are read directly rather than through getattr/hasattr
+        skill_cost = skill.resource_cost
         if attacker_state.current_resource < skill_cost:
             return False  # Insufficient resource
 
         # Check cooldown
-        skill_name = getattr(skill, 'name', str(skill))
+        skill_name = skill.name
         if attacker_state.active_cooldowns.get(skill_name, 0) > 0:
             return False  # On cooldown
 
         # 1. Consume resource and set cooldown
         if skill_cost > 0:
             state_manager.spend_resource(attacker.id, skill_cost)
-        if hasattr(skill, 'cooldown') and skill.cooldown > 0:
-            cooldown_duration = skill.cooldown * (1.0 - attacker.final_stats.cooldown_reduction)
+        skill_cooldown = skill.cooldown
+        if skill_cooldown > 0:
+            cooldown_duration = skill_cooldown * (1.0 - attacker.final_stats.cooldown_reduction)
             state_manager.set_cooldown(attacker.id, skill_name, cooldown_duration)
 
-        # 2. Process all hits
+        # 2. Process all hits (crit tier follows rarity, so it is fixed for the skill use).
+        # Roll chances are gathered once and only re-gathered after either
+        # entity's roll modifiers change (from any listener or trigger).
+        crit_tier = attacker.get_crit_tier()
+        chances = self._gather_hit_chances(attacker, defender, state_manager)
+        defender_state = state_manager.get_state(defender.id)
+        modifier_version = attacker_state.roll_modifier_version + defender_state.roll_modifier_version
+        # Stats and ids read on every hit, flattened to locals for the loop
+        attacker_id = attacker.id
+        defender_id = defender.id
+        resource_on_hit, resource_on_kill = _ATTACKER_RESOURCE_FIELDS(attacker.final_stats)
+        trigger_plans = self._active_trigger_plans(attacker, defender)
+        skill_plan = _skill_trigger_plan(skill)
+        # Contexts are not kept past their hit unless an OnBlockEvent carries
+        # one out, so the previous hit's context is recycled when it can be
+        spare_context = None
+        has_listeners = event_bus.has_listeners
         for hit_num in range(skill.hits):
+            current_version = attacker_state.roll_modifier_version + defender_state.roll_modifier_version
+            if current_version != modifier_version:
+                modifier_version = current_version
+                chances = self._gather_hit_chances(attacker, defender, state_manager)
+
             # Resolve the damage for a single hit
-            hit_context = self.resolve_hit(attacker, defender, state_manager)
+            hit_context = self._resolve_hit_with_chances(attacker, defender, chances, crit_tier, spare_context)
+            was_dodged, was_glancing, was_blocked, was_crit = _HIT_OUTCOME_FIELDS(hit_context)
+            spare_context = None if was_blocked else hit_context
 
             # Dispatch outcome-specific events first
-            if hit_context.was_dodged:
+            if was_dodged:
                 dodge_event = OnDodgeEvent(attacker=attacker, defender=defender)
                 event_bus.dispatch(dodge_event)
                 # Award evasion resource if applicable
                 continue  # No damage/debuffs on dodge
 
-            # Create the hit event first
-            hit_event = OnHitEvent(
-                attacker=attacker,
-                defender=defender,
-                damage_dealt=hit_context.final_damage,
-                is_crit=hit_context.was_crit
-            )
-
-            if hit_context.was_glancing:
-                # OnGlancingBlowEvent for glancing hits
+            # Dispatch the hit event first. The OnHitEvent (which the crit and
+            # glancing events wrap) is only built if someone will receive it.
+            hit_event = None
+            if (has_listeners(OnHitEvent)
+                    or (was_crit and has_listeners(OnCritEvent))
+                    or (was_glancing and has_listeners(OnGlancingBlowEvent))):
+                hit_event = OnHitEvent(
+                    attacker=attacker,
+                    defender=defender,
+                    damage_dealt=hit_context.final_damage,
+                    is_crit=was_crit
+                )
                 event_bus.dispatch(hit_event)
-                glancing_event = OnGlancingBlowEvent(hit_event=hit_event)
-                event_bus.dispatch(glancing_event)
+                if was_glancing:
+                    # OnGlancingBlowEvent for glancing hits
+                    glancing_event = OnGlancingBlowEvent(hit_event=hit_event)
+                    event_bus.dispatch(glancing_event)
 
-            elif hit_context.was_blocked:
-                # Normal hit with block event
-                event_bus.dispatch(hit_event)
+            if was_blocked and not was_glancing:
+                # Block event follows the hit event
                 block_event = OnBlockEvent(
                     attacker=attacker,
                     defender=defender,
-                    damage_before_block=hit_context.damage_post_armor + (hit_context.final_damage * 2 if hit_context.was_glancing else hit_context.final_damage),  # Pre-block damage
+                    damage_before_block=hit_context.damage_post_armor + hit_context.final_damage,  # Pre-block damage
                     damage_blocked=hit_context.damage_blocked,
                     hit_context=hit_context
                 )
                 event_bus.dispatch(block_event)
 
-            else:
-                # Normal hit event only
-                event_bus.dispatch(hit_event)
-
             # Apply damage and award resource
             if hit_context.final_damage > 0:
-                state_manager.apply_damage(defender.id, hit_context.final_damage)
-                state_manager.add_resource(attacker.id, attacker.final_stats.resource_on_hit)
+                state_manager.apply_damage(defender_id, hit_context.final_damage)
+                state_manager.add_resource(attacker_id, resource_on_hit)
 
                 # OnKill resource bonus (check if defender died)
-                defender_state = state_manager.get_state(defender.id)
-                if defender_state and not defender_state.is_alive:
-                    state_manager.add_resource(attacker.id, attacker.final_stats.resource_on_kill)
+                if not defender_state.is_alive:
+                    state_manager.add_resource(attacker_id, resource_on_kill)
 
             # Dispatch crit event if critical
-            if hit_context.was_crit:
+            if was_crit and hit_event is not None:
                 crit_event = OnCritEvent(hit_event=hit_event)
                 event_bus.dispatch(crit_event)
 
             # Process skill triggers and active triggers
-            self._process_skill_triggers(attacker, defender, skill, hit_context, event_bus, state_manager)
+            self._process_skill_triggers(attacker, defender, skill, hit_context, event_bus, state_manager,
+                                         trigger_plans, skill_plan)
 
         # 3. Dispatch OnSkillUsed event (after execution)
         skill_used_event = OnSkillUsedEvent(entity=attacker, skill_id=str(skill), skill_type="damage")
@@ -469,40 +704,85 @@ class CombatEngine:
 
         return True  # Successfully used
 
+    @staticmethod
+    def _active_trigger_plans(attacker: Entity, defender: Entity):
+        """Pre-filter the entities' affix triggers once per skill use.
+
+        Active triggers only change when stats are recalculated, never during
+        a skill use, so event filtering and proc_rate lookups are hoisted here.
+
+        Args:
+            attacker: The entity using the skill
+            defender: The target of the skill
+
+        Returns:
+            Tuple of (attacker_plan, defender_plan). attacker_plan keeps the
+            list order of OnHit and OnSkillUsed triggers as (is_on_hit, result,
+            proc_rate, handlers) so RNG draws happen in the same sequence;
+            defender_plan holds (result, proc_rate, handlers) for OnBlock
+            triggers.
+        """
+        result_handlers = CombatEngine._result_handlers
+        attacker_plan = tuple(
+            (event == "OnHit", result, check.get("proc_rate", 1.0), result_handlers(result))
+            for event, check, result in map(_TRIGGER_FIELDS, attacker.active_triggers)
+            if event == "OnHit" or event == "OnSkillUsed"
+        )
+        # OnDodge triggers have no defender reaction yet, so only OnBlock is planned
+        defender_plan = tuple(
+            (result, check.get("proc_rate", 1.0), result_handlers(result))
+            for event, check, result in map(_TRIGGER_FIELDS, defender.active_triggers)
+            if event == "OnBlock"
+        )
+        return attacker_plan, defender_plan
+
     def _process_skill_triggers(self, attacker: Entity, defender: Entity, skill: Skill, hit_context: HitContext,
-                               event_bus: EventBus, state_manager: StateManager):
-        """Process skill triggers and active triggers for a hit context."""
+                               event_bus: EventBus, state_manager: StateManager, trigger_plans=None,
+                               skill_plan=None):
+        """Process skill triggers and active triggers for a hit context.
 
-        # Process skill-specific triggers (pass RNG explicitly per PR6)
-        for trigger in skill.triggers:
-            if trigger.event == "OnHit" and hit_context.final_damage > 0:
-                if calculate_skill_effect_proc(self.rng, trigger.check.get("proc_rate", 1.0)):
-                    self._execute_trigger_result(trigger.result, attacker, defender, hit_context, event_bus, state_manager)
+        trigger_plans is the result of _active_trigger_plans() and skill_plan
+        the result of _skill_trigger_plan(); each is built here when the
+        caller has not precomputed it.
+        """
+        if trigger_plans is None:
+            trigger_plans = self._active_trigger_plans(attacker, defender)
+        if skill_plan is None:
+            skill_plan = _skill_trigger_plan(skill)
+        attacker_plan, defender_plan = trigger_plans
+        damage_dealt = hit_context.final_damage > 0
+
+        # Process skill-specific triggers (pass RNG explicitly per PR6);
+        # trigger-less skills skip the loop entirely
+        on_hit, _ = skill_plan
+        if on_hit and damage_dealt:
+            for result, proc_rate, handlers in on_hit:
+                if calculate_skill_effect_proc(self.rng, proc_rate):
+                    for handler in handlers:
+                        handler(self, result, attacker, defender, hit_context, event_bus, state_manager)
 
         # Process active triggers from attacker affixes (pass RNG explicitly per PR6)
-        for trigger in attacker.active_triggers:
-            if trigger.event == "OnHit" and hit_context.final_damage > 0:
-                if calculate_skill_effect_proc(self.rng, trigger.check.get("proc_rate", 1.0)):
-                    self._execute_trigger_result(trigger.result, attacker, defender, hit_context, event_bus, state_manager)
-
-            elif trigger.event == "OnSkillUsed":
-                # Special case for OnSkillUsed triggers (like Focused Rage)
-                rng_value = self.rng.random()
-                if rng_value < trigger.check.get("proc_rate", 1.0):
-                    self._execute_trigger_result(trigger.result, attacker, defender, hit_context, event_bus, state_manager)
-
-        # Process defender active triggers (block/dodge effects)
+        for is_on_hit, result, proc_rate, handlers in attacker_plan:
+            if is_on_hit:
+                if damage_dealt and calculate_skill_effect_proc(self.rng, proc_rate):
+                    for handler in handlers:
+                        handler(self, result, attacker, defender, hit_context, event_bus, state_manager)
+
+            # Special case for OnSkillUsed triggers (like Focused Rage)
+            elif self._random() < proc_rate:
+                for handler in handlers:
+                    handler(self, result, attacker, defender, hit_context, event_bus, state_manager)
+
+        # Process defender active triggers (block effects); the state lookup
+        # is only needed when a block actually has reactions to fire
+        if not defender_plan or not hit_context.was_blocked:
+            return
         defender_state = state_manager.get_state(defender.id)
         if defender_state and defender_state.is_alive:
-            for trigger in defender.active_triggers:
-                if trigger.event == "OnBlock" and hit_context.was_blocked:
-                    rng_value = self.rng.random()
-                    if rng_value < trigger.check.get("proc_rate", 1.0):
-                        self._execute_trigger_result(trigger.result, defender, attacker, hit_context, event_bus, state_manager)
-
-                elif trigger.event == "OnDodge" and hit_context.was_dodged:
-                    # Defender reactive effects on dodge
-                    pass
+            for result, proc_rate, handlers in defender_plan:
+                if self._random() < proc_rate:
+                    for handler in handlers:
+                        handler(self, result, defender, attacker, hit_context, event_bus, state_manager)
 
     def _execute_trigger_result(self, result: Dict[str, any], source: Entity, target: Entity, hit_context: HitContext,
                               event_bus: EventBus, state_manager: StateManager):
@@ -516,35 +796,57 @@ class CombatEngine:
             event_bus: Event bus for dispatching events
             state_manager: State manager for applying effects
         """
-        # Standard debuff application
-        if "apply_debuff" in result:
-            state_manager.apply_debuff(
-                entity_id=target.id,
-                debuff_name=result["apply_debuff"],
-                stacks_to_add=result.get("stacks", 1),
-                max_duration=result.get("duration", 10.0)
-            )
+        for handler in self._result_handlers(result):
+            handler(self, result, source, target, hit_context, event_bus, state_manager)
+
+    def _apply_debuff_result(self, result: Dict[str, Any], source: Entity, target: Entity, hit_context: HitContext,
+                             event_bus: EventBus, state_manager: StateManager):
+        """Standard debuff application for an "apply_debuff" trigger result."""
+        state_manager.apply_debuff(
+            entity_id=target.id,
+            debuff_name=result["apply_debuff"],
+            stacks_to_add=result.get("stacks", 1),
+            max_duration=result.get("duration", 10.0)
+        )
 
-        # Complex effects - Phase 3
-        if "apply_crit_bonus" in result:
-            # Focused Rage effect - apply crit chance bonus to source
-            bonus_value = result["apply_crit_bonus"]
-            duration = result.get("duration", 5.0)
-
-            # Create a crit chance modifier
-            modifier = Modifier(
-                value=bonus_value,
-                duration=duration,
-                source="focused_rage"
-            )
+    def _apply_crit_bonus_result(self, result: Dict[str, Any], source: Entity, target: Entity, hit_context: HitContext,
+                                 event_bus: EventBus, state_manager: StateManager):
+        """Complex effect (Phase 3): Focused Rage crit chance bonus to the source."""
+        bonus_value = result["apply_crit_bonus"]
+        duration = result.get("duration", 5.0)
+
+        # Create a crit chance modifier
+        modifier = Modifier(
+            value=bonus_value,
+            duration=duration,
+            source="focused_rage"
+        )
+
+        source_state = state_manager.get_state(source.id)
+        if source_state:
+            source_state.add_roll_modifier('crit_chance', modifier)
+
+    # Result key -> handler, in the order handlers run when a result has several
+    _RESULT_HANDLERS = (
+        ("apply_debuff", _apply_debuff_result),
+        ("apply_crit_bonus", _apply_crit_bonus_result),
+    )
+
+    @classmethod
+    def _result_handlers(cls, result: Dict[str, Any]) -> tuple:
+        """Bind a trigger result to the handlers for the keys it contains.
 
-            source_state = state_manager.get_state(source.id)
-            if source_state:
-                if 'crit_chance' not in source_state.roll_modifiers:
-                    source_state.roll_modifiers['crit_chance'] = []
-                source_state.roll_modifiers['crit_chance'].append(modifier)
+        Trigger plans call this once per result so firing a trigger runs its
+        handlers directly instead of testing every known key.
 
+        Args:
+            result: The trigger result dictionary
 
+        Returns:
+            Tuple of unbound handler functions taking (engine, result, source,
+            target, hit_context, event_bus, state_manager)
+        """
+        return tuple(handler for key, handler in cls._RESULT_HANDLERS if key in result)
 
     def process_attack(self, attacker: Entity, defender: Entity, event_bus: EventBus, state_manager: StateManager) -> bool:
         """Process a basic attack as a skill use.
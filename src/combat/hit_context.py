@@ -1,17 +1,22 @@
 """HitContext - telemetry dataclass for combat hit resolution."""
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Sequence, Tuple
+import numpy as np
 from src.core.models import Entity
+from src.combat.combat_math import quantize_damage
 
 
-@dataclass
+@dataclass(slots=True)
 class HitContext:
     """Telemetry object capturing combat hit resolution results.
 
     Provides structured data about each combat hit for debugging,
     testing, and analytics while maintaining Entity references
     for backward compatibility.
+
+    One is allocated per hit, so it uses __slots__ to skip the per-instance
+    __dict__.
     """
     attacker: Entity
     defender: Entity
@@ -35,13 +40,39 @@ class HitContext:
     damage_post_armor: float = 0.0      # Damage after pierce/armor calculation
     damage_blocked: float = 0.0         # Amount reduced by blocking
 
-    # Optional RNG debugging (disabled by default for performance)
-    rng_seed: Optional[int] = None
-
     # Batch tracking (PR-P2S5)
     simulation_id: Optional[int] = None  # Unique ID for this simulation run
     batch_id: Optional[str] = None       # Batch identifier for grouping
 
+    def reset(self, attacker: Entity, defender: Entity, base_raw: Any, base_resolved: int,
+              final_damage: float) -> "HitContext":
+        """Reinitialise this context in place for a new hit.
+
+        Equivalent to constructing a fresh HitContext with the same
+        arguments, but plain slot writes are several times cheaper than the
+        keyword-argument __init__, so hit loops that do not retain their
+        contexts can recycle one.
+
+        Returns:
+            This context, for chaining
+        """
+        self.attacker = attacker
+        self.defender = defender
+        self.base_raw = base_raw
+        self.base_resolved = base_resolved
+        self.final_damage = final_damage
+        self.was_crit = False
+        self.was_dodged = False
+        self.was_blocked = False
+        self.was_glancing = False
+        self.crit_multiplier = 1.0
+        self.damage_pre_mitigation = 0.0
+        self.damage_post_armor = 0.0
+        self.damage_blocked = 0.0
+        self.simulation_id = None
+        self.batch_id = None
+        return self
+
     @property
     def attacker_id(self) -> str:
         """Get attacker entity ID for serialization."""
@@ -73,3 +104,87 @@ class HitContext:
             "simulation_id": self.simulation_id,
             "batch_id": self.batch_id,
         }
+
+    @staticmethod
+    def batch_serialize(contexts: Sequence["HitContext"]) -> Dict[str, Any]:
+        """Columnar counterpart of to_serializable for bulk telemetry export.
+
+        Builds one array per field instead of one dict per hit. Numeric
+        fields become float32 arrays and outcome flags become bool arrays;
+        ID fields stay plain lists since they hold strings and None.
+
+        Args:
+            contexts: HitContexts to serialize, in output row order
+
+        Returns:
+            Dict keyed like to_serializable, each value one column
+        """
+        count = len(contexts)
+        columns: Dict[str, Any] = {}
+        for name in _ID_COLUMNS:
+            columns[name] = [getattr(c, name) for c in contexts]
+        for name in _FLOAT_COLUMNS:
+            columns[name] = np.fromiter((getattr(c, name) for c in contexts), dtype=np.float32, count=count)
+        for name in _BOOL_COLUMNS:
+            columns[name] = np.fromiter((getattr(c, name) for c in contexts), dtype=bool, count=count)
+        return columns
+
+
+_ID_COLUMNS = ("attacker_id", "defender_id", "simulation_id", "batch_id")
+_FLOAT_COLUMNS = ("base_resolved", "final_damage", "damage_pre_mitigation", "damage_post_armor", "damage_blocked")
+_BOOL_COLUMNS = ("was_crit", "was_dodged", "was_blocked", "was_glancing")
+
+
+@dataclass(slots=True)
+class BatchedHitContext:
+    """Structure-of-arrays hit results for many skill uses at once.
+
+    Damages and crit flags for every hit are stored contiguously in arrays of
+    shape (uses, hits), so aggregate statistics are plain NumPy reductions.
+    Indexing with (use, hit) builds a HitContext view for that one hit on
+    demand; damages in the view include the skill damage multiplier.
+    """
+    attackers: Sequence[Entity]
+    defenders: Sequence[Entity]
+    damages: Any  # np.ndarray of float32, shape (uses, hits)
+    crits: Any    # np.ndarray of bool, shape (uses, hits)
+
+    def __len__(self) -> int:
+        """Number of skill uses in the batch."""
+        return len(self.damages)
+
+    def __getitem__(self, index: Tuple[int, int]) -> HitContext:
+        """Build a HitContext for hit `hit` of skill use `use`.
+
+        Args:
+            index: (use, hit) position in the batch
+
+        Returns:
+            HitContext carrying that hit's final damage and crit flag
+        """
+        use, hit = index
+        attacker = self.attackers[use]
+        base_raw = attacker.final_stats.base_damage
+        return HitContext(
+            attacker=attacker,
+            defender=self.defenders[use],
+            base_raw=base_raw,
+            base_resolved=int(base_raw),
+            final_damage=float(self.damages[use, hit]),
+            was_crit=bool(self.crits[use, hit])
+        )
+
+    def fixed_point_damages(self) -> Any:
+        """Damages as int32 fixed-point (see combat_math.DAMAGE_FIXED_POINT_SCALE).
+
+        Same footprint as the float32 array but integer, so totals over
+        large batches sum exactly; convert back with dequantize_damage.
+        """
+        return quantize_damage(self.damages)
+
+    def __iter__(self) -> Iterator[HitContext]:
+        """Yield a HitContext view for every hit, one skill use at a time."""
+        uses, hits = self.damages.shape
+        for use in range(uses):
+            for hit in range(hits):
+                yield self[use, hit]
@@ -6,29 +6,33 @@ Enhanced with PR3: Production-grade event system with unsubscribe support,
 exception isolation, safe iteration, and listener priority support.
 """
 
+import bisect
 import logging
 import time
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
-    from models import Entity, EffectInstance, Item
-    from engine import HitContext
+    from .models import Entity, EffectInstance, Item
+    from src.combat.hit_context import HitContext
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
-    """Base class for all combat events."""
-    pass
+    """Base class for all combat events.
+
+    Events are allocated per hit/tick, so they are slotted dataclasses with
+    no per-instance __dict__.
+    """
 
 # ============================================================================
 # COMBAT EVENTS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class OnHitEvent(Event):
     """Event fired when an attack hits a target."""
     attacker: "Entity"
@@ -37,13 +41,13 @@ class OnHitEvent(Event):
     is_crit: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class OnCritEvent(Event):
     """Event fired when a critical hit occurs."""
     hit_event: OnHitEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class DamageTickEvent(Event):
     """Event fired when a damage-over-time effect ticks."""
     target: "Entity"
@@ -52,14 +56,14 @@ class DamageTickEvent(Event):
     stacks: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OnDodgeEvent(Event):
     """Fired when an attack is fully dodged."""
     attacker: "Entity"
     defender: "Entity"
 
 
-@dataclass
+@dataclass(slots=True)
 class OnBlockEvent(Event):
     """Fired when a hit is successfully blocked."""
     attacker: "Entity"
@@ -69,13 +73,13 @@ class OnBlockEvent(Event):
     hit_context: "HitContext"
 
 
-@dataclass
+@dataclass(slots=True)
 class OnGlancingBlowEvent(Event):
     """Fired when a hit is downgraded to a Glancing Blow."""
     hit_event: OnHitEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class OnSkillUsedEvent(Event):
     """Fired when an entity successfully uses a skill (after cost/cooldown checks)."""
     entity: "Entity"
@@ -86,30 +90,30 @@ class OnSkillUsedEvent(Event):
 # LIFECYCLE EVENTS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EntitySpawnEvent(Event):
     """Fired when an entity is first registered in the state manager."""
     entity: "Entity"
 
-@dataclass
+@dataclass(slots=True)
 class EntityActivateEvent(Event):
     """Fired when an entity becomes active in combat (e.g. start of battle)."""
     entity: "Entity"
 
-@dataclass
+@dataclass(slots=True)
 class EntityDeathEvent(Event):
     """Fired when an entity's health reaches zero."""
     entity_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LootDroppedEvent(Event):
     """Fired when an entity drops loot upon death."""
     source_id: str
     items: List["Item"]
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityDespawnEvent(Event):
     """Fired when an entity is removed from the system."""
     entity_id: str
@@ -119,21 +123,21 @@ class EntityDespawnEvent(Event):
  # EFFECT EVENTS
  # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EffectApplied(Event):
     """Fired when a status effect is applied to an entity."""
     entity_id: str
     effect: "EffectInstance"
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectExpired(Event):
     """Fired when a status effect expires from an entity."""
     entity_id: str
     effect: "EffectInstance"
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectTick(Event):
     """Fired when a periodic effect applies its tick damage/healing."""
     entity_id: str
@@ -145,7 +149,7 @@ class EffectTick(Event):
 # EVENT BUS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ListenerEntry:
     """Represents a listener with metadata for priority and management."""
     listener: Callable
@@ -153,6 +157,35 @@ class ListenerEntry:
     name: str = ""     # Optional name for debugging
 
 
+# Number of most recent dispatch times kept per event type while profiling
+PROFILING_WINDOW = 1024
+
+
+@dataclass(slots=True)
+class _DispatchTimings:
+    """Running dispatch-time totals for one event type, in nanoseconds.
+
+    Totals make average/max O(1) to read; only the most recent timings are
+    kept, so long profiled runs use bounded memory. Integer nanoseconds from
+    perf_counter_ns keep accumulation exact.
+    """
+    total_ns: int = 0
+    max_ns: int = 0
+    recent: Deque[int] = field(default_factory=lambda: deque(maxlen=PROFILING_WINDOW))
+
+    def record(self, elapsed_ns: int) -> None:
+        """Add one dispatch duration."""
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.recent.append(elapsed_ns)
+
+
+def _descending_priority(entry: ListenerEntry) -> int:
+    """Sort key that orders listener entries highest priority first."""
+    return -entry.priority
+
+
 class EventBus:
     """Production-grade EventBus with PR3 enhancements.
 
@@ -168,13 +201,20 @@ class EventBus:
         """Initialize the enhanced event bus."""
         # Listener registry: event_type -> list of ListenerEntry (sorted by priority)
         self.listeners: Dict[type, List[ListenerEntry]] = defaultdict(list)
+        # Immutable (listener, name) snapshots per event type, rebuilt lazily
+        # after subscribe/unsubscribe; doubles as the dispatch-time safe copy
+        self._listener_cache: Dict[type, Tuple[Tuple[Callable, str], ...]] = {}
+        # (listener, name) for event types whose snapshot has exactly one
+        # listener, letting dispatch skip the loop; invalidated with the cache
+        self._single_listener: Dict[type, Tuple[Callable, str]] = {}
 
         # Optional profiling/metrics
         self._profiling_enabled = False
         self._profiling_initialized = False  # Track if profiling has been enabled at least once
         self._dispatch_counts: Dict[type, int] = defaultdict(int)
-        self._dispatch_times: Dict[type, List[float]] = defaultdict(list)
+        self._dispatch_times: Dict[type, _DispatchTimings] = defaultdict(_DispatchTimings)
         self._failure_counts: Dict[Callable, int] = defaultdict(int)
+        self._select_dispatch()
 
     def subscribe(self, event_type: type, listener: Callable, priority: int = 0, name: str = ""):
         """Register a listener for the given event type.
@@ -186,13 +226,16 @@ class EventBus:
             name: Optional name for debugging (default: "")
         """
         entry = ListenerEntry(listener=listener, priority=priority, name=name)
-        self.listeners[event_type].append(entry)
 
-        # Keep listeners sorted by priority (highest first)
-        self.listeners[event_type].sort(key=lambda e: e.priority, reverse=True)
+        # Keep listeners sorted by priority (highest first); insort_right puts
+        # the new entry after existing ones of equal priority, matching a stable sort
+        bisect.insort_right(self.listeners[event_type], entry, key=_descending_priority)
+        self._listener_cache.pop(event_type, None)
+        self._single_listener.pop(event_type, None)
 
-        logger.debug("Subscribed listener %s for %s (priority: %d)",
-                    name or str(listener), event_type.__name__, priority)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Subscribed listener %s for %s (priority: %d)",
+                         name or str(listener), event_type.__name__, priority)
 
     def unsubscribe(self, event_type: type, listener: Callable):
         """Remove a listener from the event type.
@@ -204,17 +247,28 @@ class EventBus:
         Returns:
             True if listener was found and removed, False otherwise
         """
-        listeners = self.listeners.get(event_type, [])
+        listeners = self.listeners.get(event_type, ())
         for i, entry in enumerate(listeners):
             if entry.listener is listener:
                 removed = listeners.pop(i)
-                logger.debug("Unsubscribed listener %s from %s",
-                           removed.name or str(listener), event_type.__name__)
+                self._listener_cache.pop(event_type, None)
+                self._single_listener.pop(event_type, None)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Unsubscribed listener %s from %s",
+                                 removed.name or str(listener), event_type.__name__)
                 return True
 
-        logger.debug("Listener %s not found for %s", str(listener), event_type.__name__)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Listener %s not found for %s", str(listener), event_type.__name__)
         return False
 
+    def has_listeners(self, event_type: type) -> bool:
+        """Return True if any listener is subscribed to the given event type.
+
+        Lets hot paths skip building events nobody will receive.
+        """
+        return bool(self.listeners.get(event_type))
+
     def dispatch(self, event: Event):
         """Dispatch an event to all registered listeners safely.
 
@@ -224,47 +278,106 @@ class EventBus:
         - Logging: Failed listeners logged as errors
         - Profiling: Optional dispatch metrics
 
+        Instances rebind dispatch to the lean or the profiled implementation
+        whenever profiling is toggled, so the hot path carries no profiling
+        branches; this method only serves calls made through the class.
+
         Args:
             event: The event instance to dispatch
         """
+        if self._profiling_enabled:
+            self._dispatch_profiled(event)
+        else:
+            self._dispatch_fast(event)
+
+    def _select_dispatch(self) -> None:
+        """Bind self.dispatch to the implementation matching the profiling state."""
+        self.dispatch = self._dispatch_profiled if self._profiling_enabled else self._dispatch_fast
+
+    def _snapshot(self, event_type: type) -> Tuple[Tuple[Callable, str], ...]:
+        """Return the cached (listener, name) tuple for an event type."""
+        # The cached tuple is the safe copy: subscriptions made during
+        # dispatch replace the cache entry rather than mutating it
+        safe_listeners = self._listener_cache.get(event_type)
+        if safe_listeners is None:
+            safe_listeners = tuple((entry.listener, entry.name) for entry in self.listeners.get(event_type, ()))
+            self._listener_cache[event_type] = safe_listeners
+            if len(safe_listeners) == 1:
+                self._single_listener[event_type] = safe_listeners[0]
+        return safe_listeners
+
+    def _listener_failed(self, listener: Callable, name: str, event_type: type, error: Exception) -> None:
+        """Record and log a listener failure; dispatch continues afterwards."""
+        self._failure_counts[listener] += 1
+        logger.error(
+            "Listener %s failed while handling %s: %s",
+            name or str(listener), event_type.__name__, error,
+            exc_info=True
+        )
+
+    def _dispatch_fast(self, event: Event) -> None:
+        """Dispatch without profiling bookkeeping; failures are still isolated."""
         event_type = event.__class__
-        event_listeners = self.listeners.get(event_type, [])
-
-        if not event_listeners:
+        single = self._single_listener.get(event_type)
+        if single is not None:
+            # Most event types have one listener: call it without the loop
+            listener, name = single
+            try:
+                listener(event)
+            except Exception as e:
+                self._listener_failed(listener, name, event_type, e)
             return
 
-        # Create safe copy for iteration (prevents modification during dispatch)
-        safe_listeners = list(event_listeners)
+        safe_listeners = self._listener_cache.get(event_type)
+        if safe_listeners is None:
+            safe_listeners = self._snapshot(event_type)
 
-        dispatch_start = time.perf_counter() if self._profiling_enabled else 0
+        for listener, name in safe_listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                self._listener_failed(listener, name, event_type, e)
+
+    def _dispatch_profiled(self, event: Event) -> None:
+        """Dispatch while collecting per-event-type timing and failure metrics."""
+        event_type = event.__class__
+        safe_listeners = self._snapshot(event_type)
+
+        if not safe_listeners:
+            return
+
+        # Checked once per dispatch; logging caches the answer per level
+        debug = logger.isEnabledFor(logging.DEBUG)
+        dispatch_start = time.perf_counter_ns()
         failed_count = 0
 
-        logger.debug("Dispatching %s to %d listeners", event_type.__name__, len(safe_listeners))
+        if debug:
+            logger.debug("Dispatching %s to %d listeners", event_type.__name__, len(safe_listeners))
 
-        for entry in safe_listeners:
+        for listener, name in safe_listeners:
             try:
-                entry.listener(event)
+                listener(event)
             except Exception as e:
                 failed_count += 1
-                self._failure_counts[entry.listener] += 1
-
-                listener_name = entry.name or str(entry.listener)
-                logger.error(
-                    "Listener %s failed while handling %s: %s",
-                    listener_name, event_type.__name__, e,
-                    exc_info=True
-                )
+                self._listener_failed(listener, name, event_type, e)
                 # Continue dispatching to other listeners
 
         # Collect profiling data
-        if self._profiling_enabled:
-            dispatch_time = time.perf_counter() - dispatch_start
-            self._dispatch_counts[event_type] += 1
-            self._dispatch_times[event_type].append(dispatch_time)
-
+        dispatch_ns = time.perf_counter_ns() - dispatch_start
+        self._dispatch_counts[event_type] += 1
+        self._dispatch_times[event_type].record(dispatch_ns)
+
+        # The summary is only worth formatting when something failed (raised
+        # to a warning) or debug output is actually on
+        if failed_count:
+            logger.warning(
+                "Dispatched %s in %.3fms (%d listeners, %d failed)",
+                event_type.__name__, dispatch_ns / 1_000_000, len(safe_listeners), failed_count
+            )
+        elif debug:
             logger.debug(
                 "Dispatched %s in %.3fms (%d listeners, %d failed)",
-                event_type.__name__, dispatch_time * 1000, len(safe_listeners), failed_count
+                event_type.__name__, dispatch_ns / 1_000_000, len(safe_listeners), failed_count
             )
 
     # === Profiling and Monitoring Features ===
@@ -277,6 +390,7 @@ class EventBus:
         """
         previously_enabled = self._profiling_enabled
         self._profiling_enabled = enabled
+        self._select_dispatch()
 
         # Reset only when first enabling profiling
         if enabled and not self._profiling_initialized:
@@ -295,29 +409,33 @@ class EventBus:
         Returns:
             Dictionary containing dispatch counts, average times, and failure rates
         """
-        stats = {}
+        # Include failure stats (recorded whether or not profiling is on)
+        failure_summary = {}
+        for listener, count in self._failure_counts.items():
+            listener_name = getattr(listener, '__name__', str(listener))
+            failure_summary[listener_name] = count
 
-        for event_type, times in self._dispatch_times.items():
-            if times:
-                avg_time = sum(times) / len(times)
-                max_time = max(times)
-                total_dispatches = self._dispatch_counts[event_type]
+        if not self._dispatch_counts:
+            # Nothing profiled yet: skip the per-event-type pass
+            return {'_failures': failure_summary, '_total_events_dispatched': 0}
 
+        # Running totals make this O(event types), independent of run length
+        stats = {}
+        total_events = 0
+        dispatch_times = self._dispatch_times
+        for event_type, total_dispatches in self._dispatch_counts.items():
+            if total_dispatches:
+                timings = dispatch_times[event_type]
+                total_events += total_dispatches
                 stats[event_type.__name__] = {
                     'total_dispatches': total_dispatches,
-                    'avg_dispatch_time_ms': avg_time * 1000,
-                    'max_dispatch_time_ms': max_time * 1000,
-                    'listeners_count': len(self.listeners[event_type])
+                    'avg_dispatch_time_ms': timings.total_ns / total_dispatches / 1_000_000,
+                    'max_dispatch_time_ms': timings.max_ns / 1_000_000,
+                    'listeners_count': len(self.listeners.get(event_type, ()))
                 }
 
-        # Include failure stats
-        failure_summary = {}
-        for listener, count in self._failure_counts.items():
-            listener_name = getattr(listener, '__name__', str(listener))
-            failure_summary[listener_name] = count
-
         stats['_failures'] = failure_summary
-        stats['_total_events_dispatched'] = sum(self._dispatch_counts.values())
+        stats['_total_events_dispatched'] = total_events
 
         return stats
 
@@ -333,7 +451,7 @@ class EventBus:
             Number of registered listeners
         """
         if event_type:
-            return len(self.listeners.get(event_type, []))
+            return len(self.listeners.get(event_type, ()))
         return sum(len(listeners) for listeners in self.listeners.values())
 
     def clear(self):
@@ -341,7 +459,10 @@ class EventBus:
 
         Useful for cleanup or testing.
         """
-        total_removed = sum(len(listeners) for listeners in self.listeners.values())
+        if logger.isEnabledFor(logging.DEBUG):
+            total_removed = sum(len(listeners) for listeners in self.listeners.values())
+            logger.debug("Cleared all listeners (%d removed)", total_removed)
         self.listeners.clear()
+        self._listener_cache.clear()
+        self._single_listener.clear()
         self.reset_profiling()
-        logger.debug("Cleared all listeners (%d removed)", total_removed)
@@ -1,14 +1,15 @@
 """Data models for combat entities and their statistics."""
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Literal, Dict, TYPE_CHECKING, Any
+import math
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Literal, Dict, NamedTuple, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .engine import HitContext
     from .events import Event, EffectApplied, EffectExpired
-    from .skills import Trigger
 
 from src.data.typed_models import Rarity
+from .skills import Trigger
 
 # Rarity to critical hit tier mapping
 RARITY_TO_CRIT_TIER = {
@@ -42,7 +43,7 @@ CRIT_TIER_MULTIPLIERS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityStats:
     """Static statistics for a combat entity.
 
@@ -119,6 +120,10 @@ class EntityStats:
             raise ValueError("cooldown_reduction must be non-negative")
 
 
+# EntityStats is slotted, so its stat names come from the dataclass fields
+_ENTITY_STAT_NAMES = tuple(f.name for f in fields(EntityStats))
+
+
 class Entity:
     """Represents a participant in combat.
 
@@ -126,6 +131,11 @@ class Entity:
     Dynamic state (health, buffs, etc.) is managed separately.
     """
 
+    __slots__ = (
+        "id", "base_stats", "name", "rarity", "loot_table_id", "template_id",
+        "equipment", "active_triggers", "final_stats",
+    )
+
     def __init__(self, id: str, base_stats: EntityStats, name: Optional[str] = None, rarity: str = "Common", loot_table_id: Optional[str] = None, template_id: Optional[str] = None):
         """Initialize an Entity.
 
@@ -224,11 +234,9 @@ class Entity:
         Returns:
             EntityStats with final calculated values
         """
-        from .skills import Trigger
-        import math
-
         # Start with a copy of the base stats
-        final_stats_dict = self.base_stats.__dict__.copy()
+        base_stats = self.base_stats
+        final_stats_dict = {name: getattr(base_stats, name) for name in _ENTITY_STAT_NAMES}
 
         # Get valid stat names for validation
         valid_stat_names = set(final_stats_dict.keys())
@@ -359,7 +367,7 @@ class Entity:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class RolledAffix:
     affix_id: str
     stat_affected: str
@@ -422,7 +430,7 @@ class RolledAffix:
             return float(self.value)  # Fallback
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     instance_id: str
     base_id: str
@@ -495,11 +503,27 @@ class DamageOnHitConfig:
     duration: float
     damage_per_tick: float
     stacks_to_add: int = 1
-    display_message: str = ""  # e.g., "Bleed proc'd on {target}!"
+    # e.g., "Bleed proc'd on {target}!"; {target} is the only field allowed,
+    # other fields are rejected when DamageOnHitHandler is built
+    display_message: str = ""
 
 
 # Combat Engine Result Objects
 
+class DamageBreakdown(NamedTuple):
+    """Detailed damage calculation returned by CombatEngine.calculate_effective_damage.
+
+    A NamedTuple rather than a dict so building one per call is a single
+    tuple allocation; use _asdict() where a mapping is needed.
+    """
+    final_damage: float
+    attack_damage: float
+    pre_pierce_damage: float
+    pierced_damage: float
+    armor_reduction: float
+    pierce_ratio: float
+
+
 @dataclass
 class SkillUseResult:
     """Result container for skill use calculations.
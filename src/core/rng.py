@@ -8,6 +8,8 @@ flow through this wrapper to ensure deterministic, reproducible simulations.
 import random
 from typing import Optional, Sequence, TypeVar, List
 
+import numpy as np
+
 T = TypeVar('T')
 
 
@@ -33,6 +35,40 @@ class RNG:
         """
         self._rng = random.Random(seed)
         self._seed = seed
+        # PCG64 generator behind random_array, created on first use
+        self._np_gen: Optional[np.random.Generator] = None
+        self._bind_fast_random()
+
+    def _bind_fast_random(self) -> None:
+        """Bind random() straight to the underlying generator's C method.
+
+        random() is the hottest draw, so this lets callers skip the wrapper's
+        Python frame. Subclasses that override random() keep their own.
+        """
+        if type(self).random is RNG.random:
+            self.random = self._rng.random
+
+    def __getstate__(self) -> dict:
+        """Drop the bound fast path so copies rebind to their own generator.
+
+        The NumPy generator is stored as its bit generator state so copies
+        continue the same array stream independently of the original.
+        """
+        state = self.__dict__.copy()
+        state.pop('random', None)
+        if state.get('_np_gen') is not None:
+            state['_np_gen'] = state['_np_gen'].bit_generator.state
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore state and rebind the fast random() path."""
+        np_state = state.get('_np_gen')
+        if np_state is not None:
+            gen = np.random.Generator(np.random.PCG64())
+            gen.bit_generator.state = np_state
+            state['_np_gen'] = gen
+        self.__dict__.update(state)
+        self._bind_fast_random()
 
     def random(self) -> float:
         """Return a random float in the range [0.0, 1.0).
@@ -178,6 +214,24 @@ class RNG:
         # Fallback (should rarely happen due to floating point precision)
         return items[-1]
 
+    def random_array(self, shape):
+        """Return a NumPy array of floats in the range [0.0, 1.0).
+
+        Arrays come from one PCG64 generator per RNG, seeded with this RNG's
+        seed on first use and reused afterwards, so each call is a single
+        C-level fill. The array stream is independent of the random() stream.
+
+        Args:
+            shape: Shape of the array to generate
+
+        Returns:
+            numpy.ndarray of uniform floats
+        """
+        gen = self._np_gen
+        if gen is None:
+            gen = self._np_gen = np.random.default_rng(self._seed)
+        return gen.random(shape)
+
     @property
     def seed(self) -> Optional[int]:
         """Get the seed used to initialize this RNG.
@@ -190,3 +244,73 @@ class RNG:
     def __repr__(self) -> str:
         """Return a string representation of the RNG."""
         return f"RNG(seed={self._seed})"
+
+
+class BatchedRNG(RNG):
+    """RNG that serves random() from pre-generated blocks of uniforms.
+
+    Intended for large batch simulations where per-call overhead of
+    random() dominates. Floats are drawn from numpy in blocks of
+    ``block_size`` and handed out one at a time; all other methods
+    delegate to the seeded random.Random inherited from RNG.
+
+    The float stream differs from RNG with the same seed, but is
+    itself fully deterministic for a given seed and block size.
+
+    Examples:
+        >>> rng = BatchedRNG(seed=42, block_size=1024)
+        >>> rng.roll(0.5)  # Served from the pre-generated block
+    """
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = 4096):
+        """Initialize the batched RNG.
+
+        Args:
+            seed: Random seed for reproducible results
+            block_size: Number of floats to generate per refill
+
+        Raises:
+            ValueError: If block_size is not positive
+        """
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        super().__init__(seed)
+        # random() blocks and random_array share the one PCG64 generator
+        self._np_gen = np.random.default_rng(seed)
+        self._block_size = block_size
+        self._buffer: List[float] = []
+        self._index = 0
+        self._refill()
+
+    def _refill(self) -> None:
+        """Generate the next block of uniforms."""
+        self._buffer = self._np_gen.random(self._block_size).tolist()
+        self._index = 0
+
+    def random(self) -> float:
+        """Return the next pre-generated float in the range [0.0, 1.0).
+
+        Returns:
+            Random float value
+        """
+        i = self._index
+        if i >= self._block_size:
+            self._refill()
+            i = 0
+        self._index = i + 1
+        return self._buffer[i]
+
+    def roll(self, chance: float) -> bool:
+        """Roll a probability using the pre-generated float stream.
+
+        Args:
+            chance: Probability of success (0.0 to 1.0)
+
+        Returns:
+            True if roll succeeds, False otherwise
+        """
+        return self.random() < chance
+
+    def __repr__(self) -> str:
+        """Return a string representation of the batched RNG."""
+        return f"BatchedRNG(seed={self._seed}, block_size={self._block_size})"
@@ -1,7 +1,8 @@
 """State management for combat entities - tracking dynamic properties like health."""
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional, TYPE_CHECKING, List
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, TYPE_CHECKING, List, Tuple
 import uuid
 
 from .models import Entity, EffectInstance
@@ -45,8 +46,15 @@ class EntityState:
     active_debuffs: Dict[str, Debuff] = field(default_factory=dict)
     current_resource: float = 0.0
     max_resource: float = 100.0
-    roll_modifiers: Dict[str, List[Modifier]] = field(default_factory=dict)
     active_cooldowns: Dict[str, float] = field(default_factory=dict)
+    # Roll modifiers and their running totals per roll type. Only
+    # add_roll_modifier/remove_roll_modifier write these, so the totals
+    # cannot drift from the modifiers; readers get read-only views.
+    _roll_modifiers: Dict[str, Tuple[Modifier, ...]] = field(default_factory=dict, init=False, repr=False)
+    _roll_modifier_sums: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    # Bumped on every roll modifier change so callers caching modified
+    # chances can tell when to re-read them
+    _roll_modifier_version: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self):
         """Validate state after initialization."""
@@ -59,6 +67,49 @@ class EntityState:
         if self.max_resource <= 0:
             raise ValueError("max_resource must be positive")
 
+    @property
+    def roll_modifiers(self) -> Mapping[str, Tuple[Modifier, ...]]:
+        """Read-only view of the active roll modifiers per roll type."""
+        return MappingProxyType(self._roll_modifiers)
+
+    @property
+    def roll_modifier_sums(self) -> Mapping[str, float]:
+        """Read-only view of the summed roll modifier values per roll type."""
+        return MappingProxyType(self._roll_modifier_sums)
+
+    @property
+    def roll_modifier_version(self) -> int:
+        """Counter that increases whenever a roll modifier is added or removed."""
+        return self._roll_modifier_version
+
+    def add_roll_modifier(self, roll_type: str, modifier: Modifier) -> None:
+        """Add a roll modifier and update the running total for its roll type."""
+        self._roll_modifiers[roll_type] = self._roll_modifiers.get(roll_type, ()) + (modifier,)
+        self._roll_modifier_sums[roll_type] = self._roll_modifier_sums.get(roll_type, 0.0) + modifier.value
+        self._roll_modifier_version += 1
+
+    def remove_roll_modifier(self, roll_type: str, modifier: Modifier) -> bool:
+        """Remove a roll modifier and update the running total for its roll type.
+
+        Returns:
+            True if the modifier was present and removed
+        """
+        modifiers = self._roll_modifiers.get(roll_type)
+        if not modifiers or modifier not in modifiers:
+            return False
+        index = modifiers.index(modifier)
+        modifiers = modifiers[:index] + modifiers[index + 1:]
+        if modifiers:
+            self._roll_modifiers[roll_type] = modifiers
+            # Re-sum what is left rather than subtracting, so repeated
+            # add/remove cycles cannot accumulate float drift
+            self._roll_modifier_sums[roll_type] = sum(mod.value for mod in modifiers)
+        else:
+            del self._roll_modifiers[roll_type]
+            del self._roll_modifier_sums[roll_type]
+        self._roll_modifier_version += 1
+        return True
+
 
 class StateManager:
     """Centralized manager for entity state and lifecycle.
@@ -200,6 +251,14 @@ class StateManager:
         state = self.get_state(entity_id)
         state.current_resource = min(state.current_resource + amount, state.max_resource)
 
+    def add_roll_modifier(self, entity_id: str, roll_type: str, modifier: Modifier) -> None:
+        """Add a roll-chance modifier (e.g. 'crit_chance') to an entity."""
+        self.get_state(entity_id).add_roll_modifier(roll_type, modifier)
+
+    def remove_roll_modifier(self, entity_id: str, roll_type: str, modifier: Modifier) -> bool:
+        """Remove a roll-chance modifier from an entity. Returns True if it was present."""
+        return self.get_state(entity_id).remove_roll_modifier(roll_type, modifier)
+
     def set_cooldown(self, entity_id: str, skill_name: str, cooldown_seconds: float) -> None:
         """Set a skill cooldown."""
         state = self.get_state(entity_id)
@@ -1,13 +1,27 @@
 import csv
 import json
-import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Union
 from .schemas import get_schema_validator
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Read CSVs in 1 MiB chunks rather than the default 8 KiB
+READ_BUFFER_SIZE = 1 << 20
+
+# Rarity probability columns in quality_tiers.csv, in column order
+TIER_RARITY_COLUMNS = (
+    "Normal", "Common", "Unusual", "Uncommon", "Rare", "Exotic",
+    "Epic", "Glorious", "Exalted", "Legendary", "Mythic", "Godly",
+)
+
 
 def parse_csv(filepath: str, schema: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Parse CSV with schema validation.
@@ -23,21 +37,39 @@ def parse_csv(filepath: str, schema: Dict[str, Any]) -> List[Dict[str, Any]]:
         ValueError: If validation fails
         FileNotFoundError: If file doesn't exist
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    with open(filepath, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        # Plain csv.reader avoids building a dict per row; columns are
+        # resolved to positional indices once from the header.
+        reader = csv.reader(f)
+        header = next(reader, None) or []
 
         # Validate columns
-        missing = [c for c in schema["required"] if c not in reader.fieldnames]
+        missing = [c for c in schema["required"] if c not in header]
         if missing:
             raise ValueError(
                 f"CSV Schema Error in {filepath}: Missing required columns: {missing}"
             )
 
+        # Compile the schema once so the row loop only walks a flat tuple.
+        # Columns absent from the header get index None and validate "".
+        index = {name: i for i, name in enumerate(header)}
+        columns = tuple(
+            (col, index.get(col), validator) for col, validator in schema["columns"].items()
+        )
+        width = len(header)
+
         rows = []
-        for i, row in enumerate(reader, start=2):  # header is line 1
+        append_row = rows.append
+        i = 1  # header is line 1
+        for row in reader:
+            if not row:
+                continue  # Skip blank lines, matching DictReader
+            i += 1
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
             validated = {}
-            for col, validator in schema["columns"].items():
-                raw_value = row.get(col, "")
+            for col, idx, validator in columns:
+                raw_value = row[idx] if idx is not None else ""
                 try:
                     validated[col] = validator(raw_value)
                 except Exception as e:
@@ -45,7 +77,7 @@ def parse_csv(filepath: str, schema: Dict[str, Any]) -> List[Dict[str, Any]]:
                         f"CSV Parse Error in {filepath} at line {i}: "
                         f"Column '{col}', value '{raw_value}': {e}"
                     )
-            rows.append(validated)
+            append_row(validated)
         return rows
 
 
@@ -87,16 +119,23 @@ def parse_all_csvs(base_path: Union[str, Path] = "data") -> Dict[str, Any]:
         "entities": {}  # NEW: entity templates keyed by entity_id
     }
 
-    for filename, data_key in csv_files:
-        filepath = data_dir / filename
-        filepath_str = str(filepath)
-        if not os.path.exists(filepath_str):
-            logger.warning(f"CSV file not found: {filepath_str}, skipping")
-            continue
+    # Read and validate the files concurrently so their I/O overlaps;
+    # results are consumed in the original order below.
+    pending = []
+    with ThreadPoolExecutor(max_workers=len(csv_files)) as executor:
+        for filename, data_key in csv_files:
+            filepath = data_dir / filename
+            filepath_str = str(filepath)
+            if not filepath.is_file():
+                logger.warning("CSV file not found: %s, skipping", filepath_str)
+                continue
+            schema = get_schema_validator(filepath_str)
+            future = executor.submit(parse_csv, filepath_str, schema)
+            pending.append((filename, data_key, schema, future))
 
+    for filename, data_key, schema, future in pending:
         try:
-            schema = get_schema_validator(filepath_str)
-            rows = parse_csv(filepath_str, schema)
+            rows = future.result()
 
             if data_key == "quality_tiers":
                 # Special validation for quality tiers: min_range < max_range
@@ -129,10 +168,10 @@ def parse_all_csvs(base_path: Union[str, Path] = "data") -> Dict[str, Any]:
                 # quality_tiers is a list
                 game_data[data_key] = rows
 
-            logger.info(f"Successfully parsed {filename} ({len(rows)} rows)")
+            logger.info("Successfully parsed %s (%d rows)", filename, len(rows))
 
         except Exception as e:
-            logger.error(f"Failed to parse {filename}: {e}")
+            logger.error("Failed to parse %s: %s", filename, e)
             raise
 
     # Cross-validation: Ensure affix IDs in affix_pools exist in affixes
@@ -155,8 +194,26 @@ def parse_all_csvs(base_path: Union[str, Path] = "data") -> Dict[str, Any]:
 def parse_csv_data():
     """
     Parses the CSV files into a structured game_data dictionary and saves as JSON.
+
+    If game_data.json is already newer than every source CSV, it is loaded
+    and returned instead of re-parsing.
     """
-    data_dir = "data"
+    data_dir = Path("data")
+    affixes_path = data_dir / "affixes.csv"
+    items_path = data_dir / "items.csv"
+    tiers_path = data_dir / "quality_tiers.csv"
+    output_path = data_dir / "game_data.json"
+
+    # Reuse the existing JSON when it is newer than every source CSV
+    source_paths = (affixes_path, items_path, tiers_path)
+    if output_path.is_file() and all(p.is_file() for p in source_paths):
+        newest_source = max(p.stat().st_mtime for p in source_paths)
+        if output_path.stat().st_mtime >= newest_source:
+            with open(output_path, 'rb') as f:
+                data = f.read()
+            if orjson is not None:
+                return orjson.loads(data)
+            return json.loads(data.decode('utf-8'))
     
     # Initialize empty structures
     game_data = {
@@ -166,8 +223,7 @@ def parse_csv_data():
     }
     
     # Parse affixes.csv
-    affixes_path = os.path.join(data_dir, "affixes.csv")
-    with open(affixes_path, 'r', newline='', encoding='utf-8') as f:
+    with open(affixes_path, 'r', newline='', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
         reader = csv.DictReader(f)
         for row in reader:
             affix_id = row['affix_id']
@@ -181,8 +237,7 @@ def parse_csv_data():
             }
     
     # Parse items.csv
-    items_path = os.path.join(data_dir, "items.csv")
-    with open(items_path, 'r', newline='', encoding='utf-8') as f:
+    with open(items_path, 'r', newline='', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
         reader = csv.DictReader(f)
         for row in reader:
             item_id = row['item_id']
@@ -197,33 +252,33 @@ def parse_csv_data():
             }
     
     # Parse quality_tiers.csv
-    tiers_path = os.path.join(data_dir, "quality_tiers.csv")
-    with open(tiers_path, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(tiers_path, 'r', newline='', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        idx = {name: i for i, name in enumerate(header)}
+        quality_id_i = idx["quality_id"]
+        tier_name_i = idx["tier_name"]
+        min_range_i = idx["min_range"]
+        max_range_i = idx["max_range"]
+        rarity_cols = tuple((name, idx[name]) for name in TIER_RARITY_COLUMNS)
+        tiers = game_data["quality_tiers"]
         for row in reader:
-            game_data["quality_tiers"].append({
-                "quality_id": int(row["quality_id"]),
-                "tier_name": row["tier_name"],
-                "min_range": int(row["min_range"]),
-                "max_range": int(row["max_range"]),
-                "Normal": int(row["Normal"]) if row["Normal"] else 0,
-                "Common": int(row["Common"]) if row["Common"] else 0,
-                "Unusual": int(row["Unusual"]) if row["Unusual"] else 0,
-                "Uncommon": int(row["Uncommon"]) if row["Uncommon"] else 0,
-                "Rare": int(row["Rare"]) if row["Rare"] else 0,
-                "Exotic": int(row["Exotic"]) if row["Exotic"] else 0,
-                "Epic": int(row["Epic"]) if row["Epic"] else 0,
-                "Glorious": int(row["Glorious"]) if row["Glorious"] else 0,
-                "Exalted": int(row["Exalted"]) if row["Exalted"] else 0,
-                "Legendary": int(row["Legendary"]) if row["Legendary"] else 0,
-                "Mythic": int(row["Mythic"]) if row["Mythic"] else 0,
-                "Godly": int(row["Godly"]) if row["Godly"] else 0
-            })
+            if not row:
+                continue
+            tier = {
+                "quality_id": int(row[quality_id_i]),
+                "tier_name": row[tier_name_i],
+                "min_range": int(row[min_range_i]),
+                "max_range": int(row[max_range_i]),
+            }
+            for name, i in rarity_cols:
+                value = row[i]
+                tier[name] = int(value) if value else 0
+            tiers.append(tier)
     
-    # Save to JSON
-    output_path = os.path.join(data_dir, "game_data.json")
+    # Save to JSON - compact output, the file is only read programmatically
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(game_data, f, indent=2)
+        json.dump(game_data, f, separators=(',', ':'), ensure_ascii=False)
     
     return game_data
 
@@ -1,6 +1,9 @@
 """GameDataProvider - Centralized access to all game data with strict typing and validation."""
 
+import functools
 import logging
+import threading
+from pathlib import Path
 from typing import Dict, Any, List, Optional
 from .data_parser import parse_all_csvs
 from .typed_models import (
@@ -13,10 +16,14 @@ from .typed_models import (
 
 logger = logging.getLogger(__name__)
 
-
 class GameDataProvider:
     """Singleton provider for all game data with validation and cross-references."""
 
+    # Data sections are plain instance attributes assigned in __init__, so
+    # lookups are attribute reads rather than property calls
+    entities: Dict[str, EntityTemplate]
+    items: Dict[str, ItemTemplate]
+    loot_tables: Dict[str, Any]
 
     def __init__(self, data_dir: Optional[str] = None) -> None:
         """Initialize the provider. 
@@ -33,11 +40,9 @@ class GameDataProvider:
         self.quality_tiers = []
         self.effects = {}
         self.skills = {}
-        self.loot_tables = []
+        self.loot_tables = {}
         self.entities = {}
-        
-        from pathlib import Path
-        
+
         self._is_initialized = False
         
         if data_dir:
@@ -81,7 +86,7 @@ class GameDataProvider:
             self._is_initialized = True
 
         except Exception as e:
-            logger.error(f"GameDataProvider initialization failed: {e}")
+            logger.error("GameDataProvider initialization failed: %s", e)
             raise
 
     def _hydrate_data(self, raw_data: Dict[str, Any]) -> None:
@@ -123,6 +128,30 @@ class GameDataProvider:
         for ent_id, raw_ent in raw_data.get('entities', {}).items():
             self.entities[ent_id] = hydrate_entity_template(raw_ent)
 
+        self._reset_indexes()
+
+    def _reset_indexes(self) -> None:
+        """Drop cached reverse lookups so they are rebuilt on next access."""
+        self.__dict__.pop('_affixes_by_pool', None)
+        self.__dict__.pop('_skills_by_damage_type', None)
+
+    @functools.cached_property
+    def _affixes_by_pool(self) -> Dict[str, List[AffixDefinition]]:
+        """Reverse lookup of pool name -> affixes, built on first query."""
+        by_pool: Dict[str, List[AffixDefinition]] = {}
+        for affix in self.affixes.values():
+            for pool in affix.affix_pools:
+                by_pool.setdefault(pool, []).append(affix)
+        return by_pool
+
+    @functools.cached_property
+    def _skills_by_damage_type(self) -> Dict[Any, List[SkillDefinition]]:
+        """Reverse lookup of damage type -> skills, built on first query."""
+        by_damage_type: Dict[Any, List[SkillDefinition]] = {}
+        for skill in self.skills.values():
+            by_damage_type.setdefault(skill.damage_type, []).append(skill)
+        return by_damage_type
+
 
     def _validate_cross_references(self) -> None:
         """Validate all cross-references between data types."""
@@ -132,16 +161,20 @@ class GameDataProvider:
         self._validate_entities()
 
         # NEW: Validate Item -> Skill reference
-        for item_id, item in self.items.items():
-            if item.default_attack_skill:
-                if item.default_attack_skill not in self.skills:
-                    raise DataValidationError(
-                        f"Item '{item_id}' references non-existent default_attack_skill '{item.default_attack_skill}'",
-                        data_type="ItemTemplate",
-                        field_name="default_attack_skill",
-                        invalid_id=item.default_attack_skill,
-                        suggestions=list(self.skills.keys())
-                    )
+        skill_refs = [
+            (item_id, item.default_attack_skill)
+            for item_id, item in self.items.items() if item.default_attack_skill
+        ]
+        missing = {skill_id for _, skill_id in skill_refs} - self.skills.keys()
+        if missing:
+            item_id, skill_id = next(ref for ref in skill_refs if ref[1] in missing)
+            raise DataValidationError(
+                f"Item '{item_id}' references non-existent default_attack_skill '{skill_id}'",
+                data_type="ItemTemplate",
+                field_name="default_attack_skill",
+                invalid_id=skill_id,
+                suggestions=list(self.skills.keys())
+            )
 
         # Loot table validation
         self._validate_loot_tables()
@@ -150,32 +183,42 @@ class GameDataProvider:
     def _validate_affix_pools(self) -> None:
         """Validate affix pool references."""
 
-        for pool_id, rarities in self.affix_pools.items():
-            for rarity, tiers in rarities.items():
-                for tier, entries in tiers.items():
-                    for entry in entries:
-                        affix_id = entry['affix_id']
-                        if affix_id not in self.affixes:
-                            raise DataValidationError(
-                                f"Affix pool '{pool_id}' references unknown affix '{affix_id}'",
-                                data_type="AffixPool",
-                                field_name="affix_id",
-                                invalid_id=affix_id
-                            )
+        # Collect every reference once and check them with a single set difference
+        affix_refs = [
+            (pool_id, entry['affix_id'])
+            for pool_id, rarities in self.affix_pools.items()
+            for tiers in rarities.values()
+            for entries in tiers.values()
+            for entry in entries
+        ]
+        missing = {affix_id for _, affix_id in affix_refs} - self.affixes.keys()
+        if missing:
+            pool_id, affix_id = next(ref for ref in affix_refs if ref[1] in missing)
+            raise DataValidationError(
+                f"Affix pool '{pool_id}' references unknown affix '{affix_id}'",
+                data_type="AffixPool",
+                field_name="affix_id",
+                invalid_id=affix_id
+            )
 
     def _validate_items(self) -> None:
         """Validate item references."""
 
-        for item_id, item in self.items.items():
-            # Validate implicit affixes exist
-            for affix_id in item.implicit_affixes:
-                if affix_id and affix_id not in self.affixes:
-                    raise DataValidationError(
-                        f"Item '{item_id}' references unknown implicit affix '{affix_id}'",
-                        data_type="ItemTemplate",
-                        field_name="implicit_affixes",
-                        invalid_id=affix_id
-                    )
+        # Validate implicit affixes exist
+        implicit_refs = [
+            (item_id, affix_id)
+            for item_id, item in self.items.items()
+            for affix_id in item.implicit_affixes if affix_id
+        ]
+        missing = {affix_id for _, affix_id in implicit_refs} - self.affixes.keys()
+        if missing:
+            item_id, affix_id = next(ref for ref in implicit_refs if ref[1] in missing)
+            raise DataValidationError(
+                f"Item '{item_id}' references unknown implicit affix '{affix_id}'",
+                data_type="ItemTemplate",
+                field_name="implicit_affixes",
+                invalid_id=affix_id
+            )
 
     def _validate_entities(self) -> None:
         """Validate entity references (Equipment Pools and Loot Tables)."""
@@ -203,7 +246,8 @@ class GameDataProvider:
                 if pool not in valid_equipment_targets:
                     # Warning only, as pools might be defined but empty effectively
                     logger.warning(
-                        f"Entity '{ent_id}' references equipment pool '{pool}' which matches no Item ID or Item Affix Pool."
+                        "Entity '%s' references equipment pool '%s' which matches no Item ID or Item Affix Pool.",
+                        ent_id, pool
                     )
 
     def _validate_loot_tables(self) -> None:
@@ -305,6 +349,10 @@ class GameDataProvider:
         """Get all affix pools."""
         return self.affix_pools
 
+    def find_affixes_by_pool(self, pool_name: str) -> List[AffixDefinition]:
+        """Get all affixes that belong to the given pool."""
+        return self._affixes_by_pool.get(pool_name, [])
+
     def get_item_template(self, item_id: str) -> ItemTemplate:
         """Get item template by ID."""
         if not self._is_initialized:
@@ -327,6 +375,10 @@ class GameDataProvider:
         """Get all skills."""
         return self.skills
 
+    def find_skills_by_damage_type(self, damage_type: Any) -> List[SkillDefinition]:
+        """Get all skills that deal the given damage type."""
+        return self._skills_by_damage_type.get(damage_type, [])
+
     def get_quality_tier(self, quality_id: int) -> QualityTier:
         """Get quality tier by ID."""
         if not self._is_initialized:
@@ -349,35 +401,42 @@ class GameDataProvider:
         return self.entities
     
     def get_effects(self) -> Dict[str, EffectDefinition]:
+        """Get all effect definitions."""
         return self.effects
 
-    # Property getters for backward compatibility with existing tests
-    @property
-    def entities(self) -> Dict[str, EntityTemplate]:
-        """Access entities dict (backward compatibility)."""
-        return self.__dict__.get('entities', {})
-
-    @entities.setter
-    def entities(self, value: Dict[str, EntityTemplate]) -> None:
-        """Set entities dict (backward compatibility)."""
-        self.__dict__['entities'] = value
-
-    @property
-    def items(self) -> Dict[str, ItemTemplate]:
-        """Access items dict (backward compatibility)."""
-        return self.__dict__.get('items', {})
-
-    @items.setter
-    def items(self, value: Dict[str, ItemTemplate]) -> None:
-        """Set items dict (backward compatibility)."""
-        self.__dict__['items'] = value
-
-    @property
-    def loot_tables(self) -> Dict[str, Any]:
-        """Access loot_tables dict (updated for new structure)."""
-        return self.__dict__.get('loot_tables', {})
-
-    @loot_tables.setter
-    def loot_tables(self, value) -> None:
-        """Set loot_tables (supports both old list and new dict formats)."""
-        self.__dict__['loot_tables'] = value
+
+# Shared provider for the default data directory, built at most once
+_shared_provider: Optional[GameDataProvider] = None
+_shared_provider_lock = threading.Lock()
+
+
+def get_game_data_provider() -> GameDataProvider:
+    """Get the shared GameDataProvider for the default data directory.
+
+    The provider is built on first call and memoized, so repeated lookups
+    skip the full CSV parse and validation pass. Construction is guarded by
+    a lock with a double check, so concurrent first calls (e.g. dashboard
+    callbacks on separate threads) parse the data once; later calls take no
+    lock at all.
+    """
+    global _shared_provider
+    provider = _shared_provider
+    if provider is None:
+        with _shared_provider_lock:
+            provider = _shared_provider
+            if provider is None:
+                provider = _shared_provider = GameDataProvider()
+    return provider
+
+
+def clear_game_data_provider() -> None:
+    """Forget the shared provider so the next lookup loads a fresh one."""
+    global _shared_provider
+    with _shared_provider_lock:
+        _shared_provider = None
+
+
+def reload_game_data_provider() -> GameDataProvider:
+    """Discard the shared provider and load a fresh one from disk."""
+    clear_game_data_provider()
+    return get_game_data_provider()
@@ -5,7 +5,7 @@ Each schema specifies required columns and validation functions for their values
 """
 
 import logging
-from typing import Any, Dict, Callable
+from typing import Any, Dict, Callable, Type
 
 logger = logging.getLogger(__name__)
 
@@ -17,30 +17,31 @@ def str_validator(value: str) -> str:
     return str(value).strip()
 
 
-def int_validator(value: str) -> int:
+def int_validator(value: str, _int: Type[int] = int, _float: Type[float] = float) -> int:
     """Validate integer values."""
-    if not value or value.strip() == "":
+    # Builtins are bound as defaults so each call uses fast locals
+    if not value or value.isspace():
         raise ValueError("Value cannot be empty")
     try:
-        return int(float(value))  # Handle float strings like "1.0"
+        return _int(_float(value))  # Handle float strings like "1.0"
     except (ValueError, TypeError):
         raise ValueError(f"Invalid integer value: '{value}'")
 
 
-def float_validator(value: str) -> float:
+def float_validator(value: str, _float: Type[float] = float) -> float:
     """Validate float values. Can be empty for optional fields."""
-    if not value or value.strip() == "":
-        # Allow empty values - this should be handled by the lambda wrappers
+    if not value or value.isspace():
+        # Allow empty values - this should be handled by the optional wrappers
         raise ValueError("Value cannot be empty")
     try:
-        return float(value)
+        return _float(value)
     except (ValueError, TypeError):
         raise ValueError(f"Invalid float value: '{value}'")
 
 
-def flexible_float_validator(value: str) -> str:
+def flexible_float_validator(value: str, _float: Type[float] = float) -> str:
     """Validate float values or semicolon-separated float values for complex affixes."""
-    if not value or value.strip() == "":
+    if not value or value.isspace():
         return ""  # Allow empty values
 
     # Check if it's semicolon-separated values
@@ -51,14 +52,14 @@ def flexible_float_validator(value: str) -> str:
             for part in parts:
                 part = part.strip()
                 if part:  # Allow empty parts
-                    float(part)
+                    _float(part)
             return value.strip()
         except ValueError:
             raise ValueError(f"Invalid float values in semicolon-separated list: '{value}'")
 
     # Single float value
     try:
-        float(value.strip())
+        _float(value.strip())
         return value.strip()
     except ValueError:
         raise ValueError(f"Invalid float value: '{value}'")
@@ -79,25 +80,25 @@ def flexible_damage_validator(value: str) -> float:
 
 
 
-def positive_float_validator(value: str) -> float:
+def positive_float_validator(value: str, _float_validator: Callable[[str], float] = float_validator) -> float:
     """Validate positive float values."""
-    val = float_validator(value)
+    val = _float_validator(value)
     if val <= 0:
         raise ValueError(f"Value must be > 0, got {val}")
     return val
 
 
-def non_negative_float_validator(value: str) -> float:
+def non_negative_float_validator(value: str, _float_validator: Callable[[str], float] = float_validator) -> float:
     """Validate non-negative float values."""
-    val = float_validator(value)
+    val = _float_validator(value)
     if val < 0:
         raise ValueError(f"Value must be >= 0, got {val}")
     return val
 
 
-def quality_id_validator(value: str) -> int:
+def quality_id_validator(value: str, _int_validator: Callable[[str], int] = int_validator) -> int:
     """Validate quality tier IDs."""
-    val = int_validator(value)
+    val = _int_validator(value)
     if val < 1:
         raise ValueError(f"Quality ID must be >= 1, got {val}")
     return val
@@ -119,16 +120,32 @@ def affix_pools_validator(value: str) -> list[str]:
     return [pool.strip() for pool in value.split('|') if pool.strip()]
 
 
-def tier_probabilities_validator(value: str) -> int:
+def tier_probabilities_validator(value: str, _int_validator: Callable[[str], int] = int_validator) -> int:
     """Validate tier probabilities - can be empty (0) or positive integer."""
-    if not value or value.strip() == "":
+    if not value or value.isspace():
         return 0
-    val = int_validator(value)
+    val = _int_validator(value)
     if val < 0:
         raise ValueError(f"Tier probability must be >= 0, got {val}")
     return val
 
 
+def optional(validator: Callable[[str], Any], default: Any) -> Callable[[str], Any]:
+    """Wrap a validator so empty or blank cells yield a default instead of an error."""
+    def validate_optional(value: str, _validator: Callable[[str], Any] = validator, _default: Any = default) -> Any:
+        if not value or value.isspace():
+            return _default
+        return _validator(value)
+    return validate_optional
+
+
+def bool_flag_validator(value: str) -> bool:
+    """Validate TRUE/FALSE flag columns - empty means False."""
+    if not value or value.isspace():
+        return False
+    return value.upper() == "TRUE"
+
+
 # Schema definitions
 AFFIX_SCHEMA = {
     "required": ["affix_id", "stat_affected", "mod_type", "base_value", "description"],
@@ -140,12 +157,12 @@ AFFIX_SCHEMA = {
         "base_value": flexible_float_validator,
         "description": str_validator,
         "trigger_event": str_validator,
-        "proc_rate": lambda x: float_validator(x) if x and x.strip() else 0.0,
+        "proc_rate": optional(float_validator, 0.0),
         "trigger_result": str_validator,
-        "trigger_duration": lambda x: non_negative_float_validator(x) if x and x.strip() else 0.0,
-        "stacks_max": lambda x: int_validator(x) if x and x.strip() else 1,
-        "dual_stat": lambda x: x.upper() == "TRUE" if x and x.strip() else False,
-        "scaling_power": lambda x: x.upper() == "TRUE" if x and x.strip() else False,
+        "trigger_duration": optional(non_negative_float_validator, 0.0),
+        "stacks_max": optional(int_validator, 1),
+        "dual_stat": bool_flag_validator,
+        "scaling_power": bool_flag_validator,
         "complex_effect": str_validator,
     },
 }
@@ -159,7 +176,7 @@ ITEM_SCHEMA = {
         "rarity": str_validator,
         "affix_pools": affix_pools_validator,
         "implicit_affixes": affix_pools_validator,  # Same validation as affix_pools
-        "num_random_affixes": lambda x: int_validator(x) if x and x.strip() else 0,
+        "num_random_affixes": optional(int_validator, 0),
         "default_attack_skill": str_validator, # <--- NEW
     },
 }
@@ -194,13 +211,13 @@ EFFECTS_SCHEMA = {
         "name": str_validator,
         "type": str_validator,
         "description": str_validator,
-        "max_stacks": lambda x: int_validator(x) if x and x.strip() else 1,
-        "tick_rate": lambda x: non_negative_float_validator(x) if x and x.strip() else 1.0,
+        "max_stacks": optional(int_validator, 1),
+        "tick_rate": optional(non_negative_float_validator, 1.0),
         "damage_per_tick": flexible_damage_validator,
-        "stat_multiplier": lambda x: float_validator(x) if x and x.strip() else 0.0,
-        "stat_add": lambda x: float_validator(x) if x and x.strip() else 0.0,
+        "stat_multiplier": optional(float_validator, 0.0),
+        "stat_add": optional(float_validator, 0.0),
         "visual_effect": str_validator,
-        "duration": lambda x: non_negative_float_validator(x) if x and x.strip() else 10.0,  # Default to 10 if empty
+        "duration": optional(non_negative_float_validator, 10.0),  # Default to 10 if empty
     },
 }
 
@@ -210,16 +227,16 @@ SKILLS_SCHEMA = {
         "skill_id": str_validator,
         "name": str_validator,
         "damage_type": str_validator,
-        "damage_multiplier": lambda x: float_validator(x) if x else 1.0, # <--- NEW
-        "hits": lambda x: int_validator(x) if x and x.strip() else 1,
+        "damage_multiplier": optional(float_validator, 1.0), # <--- NEW
+        "hits": optional(int_validator, 1),
         "description": str_validator,
-        "resource_cost": lambda x: non_negative_float_validator(x) if x and x.strip() else 0.0,
-        "cooldown": lambda x: non_negative_float_validator(x) if x and x.strip() else 0.0,
+        "resource_cost": optional(non_negative_float_validator, 0.0),
+        "cooldown": optional(non_negative_float_validator, 0.0),
         "trigger_event": str_validator,
-        "proc_rate": lambda x: float_validator(x) if x and x.strip() else 0.0,
+        "proc_rate": optional(float_validator, 0.0),
         "trigger_result": str_validator,
-        "trigger_duration": lambda x: non_negative_float_validator(x) if x and x.strip() else 0.0,
-        "stacks_max": lambda x: int_validator(x) if x and x.strip() else 1,
+        "trigger_duration": optional(non_negative_float_validator, 0.0),
+        "stacks_max": optional(int_validator, 1),
     },
 }
 
@@ -230,7 +247,7 @@ AFFIX_POOLS_SCHEMA = {
         "rarity": str_validator,
         "tier": int_validator,
         "affix_id": str_validator,
-        "weight": lambda v: int_validator(v) if v and v.strip() else 1
+        "weight": optional(int_validator, 1)
     },
 }
 
@@ -240,10 +257,10 @@ LOOT_TABLES_SCHEMA = {
         "table_id": str_validator,
         "entry_type": str_validator,
         "entry_id": str_validator,
-        "weight": lambda x: int_validator(x) if x else 0,
-        "min_count": lambda x: int_validator(x) if x else 1,
-        "max_count": lambda x: int_validator(x) if x else 1,
-        "drop_chance": lambda x: float_validator(x) if x else 1.0,
+        "weight": optional(int_validator, 0),
+        "min_count": optional(int_validator, 1),
+        "max_count": optional(int_validator, 1),
+        "drop_chance": optional(float_validator, 1.0),
     },
 }
 
@@ -253,13 +270,13 @@ ENTITIES_SCHEMA = {
         "entity_id": str_validator,
         "name": str_validator,
         "archetype": str_validator,
-        "level": lambda x: int_validator(x) if x else 1,
+        "level": optional(int_validator, 1),
         "rarity": str_validator,
         "base_health": positive_float_validator,
         "base_damage": non_negative_float_validator,
-        "armor": lambda x: non_negative_float_validator(x) if x and x.strip() else 0.0,
-        "crit_chance": lambda x: non_negative_float_validator(x) if x and x.strip() else 0.0,
-        "attack_speed": lambda x: positive_float_validator(x) if x and x.strip() else 1.0,
+        "armor": optional(non_negative_float_validator, 0.0),
+        "crit_chance": optional(non_negative_float_validator, 0.0),
+        "attack_speed": optional(positive_float_validator, 1.0),
         "equipment_pools": affix_pools_validator,  # Reuse the same validator
         "loot_table_id": str_validator,
         "description": str_validator,
@@ -3,10 +3,11 @@
 This module defines dataclasses and enums for all core game data structures.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import List, Optional, Dict, Any, Type, TypeVar
+from typing import List, Optional, Dict, Any, Type, TypeVar, Callable, FrozenSet, Tuple
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
@@ -133,12 +134,18 @@ class AffixDefinition:
     dual_stat: bool = False
     scaling_power: bool = False
     complex_effect: str = ""
+    # Hashable view of affix_pools for O(1) pool membership checks
+    pool_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    # base_value parsed once for rolling: (primary,) or (primary, secondary) for dual-stat
+    rolled_bases: Tuple[float, ...] = field(default=(0.0,), init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.affix_id:
             raise ValueError("affix_id cannot be empty")
         if not self.stat_affected:
             raise ValueError("stat_affected cannot be empty")
+        self.pool_set = frozenset(self.affix_pools)
+        self.rolled_bases = parse_rolled_bases(self.base_value)
         
         # Validate dual_stat flag
         # Ensure base_value is treated as string for this check to avoid TypeError with floats
@@ -196,7 +203,7 @@ class QualityTier:
     def get_probability_for_rarity(self, rarity: Rarity) -> int:
         return getattr(self, rarity.value.lower())
 
-@dataclass
+@dataclass(slots=True)
 class EffectDefinition:
     """Strongly-typed model for effect data."""
     effect_id: str
@@ -217,7 +224,7 @@ class EffectDefinition:
         if not self.name:
             raise ValueError("name cannot be empty")
 
-@dataclass
+@dataclass(slots=True)
 class SkillDefinition:
     """Strongly-typed model for skill data."""
     skill_id: str
@@ -289,7 +296,7 @@ class DataValidationError(ValueError):
 def validate_entity_stats_are_valid(stats_list: List[str]) -> None:
     """Validate that all stat names are valid EntityStats attributes."""
     from src.core.models import EntityStats
-    valid_stats = set(vars(EntityStats(0, 1)).keys())
+    valid_stats = {f.name for f in fields(EntityStats)}
     for stat_name in stats_list:
         if stat_name and stat_name not in valid_stats:
             raise DataValidationError(
@@ -301,15 +308,56 @@ def validate_entity_stats_are_valid(stats_list: List[str]) -> None:
             )
 
 def parse_affix_pools(value: str) -> List[str]:
-    """Parse affix pools from pipe-separated string."""
+    """Parse affix pools from pipe-separated string, interning each pool name."""
     if isinstance(value, list):
-        return value
+        return [intern_str(pool) for pool in value]
     if not value or (isinstance(value, str) and value.strip() == ""):
         return []
     if isinstance(value, str):
-        return [pool.strip() for pool in value.split('|') if pool.strip()]
+        return [sys.intern(pool.strip()) for pool in value.split('|') if pool.strip()]
     return []
 
+def parse_rolled_bases(base_value: Any) -> Tuple[float, ...]:
+    """Parse an affix base_value into the float bases used when rolling.
+
+    A "primary;secondary" string yields two bases, anything else one.
+    Non-numeric values fall back to 0.0.
+    """
+    if isinstance(base_value, str) and ';' in base_value:
+        parts = base_value.split(';')
+        if len(parts) == 2:
+            try:
+                return (float(parts[0]), float(parts[1]))
+            except ValueError:
+                return (0.0, 0.0)
+    try:
+        return (float(base_value),)
+    except ValueError:
+        return (0.0,)
+
+def intern_str(value: Any) -> Any:
+    """Intern repeated string values so duplicates share one object.
+
+    Columns like stat_affected or archetype hold a handful of distinct values
+    across many rows; interning them saves memory and makes equality checks
+    downstream a pointer compare. Non-string values are returned unchanged.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+def _coerce(raw_data: Dict[str, Any], key: str, cast: Callable[[Any], Any], default: Any) -> Any:
+    """Cast an optional field with a single lookup, falling back to default when empty.
+
+    Values already cast by the schema validators are passed through as-is.
+    """
+    value = raw_data.get(key)
+    if not value:
+        return default
+    if value.__class__ is cast:
+        return value
+    return cast(value)
+
 def normalize_enum(enum_cls: Type[T], value: str, default: Optional[T] = None) -> T:
     """Helper to fuzzy-match strings to Enum values (case-insensitive)."""
     if not value:
@@ -360,19 +408,22 @@ def normalize_enum(enum_cls: Type[T], value: str, default: Optional[T] = None) -
 
 # ========== Hydration Functions ==========
 
+def _normalize_trigger_event(value: str) -> TriggerEvent:
+    return normalize_enum(TriggerEvent, value)
+
 def hydrate_affix_definition(raw_data: Dict[str, Any]) -> AffixDefinition:
     return AffixDefinition(
         affix_id=raw_data['affix_id'],
-        stat_affected=raw_data['stat_affected'],
-        mod_type=raw_data['mod_type'],
+        stat_affected=intern_str(raw_data['stat_affected']),
+        mod_type=intern_str(raw_data['mod_type']),
         base_value=raw_data['base_value'],
         description=raw_data['description'],
         affix_pools=parse_affix_pools(raw_data.get('affix_pools', '')),
-        trigger_event=normalize_enum(TriggerEvent, raw_data['trigger_event']) if raw_data.get('trigger_event') else None,
-        proc_rate=float(raw_data['proc_rate']) if raw_data.get('proc_rate') else 0.0,
-        trigger_result=raw_data.get('trigger_result', ''),
-        trigger_duration=float(raw_data['trigger_duration']) if raw_data.get('trigger_duration') else 10.0,
-        stacks_max=int(raw_data['stacks_max']) if raw_data.get('stacks_max') else 1,
+        trigger_event=_coerce(raw_data, 'trigger_event', _normalize_trigger_event, None),
+        proc_rate=_coerce(raw_data, 'proc_rate', float, 0.0),
+        trigger_result=intern_str(raw_data.get('trigger_result', '')),
+        trigger_duration=_coerce(raw_data, 'trigger_duration', float, 10.0),
+        stacks_max=_coerce(raw_data, 'stacks_max', int, 1),
         dual_stat=bool(raw_data.get('dual_stat', False)),
         scaling_power=bool(raw_data.get('scaling_power', False)),
         complex_effect=raw_data.get('complex_effect', '')
@@ -392,8 +443,8 @@ def hydrate_item_template(raw_data: Dict[str, Any]) -> ItemTemplate:
         rarity=normalize_enum(Rarity, raw_data['rarity']),
         affix_pools=parse_affix_pools(raw_data.get('affix_pools', '')),
         implicit_affixes=implicit_affixes,
-        num_random_affixes=int(raw_data['num_random_affixes']) if raw_data.get('num_random_affixes') else 0,
-        default_attack_skill=raw_data.get('default_attack_skill') or None # <--- NEW
+        num_random_affixes=_coerce(raw_data, 'num_random_affixes', int, 0),
+        default_attack_skill=intern_str(raw_data.get('default_attack_skill') or None) # <--- NEW
     )
 
 def hydrate_quality_tier(raw_data: Dict[str, Any]) -> QualityTier:
@@ -402,12 +453,12 @@ def hydrate_quality_tier(raw_data: Dict[str, Any]) -> QualityTier:
         tier_name=raw_data['tier_name'],
         min_range=int(raw_data['min_range']),
         max_range=int(raw_data['max_range']),
-        common=int(raw_data.get('Common', 0)) if raw_data.get('Common') else 0,
-        uncommon=int(raw_data.get('Uncommon', 0)) if raw_data.get('Uncommon') else 0,
-        rare=int(raw_data.get('Rare', 0)) if raw_data.get('Rare') else 0,
-        epic=int(raw_data.get('Epic', 0)) if raw_data.get('Epic') else 0,
-        legendary=int(raw_data.get('Legendary', 0)) if raw_data.get('Legendary') else 0,
-        mythic=int(raw_data.get('Mythic', 0)) if raw_data.get('Mythic') else 0
+        common=_coerce(raw_data, 'Common', int, 0),
+        uncommon=_coerce(raw_data, 'Uncommon', int, 0),
+        rare=_coerce(raw_data, 'Rare', int, 0),
+        epic=_coerce(raw_data, 'Epic', int, 0),
+        legendary=_coerce(raw_data, 'Legendary', int, 0),
+        mythic=_coerce(raw_data, 'Mythic', int, 0)
     )
 
 def hydrate_effect_definition(raw_data: Dict[str, Any]) -> EffectDefinition:
@@ -416,13 +467,13 @@ def hydrate_effect_definition(raw_data: Dict[str, Any]) -> EffectDefinition:
         name=raw_data['name'],
         type=normalize_enum(EffectType, raw_data['type']),
         description=raw_data['description'],
-        max_stacks=int(raw_data['max_stacks']) if raw_data.get('max_stacks') else 1,
-        tick_rate=float(raw_data['tick_rate']) if raw_data.get('tick_rate') else 1.0,
-        damage_per_tick=float(raw_data['damage_per_tick']) if raw_data.get('damage_per_tick') else 0.0,
-        stat_multiplier=float(raw_data['stat_multiplier']) if raw_data.get('stat_multiplier') else 0.0,
-        stat_add=float(raw_data['stat_add']) if raw_data.get('stat_add') else 0.0,
-        visual_effect=raw_data.get('visual_effect', ''),
-        duration=float(raw_data['duration']) if raw_data.get('duration') else 10.0
+        max_stacks=_coerce(raw_data, 'max_stacks', int, 1),
+        tick_rate=_coerce(raw_data, 'tick_rate', float, 1.0),
+        damage_per_tick=_coerce(raw_data, 'damage_per_tick', float, 0.0),
+        stat_multiplier=_coerce(raw_data, 'stat_multiplier', float, 0.0),
+        stat_add=_coerce(raw_data, 'stat_add', float, 0.0),
+        visual_effect=intern_str(raw_data.get('visual_effect', '')),
+        duration=_coerce(raw_data, 'duration', float, 10.0)
     )
 
 def hydrate_skill_definition(raw_data: Dict[str, Any]) -> SkillDefinition:
@@ -431,34 +482,34 @@ def hydrate_skill_definition(raw_data: Dict[str, Any]) -> SkillDefinition:
         name=raw_data['name'],
         damage_type=normalize_enum(DamageType, raw_data['damage_type']),
         damage_multiplier=float(raw_data.get('damage_multiplier', 1.0)), # <--- NEW
-        hits=int(raw_data['hits']) if raw_data.get('hits') else 1,
+        hits=_coerce(raw_data, 'hits', int, 1),
         description=raw_data.get('description', ''),
-        resource_cost=float(raw_data['resource_cost']) if raw_data.get('resource_cost') else 0.0,
-        cooldown=float(raw_data['cooldown']) if raw_data.get('cooldown') else 0.0,
-        trigger_event=normalize_enum(TriggerEvent, raw_data['trigger_event']) if raw_data.get('trigger_event') else None,
-        proc_rate=float(raw_data['proc_rate']) if raw_data.get('proc_rate') else 0.0,
-        trigger_result=raw_data.get('trigger_result', ''),
-        trigger_duration=float(raw_data['trigger_duration']) if raw_data.get('trigger_duration') else 10.0,
-        stacks_max=int(raw_data['stacks_max']) if raw_data.get('stacks_max') else 1
+        resource_cost=_coerce(raw_data, 'resource_cost', float, 0.0),
+        cooldown=_coerce(raw_data, 'cooldown', float, 0.0),
+        trigger_event=_coerce(raw_data, 'trigger_event', _normalize_trigger_event, None),
+        proc_rate=_coerce(raw_data, 'proc_rate', float, 0.0),
+        trigger_result=intern_str(raw_data.get('trigger_result', '')),
+        trigger_duration=_coerce(raw_data, 'trigger_duration', float, 10.0),
+        stacks_max=_coerce(raw_data, 'stacks_max', int, 1)
     )
 
 def hydrate_loot_entry(raw_data: Dict[str, Any]) -> LootTableEntry:
     return LootTableEntry(
-        table_id=raw_data['table_id'],
+        table_id=intern_str(raw_data['table_id']),
         entry_type=normalize_enum(LootEntryType, raw_data['entry_type']),
-        entry_id=raw_data['entry_id'],
+        entry_id=intern_str(raw_data['entry_id']),
         weight=int(raw_data['weight']),
-        min_count=int(raw_data['min_count']) if raw_data.get('min_count') else 1,
-        max_count=int(raw_data['max_count']) if raw_data.get('max_count') else 1,
-        drop_chance=float(raw_data['drop_chance']) if raw_data.get('drop_chance') else 1.0
+        min_count=_coerce(raw_data, 'min_count', int, 1),
+        max_count=_coerce(raw_data, 'max_count', int, 1),
+        drop_chance=_coerce(raw_data, 'drop_chance', float, 1.0)
     )
 
 def hydrate_entity_template(raw_data: Dict[str, Any]) -> EntityTemplate:
     return EntityTemplate(
         entity_id=raw_data['entity_id'],
         name=raw_data['name'],
-        archetype=raw_data.get('archetype', 'Unit'),
-        level=int(raw_data['level']) if raw_data.get('level') else 1,
+        archetype=intern_str(raw_data.get('archetype', 'Unit')),
+        level=_coerce(raw_data, 'level', int, 1),
         rarity=normalize_enum(Rarity, raw_data.get('rarity') or 'Common', default=Rarity.COMMON),
         base_health=float(raw_data['base_health']),
         base_damage=float(raw_data['base_damage']),
@@ -466,7 +517,7 @@ def hydrate_entity_template(raw_data: Dict[str, Any]) -> EntityTemplate:
         crit_chance=float(raw_data.get('crit_chance', 0.0)),
         attack_speed=float(raw_data.get('attack_speed', 1.0)),
         equipment_pools=parse_affix_pools(raw_data.get('equipment_pools', '')),
-        loot_table_id=raw_data.get('loot_table_id', ''),
+        loot_table_id=intern_str(raw_data.get('loot_table_id', '')),
         description=raw_data.get('description', ''),
         portrait_path=raw_data.get('portrait_path', '')  # New field mapping
     )
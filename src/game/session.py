@@ -1,17 +1,14 @@
 import logging
 import sys
-from typing import Optional, List, Dict, Any
+from collections import deque
+from typing import Optional, List, Dict, Any, Deque
 
 from src.game.enums import GameState
 from src.core.models import Entity, Item
 from src.core.inventory import Inventory
 from src.core.factory import EntityFactory
-from src.core.loot_manager import LootManager
 from src.core.rng import RNG
 from src.data.game_data_provider import GameDataProvider
-from src.simulation.combat_simulation import SimulationRunner
-from src.combat.engine import CombatEngine
-from src.core.state import StateManager
 from src.core.events import EventBus, LootDroppedEvent
 
 logger = logging.getLogger(__name__)
@@ -26,7 +23,7 @@ if not logger.handlers:
     logger.setLevel(logging.INFO)
 
 # Hardcoded campaign for Slice 1
-CAMPAIGN_STAGES = [
+CAMPAIGN_STAGES = (
     "goblin_grunt",       # Stage 1.1
     "enemy_warrior_grunt",       # Stage 1.2
     "enemy_rogue_thief",       # Stage 1.3
@@ -38,7 +35,8 @@ CAMPAIGN_STAGES = [
     "enemy_warrior_boss",  # Stage 3.1
     "enemy_rouge_boss",  # Stage 3.2
     "enemy_mage_boss"  # Stage 3.3
-]
+)
+_NUM_STAGES = len(CAMPAIGN_STAGES)
 
 class GameSession:
     """
@@ -60,7 +58,8 @@ class GameSession:
 
         # Last run analytics
         self.last_report: Dict[str, Any] = {}
-        self.combat_log: List[Dict[str, Any]] = []  # History of combat reports
+        # History of combat reports; only the last 10 are kept to bound memory
+        self.combat_log: Deque[Dict[str, Any]] = deque(maxlen=10)
 
     def start_new_run(self, archetype_id: str, seed: int) -> None:
         """Initialize a new run with a specific archetype and seed."""
@@ -91,6 +90,14 @@ class GameSession:
             logger.error(f"Invalid state for combat: {self.state}")
             return False
 
+        # Combat-only systems are imported on first combat rather than at
+        # module load, keeping lobby/preparation (and dashboard reloads) light
+        from src.simulation.combat_simulation import SimulationRunner
+        from src.combat.engine import CombatEngine
+        from src.core.state import StateManager
+        from src.core.loot_manager import LootManager
+        from src.handlers.loot_handler import LootHandler
+
         self.state = GameState.COMBAT
         try:
             # 1. Deterministic RNG for this specific stage
@@ -136,18 +143,12 @@ class GameSession:
 
             # 7. Run Simulation
             # We manually attach the LootHandler here since SimulationRunner constructor might vary
-            from src.handlers.loot_handler import LootHandler
             loot_handler = LootHandler(event_bus, state_manager, loot_manager)
 
             runner = SimulationRunner(combat_engine, state_manager, event_bus, rng, provider=self.provider)
 
             # Add entities to runner (Vital for attack timers)
-            runner.entities.append(self.player)
-            runner.entities.append(enemy)
-
-            # Initialize attack timers manually
-            runner.attack_timers[self.player.id] = 1.0 / max(0.1, self.player.final_stats.attack_speed)
-            runner.attack_timers[enemy.id] = 1.0 / max(0.1, enemy.final_stats.attack_speed)
+            runner.set_entities([self.player, enemy])
 
             # Run for max 60 seconds or until death
             runner.run_simulation(duration=60.0)
@@ -155,10 +156,8 @@ class GameSession:
             # Store report for UI
             self.last_report = runner.get_simulation_report()
             # Add to combat history for weapon comparison analytics
+            # (the deque drops the oldest report once full)
             self.combat_log.append(self.last_report)
-            # Keep only last 10 combats to avoid memory issues
-            if len(self.combat_log) > 10:
-                self.combat_log.pop(0)
 
         except Exception as e:
             self.state = GameState.PREPARATION
@@ -198,7 +197,7 @@ class GameSession:
         """Proceed to next stage."""
         if self.state == GameState.VICTORY:
             self.current_stage += 1
-            if self.current_stage >= len(CAMPAIGN_STAGES):
+            if self.current_stage >= _NUM_STAGES:
                 # Loop or End? For now, loop with higher difficulty (implied)
                 # or just cap it. Let's cap it.
                 pass
@@ -207,8 +206,7 @@ class GameSession:
 
     def _get_current_enemy_id(self) -> str:
         """Get enemy ID for current stage, looping if necessary."""
-        idx = self.current_stage % len(CAMPAIGN_STAGES)
-        return CAMPAIGN_STAGES[idx]
+        return CAMPAIGN_STAGES[self.current_stage % _NUM_STAGES]
 
     def _get_item_generator(self, rng: RNG):
         from src.utils.item_generator import ItemGenerator
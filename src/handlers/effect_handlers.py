@@ -2,6 +2,8 @@
 
 import logging
 from abc import ABC, abstractmethod
+from string import Formatter
+from typing import Sequence, Tuple
 from src.core.events import EventBus, OnHitEvent
 from src.core.state import StateManager
 from src.core.models import DamageOnHitConfig
@@ -49,6 +51,16 @@ def create_poison_handler(event_bus, state_manager, rng: RNG):
     return DamageOnHitHandler(POISON_CONFIG, event_bus, state_manager, rng)
 
 
+def create_dot_handler(event_bus, state_manager, rng: RNG, configs=(BLEED_CONFIG, POISON_CONFIG)):
+    """Create one CompositeDoTHandler covering several DoT effects.
+
+    Args:
+        rng: RNG instance (required)
+        configs: Effect configurations to apply (defaults to Bleed and Poison)
+    """
+    return CompositeDoTHandler(configs, event_bus, state_manager, rng)
+
+
 class EffectHandler(ABC):
     """Base class for effect handlers that respond to combat events.
 
@@ -56,6 +68,8 @@ class EffectHandler(ABC):
     effect application logic.
     """
 
+    __slots__ = ('event_bus', 'state_manager', 'rng')
+
     def __init__(self, event_bus: EventBus, state_manager: StateManager, rng: RNG):
         """Initialize the effect handler.
 
@@ -79,6 +93,33 @@ class EffectHandler(ABC):
         pass
 
 
+def _split_target_template(template: str) -> Tuple[str, ...]:
+    """Split a display message template into the literal text around {target}.
+
+    The result joined with the target string equals
+    ``template.format(target=...)``: ``{{``/``}}`` escapes are resolved
+    and ``{target}`` may appear any number of times.
+
+    Raises:
+        ValueError: If the template uses any field other than a plain
+            {target}, or is not a valid format string
+    """
+    parts = []
+    text = ""
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        text += literal
+        if field_name is None:
+            continue  # Escaped braces arrive as separate literal chunks
+        if field_name != "target" or format_spec or conversion:
+            raise ValueError(
+                f"display_message {template!r} may only use the {{target}} placeholder"
+            )
+        parts.append(text)
+        text = ""
+    parts.append(text)
+    return tuple(parts)
+
+
 class DamageOnHitHandler(EffectHandler):
     """Generic handler for damage-over-time effects applied on hit events.
 
@@ -86,6 +127,11 @@ class DamageOnHitHandler(EffectHandler):
     Enables adding new DoT effects without code changes.
     """
 
+    __slots__ = (
+        'config', '_proc_rate', '_debuff_name', '_stacks_to_add', '_duration',
+        '_msg_parts', '_msg_target', '_random', '_apply_debuff',
+    )
+
     def __init__(self, config: DamageOnHitConfig, event_bus: EventBus, state_manager: StateManager, rng: RNG):
         """Initialize the generic damage-on-hit handler.
 
@@ -98,6 +144,21 @@ class DamageOnHitHandler(EffectHandler):
         """
         super().__init__(event_bus, state_manager, rng)
         self.config = config
+        # Hoist config fields and bound methods used on every hit
+        self._proc_rate = config.proc_rate
+        self._debuff_name = config.debuff_name
+        self._stacks_to_add = config.stacks_to_add
+        self._duration = config.duration
+        # Split the message template around {target} once, so a proc only
+        # joins strings instead of running str.format
+        if config.display_message:
+            self._msg_parts = _split_target_template(config.display_message)
+            self._msg_target = 'name'
+        else:
+            self._msg_parts = (f"{config.debuff_name} proc'd on ", "!")
+            self._msg_target = 'id'
+        self._random = rng.random
+        self._apply_debuff = state_manager.apply_debuff
         self.setup_subscriptions()
 
     def setup_subscriptions(self):
@@ -112,29 +173,85 @@ class DamageOnHitHandler(EffectHandler):
             rng: RNG passed explicitly (per PR6 specification)
         """
         # Use instance RNG (already validated in __init__)
-        rng_value = self.rng.random()
-        if rng_value < self.config.proc_rate:
-            # Display message if configured
-            if self.config.display_message:
-                target_name = getattr(event.defender, 'name', event.defender.id)
-                message = self.config.display_message.format(target=target_name)
-                logger.debug("Effect proc: %s", message)
-            else:
-                # Default message format
-                message = f"{self.config.debuff_name} proc'd on {event.defender.id}!"
+        if self._random() < self._proc_rate:
+            defender = event.defender
+            defender_id = defender.id
+            # Only build the display message when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                if self._msg_target == 'name':
+                    target = getattr(defender, 'name', defender_id)
+                else:
+                    target = defender_id
+                message = str(target).join(self._msg_parts)
                 logger.debug("Effect proc: %s", message)
 
-            self.state_manager.apply_debuff(
-                entity_id=event.defender.id,
-                debuff_name=self.config.debuff_name,
-                stacks_to_add=self.config.stacks_to_add,
-                max_duration=self.config.duration
+            self._apply_debuff(
+                entity_id=defender_id,
+                debuff_name=self._debuff_name,
+                stacks_to_add=self._stacks_to_add,
+                max_duration=self._duration
             )
 
 
+class CompositeDoTHandler(EffectHandler):
+    """Applies several damage-on-hit effects from a single OnHitEvent subscription.
+
+    Equivalent to one DamageOnHitHandler per config, but the event bus
+    dispatches once per hit and the configs are walked in a local loop.
+    Each config still gets its own proc roll, drawn in config order.
+    """
+
+    __slots__ = ('configs', '_effects', '_random', '_apply_debuff')
+
+    def __init__(self, configs: Sequence[DamageOnHitConfig], event_bus: EventBus,
+                 state_manager: StateManager, rng: RNG):
+        """Initialize the composite damage-on-hit handler.
+
+        Args:
+            configs: Effect configurations to roll on every hit
+            event_bus: The event bus to subscribe to
+            state_manager: The state manager for applying effects
+            rng: Random number generator for deterministic testing.
+                 Must not be None - all randomness must be explicit.
+        """
+        super().__init__(event_bus, state_manager, rng)
+        self.configs = tuple(configs)
+        self._effects = tuple(
+            (c.proc_rate, c.debuff_name, c.stacks_to_add, c.duration) for c in self.configs
+        )
+        self._random = rng.random
+        self._apply_debuff = state_manager.apply_debuff
+        self.setup_subscriptions()
+
+    def setup_subscriptions(self):
+        """Set up a single event subscription for all configured effects."""
+        self.event_bus.subscribe(OnHitEvent, self.handle_on_hit)
+
+    def handle_on_hit(self, event: OnHitEvent) -> None:
+        """Handle an OnHitEvent by rolling each configured effect.
+
+        Args:
+            event: The hit event that occurred
+        """
+        random = self._random
+        defender_id = event.defender.id
+        for proc_rate, debuff_name, stacks_to_add, duration in self._effects:
+            if random() < proc_rate:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Effect proc: %s procd on %s", debuff_name, defender_id)
+                self._apply_debuff(
+                    entity_id=defender_id,
+                    debuff_name=debuff_name,
+                    stacks_to_add=stacks_to_add,
+                    max_duration=duration
+                )
+
+
 class BleedHandler(EffectHandler):
     """Handles Bleed DoT application on hit events."""
 
+    __slots__ = ('proc_rate',)
+
     def __init__(self, event_bus: EventBus, state_manager: StateManager, rng: RNG, proc_rate: float = 0.5):
         """Initialize the Bleed handler.
 
@@ -162,7 +279,8 @@ class BleedHandler(EffectHandler):
         """
         rng_value = self.rng.random()
         if rng_value < self.proc_rate:
-            logger.debug("Effect proc: Bleed procd on %s", event.defender.id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Effect proc: Bleed procd on %s", event.defender.id)
             self.state_manager.apply_debuff(
                 entity_id=event.defender.id,
                 debuff_name="Bleed",
@@ -174,6 +292,8 @@ class BleedHandler(EffectHandler):
 class PoisonHandler(EffectHandler):
     """Handles Poison DoT application on hit events."""
 
+    __slots__ = ('proc_rate',)
+
     def __init__(self, event_bus: EventBus, state_manager: StateManager, rng: RNG, proc_rate: float = 0.33):
         """Initialize the Poison handler.
 
@@ -201,7 +321,8 @@ class PoisonHandler(EffectHandler):
         """
         rng_value = self.rng.random()
         if rng_value < self.proc_rate:
-            logger.debug("Effect proc: Poison procd on %s", event.defender.id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Effect proc: Poison procd on %s", event.defender.id)
             self.state_manager.apply_debuff(
                 entity_id=event.defender.id,
                 debuff_name="Poison",
@@ -5,7 +5,7 @@ with deterministic seeding and comprehensive result collection.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable
 from src.core.models import Entity
 from src.core.state import StateManager
 from src.core.events import EventBus, OnHitEvent
@@ -64,13 +64,16 @@ class SimulationBatchRunner:
     - Statistical aggregation
     """
     
-    def __init__(self, batch_id: Optional[str] = None):
+    def __init__(self, batch_id: Optional[str] = None, rng_factory: Callable[[int], RNG] = RNG):
         """Initialize the batch runner.
         
         Args:
             batch_id: Optional identifier for this batch
+            rng_factory: Builds the RNG for each run from its seed. Pass
+                BatchedRNG to serve rolls from pre-generated PCG64 blocks.
         """
         self.batch_id = batch_id or "default_batch"
+        self.rng_factory = rng_factory
     
     def run_batch(
         self,
@@ -108,7 +111,7 @@ class SimulationBatchRunner:
         for i in range(iterations):
             # 1. Create deterministic seed for this specific run
             run_seed = base_seed + i
-            rng = RNG(run_seed)
+            rng = self.rng_factory(run_seed)
             
             # 2. Inject RNG into all components (PR-P1S2 compliance)
             combat_engine = CombatEngine(rng=rng)
@@ -6,7 +6,7 @@ validating balance and performance.
 
 import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from collections import defaultdict
 from src.core.rng import RNG
 
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 
 # Import for runtime use
 from src.core.events import OnHitEvent, DamageTickEvent
+from src.core.skills import Skill
 from src.core.loot_manager import LootManager
 from src.handlers.loot_handler import LootHandler
 from src.core.events import LootDroppedEvent, OnSkillUsedEvent
@@ -316,6 +317,8 @@ class SimulationRunner:
         self.attack_timers: Dict[str, float] = {}
         self.simulation_time: float = 0.0
         self.is_running: bool = False
+        # skill_id -> (SkillDefinition, runtime Skill) built from it
+        self._runtime_skills: Dict[str, Tuple[Any, Skill]] = {}
 
         # Initialize Loot Handler if manager is provided
         if self.loot_manager:
@@ -373,6 +376,25 @@ class SimulationRunner:
             speed = max(0.1, entity.final_stats.attack_speed)
             self.attack_timers[entity.id] = 1.0 / speed
 
+    def set_entities(self, entities: List["Entity"]) -> None:
+        """Replace the simulated entities and initialize all attack timers at once.
+
+        Equivalent to add_entity for each entity on a fresh runner, with the
+        timers built in a single pass.
+
+        Args:
+            entities: Entities taking part in the simulation
+        """
+        self.entities = list(entities)
+        is_registered = self.state_manager.is_registered
+        for entity in self.entities:
+            if not is_registered(entity.id):
+                self.state_manager.register_entity(entity)
+        self.attack_timers = {
+            entity.id: 1.0 / max(0.1, entity.final_stats.attack_speed)
+            for entity in self.entities
+        }
+
     def remove_entity(self, entity_id: str) -> None:
         """Remove an entity from the simulation.
 
@@ -399,6 +421,31 @@ class SimulationRunner:
         ]
         return self.rng.choice(living_entities) if living_entities else None
 
+    def _get_attack_skill(self, entity: "Entity") -> Skill:
+        """Resolve the runtime Skill for an entity's default attack.
+
+        Only the runtime Skill is cached, keyed on its SkillDefinition, so
+        repeated attacks reuse one Skill instead of converting the definition
+        every swing. A replaced definition gets a fresh Skill. The engine
+        builds the skill's trigger plan on each use; nothing else is cached.
+        """
+        # 1. Determine Skill ID from Weapon and look up the definition,
+        # falling back to generic unarmed
+        skills = self.provider.skills
+        skill_def = skills.get(entity.get_default_attack_skill_id())
+        if not skill_def:
+            skill_def = skills.get("attack_unarmed")
+        if not skill_def:
+            # Emergency fallback if data is totally missing
+            return Skill(id="fallback", name="Basic Attack")
+
+        # 2. Reuse the runtime Skill built for this definition
+        cached = self._runtime_skills.get(skill_def.skill_id)
+        if cached is None or cached[0] is not skill_def:
+            cached = (skill_def, create_runtime_skill(skill_def))
+            self._runtime_skills[skill_def.skill_id] = cached
+        return cached[1]
+
     def update(self, delta_time: float, force_update: bool = False) -> None:
         """Update the simulation by the given time delta.
 
@@ -413,44 +460,30 @@ class SimulationRunner:
             self.simulation_time += delta_time
 
         # Update attack timers and process attacks
+        attack_timers = self.attack_timers
+        get_state = self.state_manager.get_state
         for entity in self.entities[:]:  # Copy list to avoid modification during iteration
-            if not self.state_manager.get_state(entity.id).is_alive:
+            entity_id = entity.id
+            if not get_state(entity_id).is_alive:
                 continue
 
             # Only update attack timers for entities that have them (i.e., can attack)
-            if entity.id in self.attack_timers:
-                self.attack_timers[entity.id] -= delta_time
-
-                # Check if it's time to attack
-                if self.attack_timers[entity.id] <= 0:
-                    target = self.get_random_target(entity.id)
-                    if target:
-                        # --- DYNAMIC SKILL LOGIC ---
-                        # 1. Determine Skill ID from Weapon
-                        skill_id = entity.get_default_attack_skill_id()
-
-                        # 2. Look up definition
-                        skill_def = self.provider.skills.get(skill_id)
-
-                        # 3. Fallback Logic
-                        if not skill_def:
-                            # Try generic unarmed
-                            skill_def = self.provider.skills.get("attack_unarmed")
-
-                        # 4. Create Runtime Skill
-                        if skill_def:
-                            runtime_skill = create_runtime_skill(skill_def)
-                        else:
-                            # Emergency fallback if data is totally missing
-                            from src.core.skills import Skill
-                            runtime_skill = Skill(id="fallback", name="Basic Attack")
-
-                        # 5. Execute Skill via Engine
-                        self.combat_engine.process_skill_use(entity, target, runtime_skill, self.event_bus, self.state_manager)
-                        # ---------------------------
-
-                        # Reset attack timer
-                        self.attack_timers[entity.id] = 1.0 / entity.final_stats.attack_speed
+            timer = attack_timers.get(entity_id)
+            if timer is None:
+                continue
+            timer -= delta_time
+            attack_timers[entity_id] = timer
+
+            # Check if it's time to attack
+            if timer <= 0:
+                target = self.get_random_target(entity_id)
+                if target:
+                    # Execute the entity's default attack skill via the engine
+                    runtime_skill = self._get_attack_skill(entity)
+                    self.combat_engine.process_skill_use(entity, target, runtime_skill, self.event_bus, self.state_manager)
+
+                    # Reset attack timer
+                    attack_timers[entity_id] = 1.0 / entity.final_stats.attack_speed
 
         # Update DoT effects (PR4: centralized tick processing)
         self.state_manager.tick(delta_time, self.event_bus)
@@ -502,6 +535,7 @@ class SimulationRunner:
         """Reset the simulation state."""
         self.entities.clear()
         self.attack_timers.clear()
+        self._runtime_skills.clear()
         self.simulation_time = 0.0
         self.is_running = False
         self.state_manager.reset()
@@ -1,9 +1,10 @@
 import uuid
 import warnings
 from typing import Dict, List, Union, Optional, Any
+import numpy as np
 from src.core.models import Item, RolledAffix
 from src.core.rng import RNG
-from src.data.game_data_provider import GameDataProvider
+from src.data.game_data_provider import GameDataProvider, get_game_data_provider
 from src.data.typed_models import (
     AffixDefinition, ItemTemplate, QualityTier,
     hydrate_affix_definition, hydrate_item_template, hydrate_quality_tier
@@ -48,13 +49,21 @@ class ItemGenerator:
             ]
             self.affix_pools = game_data.get('affix_pools', {})  # NEW: legacy fallback
         else:
-            # Emergency fallback: Create provider automatically (maintained for existing code)
-            provider = GameDataProvider()
+            # Emergency fallback: Use the shared provider (maintained for existing code)
+            provider = get_game_data_provider()
             self.affix_defs = provider.get_affixes()
             self.item_templates = provider.get_items()
             self.quality_tiers = provider.get_quality_tiers()
             self.affix_pools = provider.get_affix_pools()  # NEW: auto-created provider
 
+        # Inverse index pool -> affix ids, each list in affix_defs order
+        self._pool_index: Dict[str, List[str]] = {}
+        self._affix_order: Dict[str, int] = {}
+        for position, (affix_id, affix) in enumerate(self.affix_defs.items()):
+            self._affix_order[affix_id] = position
+            for pool in affix.pool_set:
+                self._pool_index.setdefault(pool, []).append(affix_id)
+
         # Create RNG instance if not provided
         self.rng = rng if rng is not None else RNG()
 
@@ -105,6 +114,98 @@ class ItemGenerator:
             default_attack_skill=template.default_attack_skill
         )
 
+    def generate_batch(self, base_item_id: str, n: int) -> List[Item]:
+        """Generate ``n`` items of one base type with vectorized rolls.
+
+        Every roll for the batch (quality tier, quality, affix selection and
+        sub-quality) is derived from a single ``RNG.random_array`` block, so
+        the batch is deterministic for a seeded RNG. The roll stream differs
+        from calling ``generate`` ``n`` times.
+
+        Args:
+            base_item_id: Item template ID to generate
+            n: Number of items to generate
+
+        Returns:
+            List of generated items
+
+        Raises:
+            ValueError: If no quality tiers exist for the template's rarity
+        """
+        if n <= 0:
+            return []
+
+        template = self.item_templates[base_item_id]
+        item_rarity = template.rarity.value if hasattr(template.rarity, 'value') else template.rarity
+        slot_str = template.slot.value if hasattr(template.slot, 'value') else template.slot
+
+        rarity_key = item_rarity.lower()
+        possible_tiers = [
+            tier for tier in self.quality_tiers
+            if getattr(tier, rarity_key, 0) > 0
+        ]
+        if not possible_tiers:
+            raise ValueError(f"No quality tiers available for rarity: {item_rarity}")
+
+        implicit_ids = list(template.implicit_affixes)
+        possible_randoms = [
+            a for a in self._get_affix_pool(template.affix_pools) if a not in implicit_ids
+        ]
+        num_to_roll = min(template.num_random_affixes, len(possible_randoms))
+        # Each item has the same affix count; reserve two sub-rolls per affix
+        num_affixes = len(implicit_ids) + num_to_roll
+        num_keys = len(possible_randoms) if num_to_roll > 0 else 0
+
+        uniforms = self.rng.random_array((n, 2 + num_keys + 2 * num_affixes))
+
+        # Step 1: Quality tier by inverse CDF over the tier weights
+        cumulative = np.cumsum([getattr(tier, rarity_key) for tier in possible_tiers], dtype=float)
+        tier_idx = np.searchsorted(cumulative, uniforms[:, 0] * cumulative[-1], side='right')
+        tier_idx = np.minimum(tier_idx, len(possible_tiers) - 1)
+
+        # Step 2: Quality roll, uniform over each tier's inclusive range
+        min_range = np.array([tier.min_range for tier in possible_tiers])[tier_idx]
+        max_range = np.array([tier.max_range for tier in possible_tiers])[tier_idx]
+        quality_rolls = min_range + np.floor(
+            uniforms[:, 1] * (max_range - min_range + 1)
+        ).astype(np.int64)
+
+        # Step 3: Random affixes, a uniform k-subset per row via argsort of keys
+        if num_to_roll > 0:
+            keys = uniforms[:, 2:2 + num_keys]
+            selected_idx = np.argsort(keys, axis=1)[:, :num_to_roll].tolist()
+        else:
+            selected_idx = [()] * n
+
+        # Step 4: Sub-quality rolls in [0, quality_roll] for every affix slot
+        sub_rolls = np.floor(
+            uniforms[:, 2 + num_keys:] * (quality_rolls[:, None] + 1)
+        ).astype(np.int64).reshape(n, num_affixes, 2).tolist()
+
+        affix_defs = self.affix_defs
+        build = self._build_rolled_affix
+        tier_names = [possible_tiers[i].tier_name for i in tier_idx.tolist()]
+        items = []
+        for row, quality_roll in enumerate(quality_rolls.tolist()):
+            affix_ids = implicit_ids + [possible_randoms[i] for i in selected_idx[row]]
+            row_rolls = sub_rolls[row]
+            rolled_affixes = [
+                build(aid, affix_defs[aid], *row_rolls[slot])
+                for slot, aid in enumerate(affix_ids)
+            ]
+            items.append(Item(
+                instance_id=str(uuid.uuid4()),
+                base_id=base_item_id,
+                name=template.name,
+                slot=slot_str,
+                rarity=item_rarity,
+                quality_tier=tier_names[row],
+                quality_roll=quality_roll,
+                affixes=rolled_affixes,
+                default_attack_skill=template.default_attack_skill
+            ))
+        return items
+
     def _roll_quality_tier(self, rarity: str) -> Optional[QualityTier]:
         # Dynamic attribute access on QualityTier object (e.g., tier.common, tier.rare)
         rarity_key = rarity.lower()
@@ -198,57 +299,52 @@ class ItemGenerator:
     def _get_affix_pool(self, pools: List[str]) -> List[str]:
         if not pools:
             return []
-        target_pools = set(pools)
-        return [
-            affix_id for affix_id, affix in self.affix_defs.items()
-            if target_pools.intersection(set(affix.affix_pools))
-        ]
+        index = self._pool_index
+        if len(pools) == 1:
+            return list(index.get(pools[0], ()))
+        # Union across pools, restoring affix_defs order for stable RNG picks
+        matched = {affix_id for pool in pools for affix_id in index.get(pool, ())}
+        return sorted(matched, key=self._affix_order.__getitem__)
 
     def _roll_one_affix(self, affix_id: str, max_quality: int) -> RolledAffix:
         affix_def = self.affix_defs[affix_id]
-        base_value = affix_def.base_value # Object access
+        primary_roll = self.rng.randint(0, max_quality)
+        secondary_roll = (
+            self.rng.randint(0, max_quality) if len(affix_def.rolled_bases) == 2 else 0
+        )
+        return self._build_rolled_affix(affix_id, affix_def, primary_roll, secondary_roll)
 
-        # Check for dual-stat (contains ';')
-        if isinstance(base_value, str) and ';' in base_value:
-            parts = base_value.split(';')
-            if len(parts) == 2:
-                try:
-                    primary_base = float(parts[0])
-                    secondary_base = float(parts[1])
-                except ValueError:
-                     # Fallback for non-numeric base values
-                    primary_base = 0.0
-                    secondary_base = 0.0
-
-                primary_roll = self.rng.randint(0, max_quality)
-                secondary_roll = self.rng.randint(0, max_quality)
-
-                primary_final = primary_base * (primary_roll / 100.0)
-                secondary_final = secondary_base * (secondary_roll / 100.0)
-
-                return RolledAffix(
-                    affix_id=affix_id,
-                    stat_affected=affix_def.stat_affected,
-                    mod_type=affix_def.mod_type,
-                    description=affix_def.description,
-                    base_value=base_value,
-                    value=round(primary_final, 4),
-                    dual_value=round(secondary_final, 4),
-                    affix_pools="|".join(affix_def.affix_pools), # Convert list back to str for model
-                    dual_stat=str(affix_def.dual_stat) if affix_def.dual_stat else None,
-                    trigger_event=affix_def.trigger_event.value if affix_def.trigger_event else None,
-                    proc_rate=affix_def.proc_rate,
-                    trigger_result=affix_def.trigger_result
-                )
+    def _build_rolled_affix(self, affix_id: str, affix_def: AffixDefinition,
+                            primary_roll: int, secondary_roll: int) -> RolledAffix:
+        """Scale an affix's bases by already-drawn sub-quality rolls (percent)."""
+        base_value = affix_def.base_value # Object access
+        rolled_bases = affix_def.rolled_bases
+
+        # Dual-stat affixes carry two pre-parsed bases ("primary;secondary")
+        if len(rolled_bases) == 2:
+            primary_base, secondary_base = rolled_bases
+
+            primary_final = primary_base * (primary_roll / 100.0)
+            secondary_final = secondary_base * (secondary_roll / 100.0)
+
+            return RolledAffix(
+                affix_id=affix_id,
+                stat_affected=affix_def.stat_affected,
+                mod_type=affix_def.mod_type,
+                description=affix_def.description,
+                base_value=base_value,
+                value=round(primary_final, 4),
+                dual_value=round(secondary_final, 4),
+                affix_pools="|".join(affix_def.affix_pools), # Convert list back to str for model
+                dual_stat=str(affix_def.dual_stat) if affix_def.dual_stat else None,
+                trigger_event=affix_def.trigger_event.value if affix_def.trigger_event else None,
+                proc_rate=affix_def.proc_rate,
+                trigger_result=affix_def.trigger_result
+            )
 
         # Single stat logic
-        try:
-            val_float = float(base_value)
-        except ValueError:
-            val_float = 0.0
-
-        sub_quality_roll = self.rng.randint(0, max_quality)
-        final_value = val_float * (sub_quality_roll / 100.0)
+        val_float = rolled_bases[0]
+        final_value = val_float * (primary_roll / 100.0)
 
         return RolledAffix(
             affix_id=affix_id,
@@ -133,3 +133,60 @@ def test_rng_repr():
     
     rng_unseeded = RNG()
     assert repr(rng_unseeded) == "RNG(seed=None)"
+
+
+def test_rng_copy_continues_its_own_sequence():
+    """Test that a deep-copied RNG draws from its own copied generator."""
+    import copy
+
+    rng = RNG(seed=5)
+    rng.random()
+    clone = copy.deepcopy(rng)
+
+    assert [clone.random() for _ in range(5)] == [rng.random() for _ in range(5)]
+
+
+def test_batched_rng_determinism_across_refills():
+    """Test that BatchedRNG is repeatable and refills its block seamlessly."""
+    from src.core.rng import BatchedRNG
+
+    rng1 = BatchedRNG(seed=7, block_size=4)
+    rng2 = BatchedRNG(seed=7, block_size=4)
+
+    sequence1 = [rng1.random() for _ in range(10)]
+    sequence2 = [rng2.random() for _ in range(10)]
+
+    assert sequence1 == sequence2
+    assert len(set(sequence1)) == 10, "Refills must continue the stream, not repeat it"
+    assert all(isinstance(v, float) and 0.0 <= v < 1.0 for v in sequence1)
+
+
+def test_random_array_is_deterministic_per_seed():
+    """Test that random_array blocks repeat for the same seed on both RNG types."""
+    from src.core.rng import BatchedRNG
+
+    for rng_class in (RNG, BatchedRNG):
+        block1 = rng_class(seed=11).random_array((3, 4))
+        block2 = rng_class(seed=11).random_array((3, 4))
+
+        assert block1.shape == (3, 4)
+        assert block1.tolist() == block2.tolist()
+        assert ((block1 >= 0.0) & (block1 < 1.0)).all()
+
+
+def test_random_array_reuses_one_generator():
+    """Test that random_array keeps one PCG64 stream per RNG and copies continue it."""
+    import copy
+    from src.core.rng import BatchedRNG
+
+    for rng_class in (RNG, BatchedRNG):
+        rng = rng_class(seed=3)
+        first = rng.random_array(4)
+        generator = rng._np_gen
+
+        assert rng.random_array(4).tolist() != first.tolist()
+        assert rng._np_gen is generator
+
+        clone = copy.deepcopy(rng)
+        assert clone._np_gen is not generator
+        assert clone.random_array(6).tolist() == rng.random_array(6).tolist()
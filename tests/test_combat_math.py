@@ -12,7 +12,13 @@ from src.combat.combat_math import (
     apply_armor_mitigation,
     calculate_pierce_damage_formula,
     clamp_min_damage,
-    calculate_skill_effect_proc
+    calculate_skill_effect_proc,
+    mitigate_hit_damage,
+    mitigate_hit_damage_batch,
+    resolve_hit_damage,
+    quantize_damage,
+    dequantize_damage,
+    DAMAGE_FIXED_POINT_SCALE
 )
 
 
@@ -170,6 +176,72 @@ class TestCalculatePierceDamageFormula:
         assert calculate_pierce_damage_formula(0, 0) == 0
 
 
+class TestMitigateHitDamage:
+    """Test the scalar crit/mitigation kernel."""
+
+    def test_non_crit_uses_pierce_formula(self):
+        """Non-crits take the better of armor reduction and pierce."""
+        assert mitigate_hit_damage(100.0, 100, 30.0, 0.01, 2.0, 3, False) == (100.0, 70.0, 70.0)
+
+    def test_tier_two_crit_scales_pre_mitigation(self):
+        """Tier 2 crits multiply damage before armor."""
+        assert mitigate_hit_damage(50.0, 50, 50.0, 0.01, 2.0, 2, True) == (100.0, 50.0, 50.0)
+
+    def test_tier_three_crit_recomputes_from_resolved_base(self):
+        """Tier 3 crits recompute final damage from the integer base."""
+        pre, post, final = mitigate_hit_damage(50.5, 50, 50.0, 0.01, 2.0, 3, True)
+        assert pre == 101.0
+        assert post == 51.0
+        assert final == 50.0
+
+    def test_batch_matches_scalar_kernel(self):
+        """The array kernel agrees with the scalar kernel hit by hit."""
+        import numpy as np
+
+        is_crit = np.array([False, True, True, False])
+        for args in [(50.5, 50, 50.0, 0.01, 2.0, 3), (80.0, 80, 30.0, 0.2, 1.5, 2), (10.0, 10, 99.0, 0.0, 2.0, 1)]:
+            pre, post, final = mitigate_hit_damage_batch(*args, is_crit)
+            for index, crit in enumerate(is_crit.tolist()):
+                assert (pre[index], post[index], final[index]) == mitigate_hit_damage(*args, crit)
+
+
+class TestResolveHitDamage:
+    """Test the full post-roll damage kernel."""
+
+    def test_plain_hit_matches_mitigation(self):
+        """Without glancing or block, the kernel returns the mitigated damage."""
+        assert resolve_hit_damage(100.0, 100, 30.0, 0.01, 2.0, 1, False, False, False, 0.0) == (100.0, 70.0, 70.0, 0.0)
+
+    def test_glancing_then_block(self):
+        """Glancing halves damage before the block reduction is applied."""
+        assert resolve_hit_damage(100.0, 100, 30.0, 0.01, 2.0, 1, False, True, True, 10.0) == (100.0, 70.0, 25.0, 10.0)
+
+    def test_block_never_drops_below_one(self):
+        """Blocking more than the damage leaves the block floor of 1."""
+        assert resolve_hit_damage(20.0, 20, 15.0, 0.01, 2.0, 1, False, False, True, 50.0) == (20.0, 5.0, 1.0, 5.0)
+
+    @pytest.mark.parametrize("base,armor,pierce", [(100.0, 30.0, 0.01), (20.0, 50.0, 0.3), (5.0, 500.0, 0.0)])
+    def test_plain_hit_fast_path_matches_mitigation_kernel(self, base, armor, pierce):
+        """The inlined plain-hit path agrees with mitigate_hit_damage."""
+        pre, post, final = mitigate_hit_damage(base, base, armor, pierce, 2.0, 1, False)
+        assert resolve_hit_damage(base, base, armor, pierce, 2.0, 1, False, False, False, 0.0) == (pre, post, final, 0.0)
+
+
+class TestDamageQuantization:
+    """Test the int32 fixed-point damage helpers."""
+
+    def test_round_trip_within_one_step(self):
+        """Quantizing then dequantizing stays within half a fixed-point step."""
+        import numpy as np
+
+        damage = np.array([0.0, 1.0, 37.3, 1234.567], dtype=np.float32)
+        fixed = quantize_damage(damage)
+
+        assert fixed.dtype == np.int32
+        assert fixed[1] == DAMAGE_FIXED_POINT_SCALE
+        assert np.allclose(dequantize_damage(fixed), damage, atol=0.5 / DAMAGE_FIXED_POINT_SCALE)
+
+
 class TestClampMinDamage:
     """Test the clamp_min_damage function."""
 
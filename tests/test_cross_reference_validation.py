@@ -262,3 +262,96 @@ class TestDataValidationError:
         message = str(error)
         assert "Simple error" in message
         assert "Suggestions:" not in message
+
+
+class TestSharedProvider:
+    """Test the memoized shared provider accessor."""
+
+    def test_shared_provider_is_memoized(self):
+        """Repeated calls return the same instance until reloaded."""
+        from src.data.game_data_provider import (
+            get_game_data_provider, reload_game_data_provider, clear_game_data_provider
+        )
+
+        with patch('src.data.game_data_provider.GameDataProvider') as mock_provider:
+            mock_provider.side_effect = lambda: object()
+            clear_game_data_provider()
+            try:
+                first = get_game_data_provider()
+                assert get_game_data_provider() is first
+                assert mock_provider.call_count == 1
+
+                reloaded = reload_game_data_provider()
+                assert reloaded is not first
+                assert mock_provider.call_count == 2
+            finally:
+                clear_game_data_provider()
+
+    def test_concurrent_first_calls_build_one_provider(self):
+        """Threads racing on the first lookup share a single provider."""
+        import threading
+        import time
+        from src.data.game_data_provider import get_game_data_provider, clear_game_data_provider
+
+        def slow_provider():
+            time.sleep(0.01)  # Widen the race window
+            return object()
+
+        with patch('src.data.game_data_provider.GameDataProvider') as mock_provider:
+            mock_provider.side_effect = slow_provider
+            clear_game_data_provider()
+            try:
+                results = []
+                threads = [threading.Thread(target=lambda: results.append(get_game_data_provider()))
+                           for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                assert mock_provider.call_count == 1
+                assert all(result is results[0] for result in results)
+            finally:
+                clear_game_data_provider()
+
+
+class TestReverseIndexes:
+    """Test the precomputed pool and damage-type lookups."""
+
+    def _make_provider(self):
+        from src.data.typed_models import hydrate_affix_definition, hydrate_skill_definition
+
+        with patch.object(GameDataProvider, '_load_and_validate_data'):
+            provider = GameDataProvider()
+        provider.affixes = {
+            'damage_flat': hydrate_affix_definition({
+                'affix_id': 'damage_flat', 'stat_affected': 'base_damage', 'mod_type': 'flat',
+                'base_value': '5.0', 'description': '+5 Base Damage', 'affix_pools': 'weapon|ring'}),
+            'health_flat': hydrate_affix_definition({
+                'affix_id': 'health_flat', 'stat_affected': 'max_health', 'mod_type': 'flat',
+                'base_value': '20.0', 'description': '+20 Health', 'affix_pools': 'armor'}),
+        }
+        provider.skills = {
+            'basic_slash': hydrate_skill_definition({
+                'skill_id': 'basic_slash', 'name': 'Basic Slash', 'damage_type': 'Physical'}),
+            'burn_attack': hydrate_skill_definition({
+                'skill_id': 'burn_attack', 'name': 'Burn Attack', 'damage_type': 'Fire'}),
+        }
+        return provider
+
+    def test_find_affixes_by_pool(self):
+        """Indexed pool lookup returns every affix listing the pool."""
+        provider = self._make_provider()
+
+        assert provider.find_affixes_by_pool('weapon') == [provider.affixes['damage_flat']]
+        assert provider.find_affixes_by_pool('ring') == [provider.affixes['damage_flat']]
+        assert provider.find_affixes_by_pool('armor') == [provider.affixes['health_flat']]
+        assert provider.find_affixes_by_pool('no_such_pool') == []
+
+    def test_find_skills_by_damage_type(self):
+        """Indexed damage-type lookup groups skills by their damage type."""
+        provider = self._make_provider()
+
+        assert provider.find_skills_by_damage_type(DamageType.PHYSICAL) == [provider.skills['basic_slash']]
+        assert provider.find_skills_by_damage_type(DamageType.FIRE) == [provider.skills['burn_attack']]
+        assert provider.find_skills_by_damage_type(DamageType.COLD) == []
@@ -262,6 +262,19 @@ class TestSchemasValidators:
         with pytest.raises(ValueError):
             float_validator("not-a-float")
 
+    def test_optional_wrapper_defaults_blank_values(self):
+        """Test optional() returns the default for empty cells and validates the rest."""
+        from src.data.schemas import optional, int_validator
+
+        validate = optional(int_validator, 7)
+        assert validate("") == 7
+        assert validate("   ") == 7
+        assert validate(None) == 7
+        assert validate("3") == 3
+
+        with pytest.raises(ValueError):
+            validate("not-a-number")
+
 
 class TestComprehensiveSchemaValidators:
     """Comprehensive tests for all schema validators."""
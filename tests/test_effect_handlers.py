@@ -4,7 +4,9 @@ import pytest
 import logging
 from unittest.mock import MagicMock
 from src.core.models import DamageOnHitConfig
-from src.handlers.effect_handlers import DamageOnHitHandler, BleedHandler, PoisonHandler
+from src.handlers.effect_handlers import (
+    EffectHandler, DamageOnHitHandler, BleedHandler, PoisonHandler, CompositeDoTHandler
+)
 from src.core.events import EventBus, OnHitEvent
 from src.core.state import StateManager
 from tests.fixtures import make_entity, make_rng
@@ -44,6 +46,18 @@ class TestDamageOnHitConfig:
         assert config.display_message == ""  # Default value
 
 
+class TestEffectHandlerContract:
+    """Test the abstract EffectHandler base."""
+
+    def test_subclass_without_subscriptions_cannot_be_created(self):
+        """Test that forgetting setup_subscriptions fails at construction."""
+        class IncompleteHandler(EffectHandler):
+            __slots__ = ()
+
+        with pytest.raises(TypeError):
+            IncompleteHandler(MagicMock(), MagicMock(), rng=make_rng(1))
+
+
 class TestDamageOnHitHandler:
     """Test the generic DamageOnHitHandler class."""
 
@@ -197,6 +211,32 @@ class TestDamageOnHitHandler:
             max_duration=3.0
         )
 
+    @pytest.mark.parametrize("template", [
+        "{{Bleed}} on {target}!",
+        "{target} and {target} again",
+        "No placeholder at all",
+    ])
+    def test_display_message_matches_str_format(self, template, caplog):
+        """Test the pre-split message renders exactly like str.format."""
+        caplog.set_level(logging.DEBUG)
+        config = DamageOnHitConfig(debuff_name="Fx", proc_rate=1.0, duration=1.0,
+                                   damage_per_tick=1.0, display_message=template)
+        handler = DamageOnHitHandler(config, MagicMock(), MagicMock(), rng=make_rng(42))
+
+        handler.handle_on_hit(OnHitEvent(attacker=make_entity("attacker"),
+                                         defender=make_entity("defender", name="Target"),
+                                         damage_dealt=1.0, is_crit=False))
+
+        assert f"Effect proc: {template.format(target='Target')}" in caplog.text
+
+    @pytest.mark.parametrize("template", ["{other} hit", "{target!r}", "{target:>8}", "{0}", "broken {"])
+    def test_display_message_rejects_other_fields(self, template):
+        """Test templates using anything but a plain {target} fail at init."""
+        config = DamageOnHitConfig(debuff_name="Fx", proc_rate=1.0, duration=1.0,
+                                   damage_per_tick=1.0, display_message=template)
+        with pytest.raises(ValueError):
+            DamageOnHitHandler(config, MagicMock(), MagicMock(), rng=make_rng(42))
+
 
 class TestBleedHandlerLegacy:
     """Test the legacy BleedHandler for backward compatibility."""
@@ -274,3 +314,41 @@ class TestPoisonHandlerLegacy:
             stacks_to_add=1,
             max_duration=8.0
         )
+
+
+class TestCompositeDoTHandler:
+    """Test the fused multi-effect on-hit handler."""
+
+    def _configs(self, bleed_rate, poison_rate):
+        return [
+            DamageOnHitConfig(debuff_name="Bleed", proc_rate=bleed_rate, duration=5.0, damage_per_tick=2.5),
+            DamageOnHitConfig(debuff_name="Poison", proc_rate=poison_rate, duration=8.0, damage_per_tick=1.5),
+        ]
+
+    def test_composite_handler_subscribes_once(self):
+        """Test that all effects share a single OnHitEvent subscription."""
+        event_bus = MagicMock()
+        state_manager = MagicMock()
+
+        handler = CompositeDoTHandler(self._configs(0.5, 0.5), event_bus, state_manager, rng=make_rng(42))
+
+        event_bus.subscribe.assert_called_once_with(OnHitEvent, handler.handle_on_hit)
+
+    def test_composite_handler_applies_each_proc(self):
+        """Test that each configured effect is rolled and applied independently."""
+        event_bus = MagicMock()
+        state_manager = MagicMock()
+
+        handler = CompositeDoTHandler(self._configs(1.0, 0.0), event_bus, state_manager, rng=make_rng(42))
+
+        defender = make_entity("defender")
+        event = OnHitEvent(attacker=make_entity("attacker"), defender=defender, damage_dealt=10.0, is_crit=False)
+
+        handler.handle_on_hit(event)
+
+        state_manager.apply_debuff.assert_called_once_with(
+            entity_id=defender.id,
+            debuff_name="Bleed",
+            stacks_to_add=1,
+            max_duration=5.0
+        )
@@ -111,6 +111,9 @@ class TestEnemyPortraitUI:
 
         # Create minimal session for testing
         provider = GameDataProvider.__new__(GameDataProvider)
+        provider.entities = {}
+        provider.items = {}
+        provider.loot_tables = {}
         session = GameSession(provider)
 
         # Test that _get_current_enemy_id method exists and works
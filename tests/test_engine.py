@@ -170,7 +170,8 @@ class TestCombatEngineCalculateEffectiveDamage:
             'armor_reduction': 0.0,
             'pierce_ratio': 0.2
         }
-        assert breakdown == expected
+        assert breakdown._asdict() == expected
+        assert breakdown.final_damage == 100.0
 
     def test_damage_breakdown_with_armor(self):
         """Test detailed breakdown with armor."""
@@ -190,7 +191,7 @@ class TestCombatEngineCalculateEffectiveDamage:
             'armor_reduction': 80.0,
             'pierce_ratio': 0.3
         }
-        assert breakdown == expected
+        assert breakdown._asdict() == expected
 
     def test_damage_breakdown_negative_pre_pierce(self):
         """Test detailed breakdown when pre-pierce damage is negative."""
@@ -210,7 +211,7 @@ class TestCombatEngineCalculateEffectiveDamage:
             'armor_reduction': 120.0,
             'pierce_ratio': 0.1
         }
-        assert breakdown == expected
+        assert breakdown._asdict() == expected
 
 
 class TestCombatEngineValidateDamageCalculation:
@@ -359,6 +360,20 @@ class TestCombatEngineCriticalHits:
         assert ctx.was_crit is False
         assert ctx.final_damage == 100.0
 
+    def test_zero_chances_spend_no_rolls(self):
+        """Test a hit with no evasion, dodge, crit or block chance draws no randomness."""
+        attacker = Entity(id="attacker", base_stats=EntityStats(base_damage=100.0, crit_chance=0.0))
+        defender = Entity(id="defender", base_stats=EntityStats(armor=0.0))
+
+        rng = make_rng(42)
+        engine = CombatEngine(rng=rng)
+        state_manager = StateManager()
+        state_manager.add_entity(attacker)
+        state_manager.add_entity(defender)
+        engine.resolve_hit(attacker, defender, state_manager)
+
+        assert rng.random() == make_rng(42).random()
+
 
 class TestHitContext:
     """Test the HitContext data structure."""
@@ -610,6 +625,41 @@ class TestCombatEngineCalculateSkillUse:
         assert effect_action.stacks_to_add == 2
         assert effect_action.source == "bleed_attack_trigger"
 
+    def test_calculate_skill_use_trigger_plan_follows_trigger_changes(self):
+        """Test the cached trigger plan is rebuilt when a skill's triggers change."""
+        from src.core.skills import Skill, Trigger
+
+        attacker = make_entity("attacker")
+        defender = make_entity("defender")
+        skill = Skill(id="rend", name="rend", triggers=[
+            Trigger(event="OnHit", check={"proc_rate": 1.0}, result={"apply_debuff": "bleed", "stacks": 2})
+        ])
+
+        engine = CombatEngine(rng=make_rng(42))
+        state_manager = StateManager()
+        state_manager.add_entity(attacker)
+        state_manager.add_entity(defender)
+
+        def effect_names():
+            result = engine.calculate_skill_use(attacker, defender, skill, state_manager)
+            return [a.effect_name for a in result.actions if isinstance(a, ApplyEffectAction)]
+
+        assert effect_names() == ["bleed"]
+
+        skill.triggers.append(
+            Trigger(event="OnHit", check={"proc_rate": 1.0}, result={"apply_debuff": "poison"})
+        )
+        assert effect_names() == ["bleed", "poison"]
+
+        # In-place edits and same-length replacements are picked up too
+        skill.triggers[0].result["apply_debuff"] = "rupture"
+        assert effect_names() == ["rupture", "poison"]
+        skill.triggers[1] = Trigger(event="OnHit", check={"proc_rate": 1.0}, result={"apply_debuff": "burn"})
+        assert effect_names() == ["rupture", "burn"]
+
+        skill.triggers = []
+        assert effect_names() == []
+
     def test_calculate_skill_use_detached_from_execution(self):
         """Test that calculate_skill_use performs no side effects."""
 
@@ -641,3 +691,144 @@ class TestCombatEngineCalculateSkillUse:
         # Verify that no side effects occurred - entities' health should be unchanged
         assert state_manager.get_current_health(attacker.id) == attacker_initial_hp
         assert state_manager.get_current_health(defender.id) == defender_initial_hp
+
+
+class TestCombatEngineProcessSkillUsesBatch:
+    """Test the batched what-if entry point for many skill uses."""
+
+    def test_batch_matches_sequential_calculate_skill_use(self):
+        """Test batch damages and crits match per-pair calculate_skill_use calls."""
+        from src.core.skills import Skill
+
+        attackers = [make_entity(f"attacker_{i}", crit_chance=0.5, crit_damage=2.0) for i in range(4)]
+        defenders = [make_entity(f"defender_{i}", armor=20.0 * i) for i in range(4)]
+        skill = Skill(id="flurry", name="flurry", hits=3, damage_multiplier=1.5)
+        state_manager = StateManager()
+        for entity in attackers + defenders:
+            state_manager.add_entity(entity)
+
+        batch = CombatEngine(rng=make_rng(7)).process_skill_uses_batch(
+            attackers, defenders, skill, state_manager
+        )
+        damages, crits = batch.damages, batch.crits
+
+        engine = CombatEngine(rng=make_rng(7))
+        assert damages.shape == crits.shape == (4, 3)
+        assert damages.dtype.name == "float32"
+        for row, (attacker, defender) in enumerate(zip(attackers, defenders)):
+            result = engine.calculate_skill_use(attacker, defender, skill, state_manager)
+            assert damages[row].tolist() == pytest.approx(
+                [hit.final_damage * 1.5 for hit in result.hit_results], rel=1e-6
+            )
+            assert crits[row].tolist() == [hit.was_crit for hit in result.hit_results]
+
+    def test_batch_rejects_mismatched_lengths(self):
+        """Test attackers and defenders must pair up one-to-one."""
+        from src.core.skills import Skill
+
+        engine = CombatEngine(rng=make_rng(42))
+        with pytest.raises(ValueError, match="must pair up"):
+            engine.process_skill_uses_batch(
+                [make_entity("a")], [], Skill(id="s", name="s"), StateManager()
+            )
+
+    def test_batch_hit_views(self):
+        """Test indexing and iterating the batch yields per-hit HitContext views."""
+        from src.core.skills import Skill
+
+        attackers = [make_entity("attacker_0"), make_entity("attacker_1")]
+        defenders = [make_entity("defender_0"), make_entity("defender_1")]
+        state_manager = StateManager()
+        for entity in attackers + defenders:
+            state_manager.add_entity(entity)
+
+        batch = CombatEngine(rng=make_rng(42)).process_skill_uses_batch(
+            attackers, defenders, Skill(id="double", name="double", hits=2), state_manager
+        )
+
+        assert len(batch) == 2
+        view = batch[1, 0]
+        assert isinstance(view, HitContext)
+        assert view.attacker is attackers[1]
+        assert view.defender is defenders[1]
+        assert view.final_damage == float(batch.damages[1, 0])
+        assert view.was_crit == bool(batch.crits[1, 0])
+        assert [hit.final_damage for hit in batch] == batch.damages.ravel().tolist()
+
+
+class TestCombatEngineResolveHitsBatch:
+    """Test the vectorized path used for skills with many hits."""
+
+    def _setup(self, attacker, defender):
+        state_manager = StateManager()
+        state_manager.add_entity(attacker)
+        state_manager.add_entity(defender)
+        return state_manager
+
+    def test_many_hit_skill_is_deterministic_per_seed(self):
+        """Test the batched path gives identical results for the same seed."""
+        from src.core.skills import Skill
+        from src.combat.engine import BATCH_HIT_THRESHOLD
+
+        attacker = make_attacker(crit_chance=0.5, rarity="Legendary")
+        defender = make_defender(evasion_chance=0.3, dodge_chance=0.3, block_chance=0.3, block_amount=5.0)
+        state_manager = self._setup(attacker, defender)
+        skill = Skill(id="barrage", name="barrage", hits=BATCH_HIT_THRESHOLD + 2)
+
+        first = CombatEngine(rng=make_rng(3)).calculate_skill_use(attacker, defender, skill, state_manager)
+        second = CombatEngine(rng=make_rng(3)).calculate_skill_use(attacker, defender, skill, state_manager)
+
+        assert len(first.hit_results) == skill.hits
+        assert [h.to_serializable() for h in first.hit_results] == [h.to_serializable() for h in second.hit_results]
+
+    def test_threshold_switches_to_the_batched_stream(self):
+        """Test hits=7 rolls per hit and hits=8 batches, each deterministically."""
+        from src.core.skills import Skill
+        from src.combat.engine import BATCH_HIT_THRESHOLD
+
+        assert BATCH_HIT_THRESHOLD == 8
+        attacker = make_attacker(crit_chance=0.5, rarity="Legendary")
+        defender = make_defender(evasion_chance=0.3, dodge_chance=0.3, block_chance=0.3, block_amount=5.0)
+        state_manager = self._setup(attacker, defender)
+
+        for hits, batched in ((7, False), (8, True)):
+            skill = Skill(id="barrage", name="barrage", hits=hits)
+            runs = []
+            for _ in range(2):
+                engine = CombatEngine(rng=make_rng(3))
+                with patch.object(engine, '_resolve_hits_batch', wraps=engine._resolve_hits_batch) as batch, \
+                        patch.object(engine.rng, 'random_array', wraps=engine.rng.random_array) as draw:
+                    result = engine.calculate_skill_use(attacker, defender, skill, state_manager)
+                assert batch.called is batched
+                assert draw.called is batched
+                runs.append([h.to_serializable() for h in result.hit_results])
+            assert len(runs[0]) == hits
+            assert runs[0] == runs[1]
+
+    def test_batched_hits_follow_the_damage_pipeline(self):
+        """Test batched hits with no crits or avoidance match the scalar formula."""
+        from src.combat.combat_math import mitigate_hit_damage
+
+        attacker = make_attacker(base_damage=80.0, crit_chance=0.0, pierce_ratio=0.2)
+        defender = make_defender(armor=30.0)
+        state_manager = self._setup(attacker, defender)
+        engine = CombatEngine(rng=make_rng(42))
+
+        chances = engine._gather_hit_chances(attacker, defender, state_manager)
+        hits = engine._resolve_hits_batch(attacker, defender, chances, attacker.get_crit_tier(), 10)
+
+        expected = mitigate_hit_damage(80.0, 80, 30.0, 0.2, attacker.final_stats.crit_damage, 1, False)
+        assert [(h.damage_pre_mitigation, h.damage_post_armor, h.final_damage) for h in hits] == [expected] * 10
+        assert not any(h.was_crit or h.was_dodged or h.was_glancing or h.was_blocked for h in hits)
+
+    def test_guaranteed_dodge_zeroes_every_hit(self):
+        """Test certain dodges produce dodged zero-damage hits."""
+        attacker = make_attacker()
+        defender = make_defender(dodge_chance=1.0)
+        state_manager = self._setup(attacker, defender)
+        engine = CombatEngine(rng=make_rng(42))
+
+        chances = engine._gather_hit_chances(attacker, defender, state_manager)
+        hits = engine._resolve_hits_batch(attacker, defender, chances, attacker.get_crit_tier(), 10)
+
+        assert all(h.was_dodged and h.final_damage == 0 for h in hits)
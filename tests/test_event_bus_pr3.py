@@ -303,6 +303,23 @@ class TestEventBusListenerPriorities:
 
         assert calls == ["third", "second", "first"]
 
+    def test_equal_priority_keeps_subscription_order(self):
+        """Test that listeners sharing a priority run in the order they subscribed."""
+        bus = EventBus()
+        calls = []
+
+        def a(event): calls.append("a")
+        def b(event): calls.append("b")
+        def c(event): calls.append("c")
+
+        bus.subscribe(TestEvent, a, priority=5)
+        bus.subscribe(TestEvent, b, priority=10)
+        bus.subscribe(TestEvent, c, priority=5)
+
+        bus.dispatch(TestEvent())
+
+        assert calls == ["b", "a", "c"]
+
     def test_unsubscribe_preserves_priority_ordering(self):
         """Test that unsubscribing maintains priority ordering for remaining listeners."""
         bus = EventBus()
@@ -341,6 +358,22 @@ class TestEventBusProfiling:
         # Stats should be mostly empty since profiling is disabled
         assert stats == {'_failures': {}, '_total_events_dispatched': 0}
 
+    def test_profiling_keeps_bounded_timing_history(self):
+        """Test long profiled runs keep totals exact but only a window of timings."""
+        from src.core.events import PROFILING_WINDOW
+
+        bus = EventBus()
+        bus.enable_profiling(True)
+        bus.subscribe(TestEvent, lambda event: None)
+
+        for _ in range(PROFILING_WINDOW + 10):
+            bus.dispatch(TestEvent())
+
+        stats = bus.get_profiling_stats()['TestEvent']
+        assert stats['total_dispatches'] == PROFILING_WINDOW + 10
+        assert stats['max_dispatch_time_ms'] >= stats['avg_dispatch_time_ms']
+        assert len(bus._dispatch_times[TestEvent].recent) == PROFILING_WINDOW
+
     def test_profiling_enabled_collects_basic_stats(self):
         """Test enabling profiling collects dispatch counts."""
         bus = EventBus()
@@ -362,6 +395,23 @@ class TestEventBusProfiling:
         assert isinstance(event_stats['max_dispatch_time_ms'], float)
         assert stats['_total_events_dispatched'] == 2
 
+    def test_profiled_dispatch_warns_only_on_failures(self, caplog):
+        """Test the dispatch summary is a warning when listeners fail and silent otherwise."""
+        caplog.set_level(logging.INFO, logger="src.core.events")
+        bus = EventBus()
+        bus.enable_profiling(True)
+
+        bus.subscribe(TestEvent, lambda event: None)
+        bus.dispatch(TestEvent())
+        assert not [r for r in caplog.records if r.getMessage().startswith("Dispatched")]
+
+        def bad_listener(event): raise RuntimeError("test")
+        bus.subscribe(TestEvent, bad_listener)
+        bus.dispatch(TestEvent())
+        summaries = [r for r in caplog.records if r.getMessage().startswith("Dispatched")]
+        assert len(summaries) == 1
+        assert summaries[0].levelno == logging.WARNING
+
     def test_profiling_collects_failure_stats(self):
         """Test profiling collects failure counts."""
         bus = EventBus()
@@ -500,6 +550,60 @@ class TestEventBusUtilityMethods:
         cleared_stats = bus.get_profiling_stats()
         assert cleared_stats == {'_failures': {}, '_total_events_dispatched': 0}
 
+    def test_debug_messages_not_formatted_when_debug_disabled(self, caplog):
+        """Test that listener names are not stringified unless debug logging is on."""
+        caplog.set_level(logging.INFO, logger="src.core.events")
+        bus = EventBus()
+
+        class CountingListener:
+            str_calls = 0
+
+            def __call__(self, event):
+                pass
+
+            def __str__(self):
+                CountingListener.str_calls += 1
+                return "counting"
+
+        listener = CountingListener()
+        bus.subscribe(TestEvent, listener)
+        bus.unsubscribe(TestEvent, listener)
+        bus.unsubscribe(TestEvent, listener)
+        assert CountingListener.str_calls == 0
+
+        caplog.set_level(logging.DEBUG, logger="src.core.events")
+        bus.subscribe(TestEvent, listener)
+        assert CountingListener.str_calls == 1
+
+    def test_single_listener_shortcut_follows_subscriptions(self, caplog):
+        """Test the one-listener fast path isolates errors and sees new listeners."""
+        bus = EventBus()
+        calls = []
+
+        def failing(event):
+            calls.append("failing")
+            raise RuntimeError("boom")
+
+        bus.subscribe(TestEvent, failing)
+        bus.dispatch(TestEvent())  # Failure is logged, not raised
+        bus.subscribe(TestEvent, lambda event: calls.append("second"))
+        bus.dispatch(TestEvent())
+
+        assert calls == ["failing", "failing", "second"]
+        assert "boom" in caplog.text
+
+    def test_clear_drops_cached_listeners(self):
+        """Test that listeners cached by an earlier dispatch are gone after clear()."""
+        bus = EventBus()
+        calls = []
+
+        bus.subscribe(TestEvent, calls.append)
+        bus.dispatch(TestEvent())
+        bus.clear()
+        bus.dispatch(TestEvent())
+
+        assert len(calls) == 1
+
     def test_multiple_event_types_independence(self):
         """Test that operations on one event type don't affect others."""
         bus = EventBus()
@@ -46,6 +46,17 @@ class TestEventClasses:
         assert crit_event.hit_event == hit_event
         assert crit_event.hit_event.is_crit is True
 
+    def test_events_are_slotted(self):
+        """Test that events carry no per-instance __dict__ but stay mutable."""
+        attacker = Entity("attacker", EntityStats())
+        defender = Entity("defender", EntityStats())
+
+        event = OnHitEvent(attacker=attacker, defender=defender, damage_dealt=10.0)
+
+        assert not hasattr(event, "__dict__")
+        event.damage_dealt = 5.0
+        assert event.damage_dealt == 5.0
+
 
 class TestEventBus:
     """Test the EventBus functionality."""
@@ -158,6 +169,18 @@ class TestEventBus:
         assert listener1_calls[0] == event
         assert listener2_calls[0] == event
 
+    def test_has_listeners(self):
+        """Test that has_listeners reflects subscriptions per event type."""
+        bus = EventBus()
+        listener = lambda event: None
+
+        assert bus.has_listeners(OnHitEvent) is False
+        bus.subscribe(OnHitEvent, listener)
+        assert bus.has_listeners(OnHitEvent) is True
+        assert bus.has_listeners(OnCritEvent) is False
+        bus.unsubscribe(OnHitEvent, listener)
+        assert bus.has_listeners(OnHitEvent) is False
+
     def test_dispatch_with_no_listeners(self):
         """Test that dispatching an event with no listeners doesn't cause errors."""
         bus = EventBus()
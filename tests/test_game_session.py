@@ -29,6 +29,14 @@ class TestGameSession:
         assert session.state == GameState.LOBBY
         assert session.current_stage == 0
 
+    def test_combat_log_keeps_last_ten_reports(self, mock_provider):
+        session = GameSession(mock_provider)
+
+        for fight in range(12):
+            session.combat_log.append({"fight": fight})
+
+        assert [report["fight"] for report in session.combat_log] == list(range(2, 12))
+
     def test_start_new_run(self, mock_provider):
         session = GameSession(mock_provider)
 
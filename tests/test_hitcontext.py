@@ -109,6 +109,19 @@ class TestHitContextBasics:
         assert "attacker" not in serializable
         assert "defender" not in serializable
 
+    def test_reset_matches_fresh_construction(self, attacker, defender):
+        """Test reset() restores every field a new HitContext would have."""
+        ctx = HitContext(attacker=defender, defender=attacker, base_raw=5, base_resolved=5, final_damage=5.0,
+                         was_crit=True, was_dodged=True, was_blocked=True, was_glancing=True,
+                         crit_multiplier=2.0, damage_pre_mitigation=9.0, damage_post_armor=8.0,
+                         damage_blocked=7.0, simulation_id=3, batch_id="b")
+
+        recycled = ctx.reset(attacker, defender, 100, 100, 100.0)
+
+        assert recycled is ctx
+        assert recycled == HitContext(attacker=attacker, defender=defender, base_raw=100,
+                                      base_resolved=100, final_damage=100.0)
+
 
 class TestHitContextCombatEngineIntegration:
     """Test HitContext populated by CombatEngine."""
@@ -247,6 +260,34 @@ class TestHitContextSerialization:
         except (TypeError, ValueError):
             pytest.fail("Serialization should produce valid JSON")
 
+    def test_batch_serialize_matches_per_hit_serialization(self):
+        """Columnar output holds the same values as to_serializable per hit."""
+        import numpy as np
+
+        attacker = make_attacker()
+        defender = make_defender()
+        contexts = [
+            HitContext(attacker=attacker, defender=defender, base_raw=100, base_resolved=100,
+                       final_damage=75.5, was_crit=True, damage_blocked=10.0, batch_id="b1"),
+            HitContext(attacker=attacker, defender=defender, base_raw=80, base_resolved=80,
+                       final_damage=0.0, was_dodged=True, simulation_id=3),
+        ]
+
+        columns = HitContext.batch_serialize(contexts)
+
+        assert set(columns) == set(contexts[0].to_serializable())
+        assert columns["final_damage"].dtype == np.float32
+        assert columns["was_crit"].dtype == np.bool_
+        for row, ctx in enumerate(contexts):
+            for name, value in ctx.to_serializable().items():
+                assert columns[name][row] == pytest.approx(value)
+
+    def test_batch_serialize_empty(self):
+        """An empty batch yields empty columns."""
+        columns = HitContext.batch_serialize([])
+        assert len(columns["final_damage"]) == 0
+        assert columns["attacker_id"] == []
+
 
 class TestHitContextBackwardCompatibility:
     """Test that HitContext doesn't break existing consumers."""
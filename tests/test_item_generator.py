@@ -68,6 +68,15 @@ class TestItemGenerator(unittest.TestCase):
         pool = self.gen._get_affix_pool([])
         self.assertEqual(pool, [])
 
+    def test_get_affix_pool_matches_definition_order(self):
+        """Pool lookups keep affix_defs order without duplicates."""
+        pools = ['weapon_pool', 'axe_pool']
+        expected = [
+            affix_id for affix_id, affix in self.gen.affix_defs.items()
+            if affix.pool_set & set(pools)
+        ]
+        self.assertEqual(self.gen._get_affix_pool(pools), expected)
+
     def test_roll_one_affix_full_quality(self):
         """Test rolling affix with 100% max quality."""
         RNG(42)
@@ -109,6 +118,41 @@ class TestItemGenerator(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.gen.generate('nonexistent_item')
 
+    def test_generate_batch_matches_template(self):
+        """Batch items follow the template and keep rolls in range."""
+        template = self.gen.item_templates['base_iron_axe']
+        items = self.gen.generate_batch('base_iron_axe', 50)
+
+        self.assertEqual(len(items), 50)
+        self.assertEqual(len({item.instance_id for item in items}), 50)
+        for item in items:
+            self.assertEqual(item.base_id, 'base_iron_axe')
+            self.assertEqual(item.rarity, 'Rare')
+            affix_ids = [affix.affix_id for affix in item.affixes]
+            self.assertEqual(len(affix_ids), len(set(affix_ids)))
+            self.assertEqual(affix_ids[:len(template.implicit_affixes)],
+                             list(template.implicit_affixes))
+            for affix in item.affixes:
+                bases = self.gen.affix_defs[affix.affix_id].rolled_bases
+                self.assertLessEqual(abs(affix.value),
+                                     abs(bases[0]) * item.quality_roll / 100.0 + 1e-9)
+
+    def test_generate_batch_deterministic_with_seed(self):
+        """The same seed yields the same batch of rolls."""
+        def roll_summary(seed):
+            self.gen.rng = RNG(seed)
+            return [
+                (item.quality_tier, item.quality_roll,
+                 [(affix.affix_id, affix.value) for affix in item.affixes])
+                for item in self.gen.generate_batch('base_iron_axe', 10)
+            ]
+
+        self.assertEqual(roll_summary(7), roll_summary(7))
+
+    def test_generate_batch_empty(self):
+        """Requesting no items returns an empty list."""
+        self.assertEqual(self.gen.generate_batch('base_iron_axe', 0), [])
+
     def test_roll_dual_stat_affix(self):
         """Test rolling an affix with two values (primary and dual)."""
         # Create a mocked AffixDefinition object
@@ -28,6 +28,7 @@ class TestLootValidation:
 
         # Mock items dict to have references (not going through hydration to avoid extra fields)
         provider.items = {"dagger": MagicMock()}
+        provider.entities = {}
         provider._hydrate_data(raw_data)  # This will add loot_tables, but not override items
 
         with pytest.raises(DataValidationError) as exc:
@@ -56,7 +57,7 @@ class TestLootValidation:
         provider.skills = {}
         provider.affix_pools = {}
         provider.items = {}  # Initialize items dict properly
-        provider.loot_tables = []
+        provider.loot_tables = {}
         provider.entities = {}
 
         # Hydrate & Validate - this will set items correctly
@@ -85,6 +86,7 @@ class TestLootValidation:
         provider.affix_pools = {}
 
         provider.items = {} # Empty items dict
+        provider.entities = {}
 
         provider._hydrate_data(raw_data)
 
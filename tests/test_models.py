@@ -232,6 +232,17 @@ class TestItemSystem:
         assert item.name == "Rusty Sword"
         assert len(item.affixes) == 1
 
+    def test_models_are_slotted(self):
+        """Bulk-allocated models carry no per-instance __dict__."""
+        affix = RolledAffix("affix1", "base_damage", "flat", "damage", "+10 Damage", 10.0, 10.0)
+        item = Item("item_001", "sword_basic", "Rusty Sword", "weapon", "Common", "Normal", 1, [affix])
+        entity = make_entity("slotted")
+
+        for obj in (affix, item, entity, entity.base_stats):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            entity.not_a_field = 1
+
 
 # Rarity mapping tests
 class TestRarityMapping:
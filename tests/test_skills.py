@@ -45,6 +45,80 @@ class TestSkillSystem:
         defender_state = state_manager.get_state(defender.id)
         assert defender_state.current_health == 1000.0 - 150.0  # 850.0
 
+    def test_roll_chances_gathered_once_per_skill_use(self):
+        """Test that roll chances are hoisted out of the hit loop until modifiers change."""
+        from unittest.mock import patch
+
+        attacker = make_attacker(base_damage=50.0)
+        defender = make_defender(armor=0.0, max_health=1000.0)
+        event_bus = EventBus()
+        state_manager = StateManager()
+        state_manager.register_entity(attacker)
+        state_manager.register_entity(defender)
+        engine = CombatEngine(rng=make_rng(1))
+        skill = Skill(id="test_skill", name="Test Multi-Hit", hits=3, triggers=[])
+
+        with patch.object(engine, '_gather_hit_chances', wraps=engine._gather_hit_chances) as gather:
+            engine.process_skill_use(attacker, defender, skill, event_bus, state_manager)
+        assert gather.call_count == 1
+
+        # A crit bonus from a trigger result changes roll modifiers, so the
+        # following hits must see the refreshed chances
+        attacker.active_triggers.append(
+            Trigger(event="OnSkillUsed", check={"proc_rate": 1.0}, result={"apply_crit_bonus": 0.1})
+        )
+        skill = Skill(id="test_skill_2", name="Test Multi-Hit 2", hits=3, triggers=[])
+        with patch.object(engine, '_gather_hit_chances', wraps=engine._gather_hit_chances) as gather:
+            engine.process_skill_use(attacker, defender, skill, event_bus, state_manager)
+        assert gather.call_count == 3
+
+    def test_crit_events_dispatched_without_hit_listeners(self):
+        """Test that skipping unobserved OnHitEvents still delivers crit events."""
+        from src.core.events import OnCritEvent
+
+        attacker = make_attacker(base_damage=50.0, crit_chance=1.0)
+        defender = make_defender(armor=0.0, max_health=1000.0)
+        event_bus = EventBus()
+        state_manager = StateManager()
+        state_manager.register_entity(attacker)
+        state_manager.register_entity(defender)
+        engine = CombatEngine(rng=make_rng(1))
+        skill = Skill(id="test_skill", name="Test Multi-Hit", hits=3, triggers=[])
+
+        crits = []
+        event_bus.subscribe(OnCritEvent, crits.append)
+        engine.process_skill_use(attacker, defender, skill, event_bus, state_manager)
+
+        assert len(crits) == 3
+        assert all(event.hit_event.is_crit for event in crits)
+
+    def test_roll_modifier_added_mid_skill_applies_to_later_hits(self):
+        """Test that a listener adding a roll modifier refreshes the hoisted chances."""
+        from src.core.events import OnHitEvent, OnCritEvent
+        from src.core.state import Modifier
+
+        attacker = make_attacker(base_damage=50.0, crit_chance=0.0)
+        defender = make_defender(armor=0.0, max_health=10000.0)
+        event_bus = EventBus()
+        state_manager = StateManager()
+        state_manager.register_entity(attacker)
+        state_manager.register_entity(defender)
+        engine = CombatEngine(rng=make_rng(1))
+        skill = Skill(id="test_skill", name="Test Multi-Hit", hits=4, triggers=[])
+
+        def grant_crit_once(event):
+            if not state_manager.get_state(attacker.id).roll_modifiers:
+                state_manager.add_roll_modifier(attacker.id, 'crit_chance',
+                                                Modifier(value=1.0, duration=5.0))
+
+        crits = []
+        event_bus.subscribe(OnHitEvent, grant_crit_once)
+        event_bus.subscribe(OnCritEvent, crits.append)
+        engine.process_skill_use(attacker, defender, skill, event_bus, state_manager)
+
+        # The first hit rolls at 0% crit; every later hit sees the +100% modifier
+        assert len(crits) == 3
+
     def test_multi_hit_skill_with_triggers_deterministic(self):
         """Test multi-hit skill with triggers using deterministic RNG."""
         # Create entities
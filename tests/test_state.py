@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import MagicMock
 from src.core.models import Entity, EntityStats, EffectInstance
-from src.core.state import StateManager, EntityState
+from src.core.state import StateManager, EntityState, Modifier
 
 
 @pytest.fixture
@@ -33,6 +33,39 @@ class TestEntityState:
         state = EntityState(entity=entity,current_health=0.0, is_alive=True)
         assert state.is_alive is False
 
+    def test_roll_modifier_sum_tracks_adds_and_removes(self, entity):
+        """Test the cached roll modifier total follows the modifier list."""
+        state = EntityState(entity=entity, current_health=100.0)
+        first = Modifier(value=0.1, duration=5.0)
+        second = Modifier(value=0.25, duration=5.0)
+
+        state.add_roll_modifier('crit_chance', first)
+        state.add_roll_modifier('crit_chance', second)
+        assert state.roll_modifier_sums['crit_chance'] == pytest.approx(0.35)
+
+        assert state.remove_roll_modifier('crit_chance', first) is True
+        assert state.roll_modifier_sums['crit_chance'] == pytest.approx(0.25)
+
+        assert state.remove_roll_modifier('crit_chance', second) is True
+        assert 'crit_chance' not in state.roll_modifiers
+        assert 'crit_chance' not in state.roll_modifier_sums
+        assert state.remove_roll_modifier('crit_chance', second) is False
+
+    def test_roll_modifiers_cannot_be_written_directly(self, entity):
+        """Test direct writes fail, so the cached total cannot desync."""
+        state = EntityState(entity=entity, current_health=100.0)
+        state.add_roll_modifier('crit_chance', Modifier(value=0.1, duration=5.0))
+
+        with pytest.raises(AttributeError):
+            state.roll_modifiers['crit_chance'].append(Modifier(value=0.5, duration=5.0))
+        with pytest.raises(TypeError):
+            state.roll_modifiers['dodge_chance'] = (Modifier(value=0.5, duration=5.0),)
+        with pytest.raises(TypeError):
+            state.roll_modifier_sums['crit_chance'] = 1.0
+
+        assert len(state.roll_modifiers['crit_chance']) == 1
+        assert state.roll_modifier_sums == {'crit_chance': pytest.approx(0.1)}
+
 
 class TestStateManager:
     
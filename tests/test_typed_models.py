@@ -8,7 +8,11 @@ from src.data.typed_models import (
     Rarity, 
     EffectType, 
     DataValidationError,
-    validate_entity_stats_are_valid
+    validate_entity_stats_are_valid,
+    hydrate_affix_definition,
+    intern_str,
+    parse_affix_pools,
+    parse_rolled_bases
 )
 from src.core.models import EntityStats
 
@@ -89,4 +93,79 @@ class TestValidationHelpers:
             validate_entity_stats_are_valid(invalid_stats)
         
         assert "Invalid stat name 'fake_stat'" in str(excinfo.value)
-        assert excinfo.value.data_type == "EntityStats"
\ No newline at end of file
+        assert excinfo.value.data_type == "EntityStats"
+
+class TestStringInterning:
+    """Test interning of repeated string fields during hydration."""
+
+    def test_intern_str_passes_through_non_strings(self):
+        """Non-string values are returned unchanged."""
+        assert intern_str(None) is None
+        assert intern_str(1.5) == 1.5
+
+    def test_hydrated_affixes_share_stat_strings(self):
+        """Equal stat_affected values from separate rows are the same object."""
+        def raw(affix_id):
+            # Build the string at runtime so it is not a compile-time constant
+            return {
+                'affix_id': affix_id,
+                'stat_affected': ''.join(['base_', 'damage']),
+                'mod_type': ''.join(['fl', 'at']),
+                'base_value': 1.0,
+                'description': 'test',
+            }
+
+        first = hydrate_affix_definition(raw('a1'))
+        second = hydrate_affix_definition(raw('a2'))
+        assert first.stat_affected is second.stat_affected
+        assert first.mod_type is second.mod_type
+
+    def test_parsed_pool_names_are_interned(self):
+        """Pool names parsed from separate rows are the same object."""
+        first = parse_affix_pools('|'.join(['wea' + 'pon', 'ring']))
+        second = parse_affix_pools(['wea' + ''.join('pon')])
+        assert first[0] is second[0]
+
+
+class TestAffixPoolSet:
+    """Test the precomputed affix pool membership set."""
+
+    def test_pool_set_built_from_pipe_separated_pools(self):
+        """Hydrated affixes expose their pools as a frozenset."""
+        affix = hydrate_affix_definition({
+            'affix_id': 'a1',
+            'stat_affected': 'base_damage',
+            'mod_type': 'flat',
+            'base_value': 1.0,
+            'description': 'test',
+            'affix_pools': 'weapon|ring',
+        })
+        assert affix.pool_set == frozenset({'weapon', 'ring'})
+        assert 'weapon' in affix.pool_set
+        assert 'armor' not in affix.pool_set
+
+
+class TestRolledBases:
+    """Test the base values pre-parsed for affix rolling."""
+
+    @pytest.mark.parametrize("base_value,expected", [
+        (2.5, (2.5,)),
+        ("10", (10.0,)),
+        ("100.0;0.5", (100.0, 0.5)),
+        ("a;b", (0.0, 0.0)),
+        ("n/a", (0.0,)),
+    ])
+    def test_parse_rolled_bases(self, base_value, expected):
+        assert parse_rolled_bases(base_value) == expected
+
+    def test_hydrated_affix_exposes_rolled_bases(self):
+        """Dual-stat affixes carry both bases after hydration."""
+        affix = hydrate_affix_definition({
+            'affix_id': 'dual',
+            'stat_affected': 'base_damage;crit_chance',
+            'mod_type': 'flat;multiplier',
+            'base_value': '100.0;0.5',
+            'description': 'test',
+            'dual_stat': 'TRUE',
+        })
+        assert affix.rolled_bases == (100.0, 0.5)
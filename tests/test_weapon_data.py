@@ -27,7 +27,7 @@ class TestWeaponData:
         provider.items = {}
         provider.quality_tiers = []
         provider.effects = {}
-        provider.loot_tables = []
+        provider.loot_tables = {}
         provider.entities = {}
 
         provider._hydrate_data(raw_data)
@@ -58,7 +58,7 @@ class TestWeaponData:
         provider.items = {}
         provider.quality_tiers = []
         provider.effects = {}
-        provider.loot_tables = []
+        provider.loot_tables = {}
         provider.entities = {}
 
         provider._hydrate_data(raw_data)
@@ -89,7 +89,7 @@ class TestWeaponData:
         provider.items = {}
         provider.quality_tiers = []
         provider.effects = {}
-        provider.loot_tables = []
+        provider.loot_tables = {}
         provider.entities = {}
 
         provider._hydrate_data(raw_data)